@@ -2,9 +2,54 @@
 # Cache
 # --------------------------------------------------------------------
 
-# type (REDIS | STUB)
+# type (MEMORY | REDIS | REDIS_CLUSTER | STUB) - MEMORY state is process local, i.e. for tests, benchmarks & single process lab runs
 export STESTS_CACHE_TYPE=REDIS
 
+# collection storage mode (KEYS | HASH) - items of collections stored as hashes cannot expire
+export STESTS_CACHE_COLLECTION_MODE=KEYS
+
+# value codec (JSON | COMPACT)
+export STESTS_CACHE_CODEC=JSON
+
+# value codec -> size (bytes) above which COMPACT values are zlib compressed
+export STESTS_CACHE_CODEC_ZLIB_THRESHOLD=1024
+
+# per operation instrumentation (0 = off | 1 = on)
+export STESTS_CACHE_STATS_ENABLED=0
+
+# per operation instrumentation -> interval (seconds) at which worker statistics are published
+export STESTS_CACHE_STATS_PUBLISH_INTERVAL=10
+
+# hot counters (run & phase deploy counts) -> number of shards, 1 = unsharded - must be identical for all workers & tools
+export STESTS_CACHE_COUNTER_SHARDS=1
+
+# collection streaming -> number of items fetched per round trip
+export STESTS_CACHE_STREAM_CHUNK_SIZE=1000
+
+# process local cache of infra reads -> max. items
+export STESTS_CACHE_LOCAL_MAX_ITEMS=1024
+
+# process local cache of infra reads -> time to live (seconds), 0 = disabled
+export STESTS_CACHE_LOCAL_TTL=60
+
+# --------------------------------------------------------------------
+# Cache: retention
+# --------------------------------------------------------------------
+
+# Cache -> retention -> max. completed runs (per network & run type) whose detail is retained, 0 = unlimited
+export STESTS_CACHE_RETENTION_MAX_RUNS=0
+
+# Cache -> retention -> max. memory (bytes) of store hosting STATE partition before completed runs are evicted, 0 = unlimited
+export STESTS_CACHE_RETENTION_MAX_MEMORY=0
+
+# Cache -> retention -> time (seconds) after completion for which a run's detail is retained, 0 = indefinitely
+export STESTS_CACHE_RETENTION_RUN_TTL=0
+
+# Cache -> retention -> per collection item time to live (seconds), 0 = never expire
+export STESTS_CACHE_RETENTION_TTL_ORCHESTRATION_CONTEXT=3600
+export STESTS_CACHE_RETENTION_TTL_ORCHESTRATION_INFO=3600
+export STESTS_CACHE_RETENTION_TTL_ORCHESTRATION_LOCK=3600
+
 # --------------------------------------------------------------------
 # Cache: REDIS
 # --------------------------------------------------------------------
@@ -15,9 +60,37 @@ export STESTS_CACHE_REDIS_DB=1
 # Cache -> REDIS -> host
 export STESTS_CACHE_REDIS_HOST=localhost
 
+# Cache -> REDIS -> pooled connection health check interval (seconds)
+export STESTS_CACHE_REDIS_HEALTH_CHECK_INTERVAL=30
+
+# Cache -> REDIS -> max. pooled connections per partition per worker process
+export STESTS_CACHE_REDIS_MAX_CONNECTIONS=16
+
 # Cache -> REDIS -> port
 export STESTS_CACHE_REDIS_PORT=6379
 
+# Cache -> REDIS -> read replica host - serves reads issued by view commands, empty = primary
+export STESTS_CACHE_REDIS_REPLICA_HOST=
+
+# Cache -> REDIS -> read replica port
+export STESTS_CACHE_REDIS_REPLICA_PORT=6379
+
+# --------------------------------------------------------------------
+# Cache: REDIS_CLUSTER
+# --------------------------------------------------------------------
+
+# Cache -> REDIS_CLUSTER -> seed node host
+export STESTS_CACHE_REDIS_CLUSTER_HOST=localhost
+
+# Cache -> REDIS_CLUSTER -> max. pooled connections per cluster node per worker process
+export STESTS_CACHE_REDIS_CLUSTER_MAX_CONNECTIONS=16
+
+# Cache -> REDIS_CLUSTER -> seed node port
+export STESTS_CACHE_REDIS_CLUSTER_PORT=7000
+
+# Cache -> REDIS_CLUSTER -> serve reads issued by view commands from replica nodes (0 = off | 1 = on)
+export STESTS_CACHE_REDIS_CLUSTER_READ_FROM_REPLICAS=0
+
 # --------------------------------------------------------------------
 # Broker
 # --------------------------------------------------------------------
@@ -25,6 +98,27 @@ export STESTS_CACHE_REDIS_PORT=6379
 # type (REDIS | RABBIT | STUB)
 export STESTS_BROKER_TYPE=REDIS
 
+# message codec (JSON | COMPACT) - workers decode either, switch to COMPACT once all workers are upgraded
+export STESTS_MQ_CODEC=JSON
+
+# message codec -> size (bytes) above which COMPACT messages are zlib compressed
+export STESTS_MQ_CODEC_ZLIB_THRESHOLD=1024
+
+# message groups -> max. messages enqueued per broker round trip
+export STESTS_MQ_ENQUEUE_BATCH_SIZE=1000
+
+# message groups -> granularity (milliseconds) at which delays within a dispatch window are bucketed, 0 = unbucketed
+export STESTS_MQ_ENQUEUE_DELAY_BUCKET_MS=100
+
+# queue priorities (lower = processed first) -> monitoring queues
+export STESTS_MQ_PRIORITY_MONITORING=0
+
+# queue priorities (lower = processed first) -> orchestration engine queues
+export STESTS_MQ_PRIORITY_ORCHESTRATION=10
+
+# queue priorities (lower = processed first) -> deploy dispatch queues
+export STESTS_MQ_PRIORITY_DISPATCH=20
+
 # --------------------------------------------------------------------
 # Broker: REDIS
 # --------------------------------------------------------------------
@@ -66,6 +160,48 @@ export STESTS_BROKER_RABBIT_USER_PWD=clabs
 # Broker -> RABBIT -> virtual host
 export STESTS_BROKER_RABBIT_VHOST=CLABS
 
+# --------------------------------------------------------------------
+# Orchestration
+# --------------------------------------------------------------------
+
+# pass execution context by reference in per deploy messages (0 = off | 1 = on) - enable once all workers are upgraded
+# whilst on, execution contexts expire STESTS_ORCHESTRATION_CONTEXT_BY_REFERENCE_TTL seconds after a phase or step last started
+export STESTS_ORCHESTRATION_CONTEXT_BY_REFERENCE=0
+
+# execution context references -> time (in seconds) for which contexts are retained, must exceed the longest step (default = 1 day)
+export STESTS_ORCHESTRATION_CONTEXT_BY_REFERENCE_TTL=86400
+
+# execution context references -> max. rehydrated contexts held in process local cache
+export STESTS_ORCHESTRATION_CONTEXT_MAX_ITEMS=64
+
+# deploy dispatch pacing (WINDOW = random delay within dispatch window | TOKEN_BUCKET = token bucket shared by all workers)
+export STESTS_ORCHESTRATION_DISPATCH_PACING=WINDOW
+
+# token bucket pacing -> max. deploys dispatched in a burst
+export STESTS_ORCHESTRATION_DISPATCH_BURST=1
+
+# --------------------------------------------------------------------
+# Workers
+# --------------------------------------------------------------------
+
+# monitoring pool -> worker processes (see docs/workers.md for sizing)
+export STESTS_WORKERS_MONITORING_PROCESSES=1
+
+# monitoring pool -> threads per worker process, must exceed number of monitored nodes
+export STESTS_WORKERS_MONITORING_THREADS=16
+
+# orchestration engine pool -> worker processes
+export STESTS_WORKERS_ORCHESTRATION_PROCESSES=1
+
+# orchestration engine pool -> threads per worker process
+export STESTS_WORKERS_ORCHESTRATION_THREADS=4
+
+# deploy dispatch pool -> worker processes
+export STESTS_WORKERS_DISPATCH_PROCESSES=3
+
+# deploy dispatch pool -> threads per worker process
+export STESTS_WORKERS_DISPATCH_THREADS=8
+
 # --------------------------------------------------------------------
 # Logging
 # --------------------------------------------------------------------
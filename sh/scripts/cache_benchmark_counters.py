@@ -0,0 +1,171 @@
+import argparse
+import statistics
+import threading
+import time
+
+from beautifultable import BeautifulTable
+
+from stests.core import cache
+from stests.core import factory
+from stests.core.cache import stores
+from stests.core.cache.ops.utils import EnvVars
+from stests.core.types.orchestration import ExecutionAspect
+from stests.core.utils import cli as utils
+
+
+
+# CLI argument parser.
+ARGS = argparse.ArgumentParser("Displays throughput & contention of concurrent increments of a run's deploy count - unsharded versus sharded.")
+
+# CLI argument: number of increments per worker.
+ARGS.add_argument(
+    "--increments",
+    default=1000,
+    dest="increments",
+    help="Number of increments issued by each worker.",
+    type=int,
+    )
+
+# CLI argument: number of counter shards.
+ARGS.add_argument(
+    "--shards",
+    default=8,
+    dest="shards",
+    help="Number of shards over which the sharded counter is spread.",
+    type=int,
+    )
+
+# CLI argument: number of concurrent workers.
+ARGS.add_argument(
+    "--workers",
+    default=8,
+    dest="workers",
+    help="Number of workers (threads) concurrently incrementing the counter.",
+    type=int,
+    )
+
+
+# Table columns.
+COLS = [
+    ("Shards", BeautifulTable.ALIGN_RIGHT),
+    ("Increments", BeautifulTable.ALIGN_RIGHT),
+    ("Ops / Sec", BeautifulTable.ALIGN_RIGHT),
+    ("p50 (us)", BeautifulTable.ALIGN_RIGHT),
+    ("p99 (us)", BeautifulTable.ALIGN_RIGHT),
+    ("Hottest Key (%)", BeautifulTable.ALIGN_RIGHT),
+    ("Tally", BeautifulTable.ALIGN_LEFT),
+]
+
+# Index of scratch run whose counters are incremented - deleted once measured.
+_RUN_INDEX = 999
+
+
+def main(args):
+    """Entry point.
+
+    :param args: Parsed CLI arguments.
+
+    """
+    # Measure.
+    data = []
+    for shards in sorted({1, args.shards}):
+        EnvVars.COUNTER_SHARDS = shards
+        data.append(_measure(args, shards))
+
+    # Set table.
+    cols = [i for i, _ in COLS]
+    rows = map(lambda i: [
+        i[0],
+        i[1],
+        format(i[2], '.0f'),
+        format(i[3], '.1f'),
+        format(i[4], '.1f'),
+        format(i[5], '.1f'),
+        "OK" if i[6] else "MISMATCH",
+    ], data)
+    t = utils.get_table(cols, rows)
+    for key, aligmnent in COLS:
+        t.column_alignments[key] = aligmnent
+
+    # Render.
+    print(t)
+    print(f"Workers: {args.workers} - increments / worker = {args.increments} - cache type = {stores.EnvVars.TYPE}")
+
+
+def _get_shard_counts(ctx) -> list:
+    """Returns counts held by each shard of a run's deploy count.
+
+    """
+    item_key = cache.orchestration.get_deploy_count.__wrapped__(ctx, ExecutionAspect.RUN)
+    item_key.apply_key_prefix()
+    namespace = stores.get_key_namespace(cache.orchestration._PARTITION)
+    if namespace is not None:
+        item_key.apply_key_hash_tag(namespace)
+
+    with stores.get_store(cache.orchestration._PARTITION) as store:
+        return [0 if i is None else int(i) for i in store.mget(item_key.shard_keys)]
+
+
+def _measure(args, shards: int):
+    """Measures concurrent increments of a scratch run's deploy count.
+
+    """
+    network_id = factory.create_network_id("lrt1")
+    ctx = factory.create_execution_context(
+        args=None,
+        prune_on_completion=True,
+        deploys_per_second=0,
+        key_algorithm="ED25519",
+        loop_count=0,
+        loop_interval_ms=0,
+        execution_mode="sequential",
+        network_id=network_id,
+        node_id=factory.create_node_id(network_id, 1),
+        run_index=_RUN_INDEX,
+        run_type="WG-100",
+        )
+    cache.orchestration.prune_on_run_eviction(ctx)
+
+    # Each worker records latency of each of it's increments.
+    latencies = []
+    barrier = threading.Barrier(args.workers + 1)
+    def _increment():
+        timings = []
+        barrier.wait()
+        for _ in range(args.increments):
+            ts = time.perf_counter()
+            cache.orchestration.increment_deploy_count(ctx, ExecutionAspect.RUN)
+            timings.append(time.perf_counter() - ts)
+        latencies.extend(timings)
+
+    workers = [threading.Thread(target=_increment) for _ in range(args.workers)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    ts_start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - ts_start
+
+    # Tally shards prior to discarding scratch run.
+    expected = args.workers * args.increments
+    counts = _get_shard_counts(ctx)
+    is_tallied = cache.orchestration.get_deploy_count(ctx, ExecutionAspect.RUN) == sum(counts) == expected
+    cache.orchestration.prune_on_run_eviction(ctx)
+
+    quantiles = statistics.quantiles(latencies, n=100)
+
+    return (
+        shards,
+        expected,
+        expected / elapsed,
+        quantiles[49] * 1e6,
+        quantiles[98] * 1e6,
+        (max(counts) / expected) * 100,
+        is_tallied,
+    )
+
+
+# Entry point.
+if __name__ == '__main__':
+    main(ARGS.parse_args())
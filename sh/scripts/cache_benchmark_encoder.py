@@ -0,0 +1,173 @@
+import argparse
+import json
+import sys
+import timeit
+
+from beautifultable import BeautifulTable
+
+from stests.core import factory
+from stests.core.types.chain import AccountType
+from stests.core.types.chain import DeployType
+from stests.core.types.infra import NodeGroup
+from stests.core.types.infra import NodeType
+from stests.core.utils import cli as utils
+from stests.core.utils import encoder
+
+
+
+# CLI argument parser.
+ARGS = argparse.ArgumentParser("Displays per object cost of encoding & decoding domain objects as applied to every broker message & cache read/write.")
+
+# CLI argument: number of iterations per measurement.
+ARGS.add_argument(
+    "--iterations",
+    default=10000,
+    dest="iterations",
+    help="Number of times an object is encoded/decoded per measurement.",
+    type=int,
+    )
+
+# CLI argument: number of measurements per operation.
+ARGS.add_argument(
+    "--repeat",
+    default=5,
+    dest="repeat",
+    help="Number of measurements per operation - the fastest is reported.",
+    type=int,
+    )
+
+
+# Table columns.
+COLS = [
+    ("Type", BeautifulTable.ALIGN_LEFT),
+    ("Operation", BeautifulTable.ALIGN_LEFT),
+    ("Calls / Op", BeautifulTable.ALIGN_RIGHT),
+    ("Time / Op (us)", BeautifulTable.ALIGN_RIGHT),
+]
+
+
+def main(args):
+    """Entry point.
+
+    :param args: Parsed CLI arguments.
+
+    """
+    encoder.initialise()
+
+    # Measure.
+    data = []
+    for obj in _get_objects():
+        encoded = json.loads(json.dumps(encoder.encode(obj)))
+        for operation, func in (
+            ("encode", lambda: encoder.encode(obj)),
+            ("decode", lambda: encoder.decode(_copy(encoded))),
+            ("round-trip", lambda: encoder.from_json(encoder.as_json(obj))),
+        ):
+            elapsed = min(timeit.repeat(func, number=args.iterations, repeat=args.repeat))
+            data.append((
+                type(obj).__name__,
+                operation,
+                _get_call_count(func),
+                (elapsed / args.iterations) * 1e6,
+            ))
+
+    # Set table.
+    cols = [i for i, _ in COLS]
+    rows = map(lambda i: [
+        i[0],
+        i[1],
+        i[2],
+        format(i[3], '.2f'),
+    ], data)
+    t = utils.get_table(cols, rows)
+    for key, aligmnent in COLS:
+        t.column_alignments[key] = aligmnent
+
+    # Render.
+    print(t)
+    round_trips = [i for i in data if i[1] == "round-trip"]
+    print(f"Round-trips: mean calls / op = {format(sum(i[2] for i in round_trips) / len(round_trips), '.1f')} - mean time / op = {format(sum(i[3] for i in round_trips) / len(round_trips), '.2f')} us")
+
+
+def _copy(obj):
+    """Returns a copy of an encoded object - decoding mutates it's input.
+
+    """
+    if isinstance(obj, dict):
+        return {k: _copy(v) for k, v in obj.items()}
+
+    return obj
+
+
+def _get_call_count(func) -> int:
+    """Returns number of (python & builtin) function calls issued by an operation - unlike timings, a count is stable across hosts.
+
+    """
+    count = 0
+    def _profile(frame, event, arg):
+        nonlocal count
+        count += event in ("call", "c_call")
+
+    sys.setprofile(_profile)
+    try:
+        func()
+    finally:
+        sys.setprofile(None)
+
+    # Exclude profiled lambda & profiler removal.
+    return count - 2
+
+
+def _get_objects():
+    """Returns set of domain objects to be measured - i.e. those most frequently passed over the wire.
+
+    """
+    network_id = factory.create_network_id("lrt1")
+    network = factory.create_network("lrt1", "casper-test")
+    node = factory.create_node(
+        group=NodeGroup.UNKNOWN,
+        host="localhost",
+        index=1,
+        network_id=network_id,
+        port_rest=1,
+        port_rpc=2,
+        port_event=3,
+        typeof=NodeType.VALIDATOR,
+        )
+    ctx = factory.create_execution_context(
+        args=None,
+        prune_on_completion=False,
+        deploys_per_second=0,
+        key_algorithm="ED25519",
+        loop_count=0,
+        loop_interval_ms=0,
+        execution_mode="sequential",
+        network_id=network_id,
+        node_id=factory.create_node_id(network_id, node.index),
+        run_index=1,
+        run_type="WG-100",
+        )
+    account = factory.create_account(
+        network=network_id.name,
+        typeof=AccountType.GENERATOR_RUN,
+        index=1,
+        run_index=ctx.run_index,
+        run_type=ctx.run_type,
+        )
+    deploy = factory.create_deploy_for_run(
+        ctx=ctx,
+        account=account,
+        associated_account=account,
+        node=node,
+        deploy_hash="0" * 64,
+        dispatch_attempts=1,
+        dispatch_duration=0.1,
+        typeof=DeployType.TRANSFER_NATIVE,
+        )
+
+    return [deploy, ctx, network]
+
+
+# Entry point.
+if __name__ == '__main__':
+    main(ARGS.parse_args())
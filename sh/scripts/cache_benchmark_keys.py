@@ -0,0 +1,212 @@
+import argparse
+import sys
+import timeit
+
+from beautifultable import BeautifulTable
+
+from stests.core import cache
+from stests.core import factory
+from stests.core.cache import stores
+from stests.core.types.chain import AccountType
+from stests.core.types.chain import ContractType
+from stests.core.types.chain import DeployType
+from stests.core.types.infra import NodeGroup
+from stests.core.types.infra import NodeType
+from stests.core.types.orchestration import ExecutionAspect
+from stests.core.types.orchestration import ExecutionStatus
+from stests.core.utils import cli as utils
+
+
+
+# CLI argument parser.
+ARGS = argparse.ArgumentParser("Displays per operation cost of building the keys of state & orchestration cache operations - the cache itself is not accessed.")
+
+# CLI argument: number of iterations per measurement.
+ARGS.add_argument(
+    "--iterations",
+    default=10000,
+    dest="iterations",
+    help="Number of times a key is built per measurement.",
+    type=int,
+    )
+
+# CLI argument: number of measurements per operation.
+ARGS.add_argument(
+    "--repeat",
+    default=5,
+    dest="repeat",
+    help="Number of measurements per operation - the fastest is reported.",
+    type=int,
+    )
+
+
+# Table columns.
+COLS = [
+    ("Module", BeautifulTable.ALIGN_LEFT),
+    ("Function", BeautifulTable.ALIGN_LEFT),
+    ("Keys", BeautifulTable.ALIGN_RIGHT),
+    ("Calls / Op", BeautifulTable.ALIGN_RIGHT),
+    ("Time / Op (us)", BeautifulTable.ALIGN_RIGHT),
+]
+
+
+def main(args):
+    """Entry point.
+
+    :param args: Parsed CLI arguments.
+
+    """
+    # Measure.
+    data = []
+    for module, func, func_args in _get_operations():
+        obj = _build_key(module, func, func_args)
+        elapsed = min(timeit.repeat(
+            lambda: _build_key(module, func, func_args),
+            number=args.iterations,
+            repeat=args.repeat,
+            ))
+        data.append((
+            module,
+            func,
+            _get_key_count(obj),
+            _get_call_count(lambda: _build_key(module, func, func_args)),
+            (elapsed / args.iterations) * 1e6,
+        ))
+
+    # Set table.
+    cols = [i for i, _ in COLS]
+    rows = map(lambda i: [
+        i[0].__name__.split(".")[-1],
+        i[1].__name__,
+        i[2],
+        i[3],
+        format(i[4], '.2f'),
+    ], data)
+    t = utils.get_table(cols, rows)
+    for key, aligmnent in COLS:
+        t.column_alignments[key] = aligmnent
+
+    # Render.
+    print(t)
+    print(f"Cache operations: {len(data)} - mean calls / op = {format(sum(i[3] for i in data) / len(data), '.1f')} - mean time / op = {format(sum(i[4] for i in data) / len(data), '.2f')} us - cache type = {stores.EnvVars.TYPE}")
+
+
+def _build_key(module, func, func_args):
+    """Builds the key (plus secondary index keys) of a cache operation as per cache_op.
+
+    """
+    obj = func.__wrapped__(*func_args)
+    obj.apply_key_prefix()
+    namespace = stores.get_key_namespace(module._PARTITION)
+    if namespace is not None:
+        obj.apply_key_hash_tag(namespace)
+
+    return obj
+
+
+def _get_call_count(func) -> int:
+    """Returns number of (python & builtin) function calls issued when building a key - unlike timings, a count is stable across hosts.
+
+    """
+    count = 0
+    def _profile(frame, event, arg):
+        nonlocal count
+        count += event in ("call", "c_call")
+
+    sys.setprofile(_profile)
+    try:
+        func()
+    finally:
+        sys.setprofile(None)
+
+    # Exclude profiled lambda & profiler removal.
+    return count - 2
+
+
+def _get_key_count(obj) -> int:
+    """Returns number of keys built by a cache operation.
+
+    """
+    if hasattr(obj, "item_keys"):
+        return len(obj.item_keys)
+
+    return 1 + len(getattr(obj, "indexes", []))
+
+
+def _get_operations():
+    """Returns set of cache operations to be measured, each alongside representative arguments.
+
+    """
+    network_id = factory.create_network_id("lrt1")
+    node = factory.create_node(
+        group=NodeGroup.UNKNOWN,
+        host="localhost",
+        index=1,
+        network_id=network_id,
+        port_rest=1,
+        port_rpc=2,
+        port_event=3,
+        typeof=NodeType.VALIDATOR,
+        )
+    ctx = factory.create_execution_context(
+        args=None,
+        prune_on_completion=False,
+        deploys_per_second=0,
+        key_algorithm="ED25519",
+        loop_count=0,
+        loop_interval_ms=0,
+        execution_mode="sequential",
+        network_id=network_id,
+        node_id=factory.create_node_id(network_id, node.index),
+        run_index=1,
+        run_type="WG-100",
+        )
+    ctx.phase_index, ctx.step_index = 1, 1
+    account = factory.create_account(
+        network=network_id.name,
+        typeof=AccountType.GENERATOR_RUN,
+        index=1,
+        run_index=ctx.run_index,
+        run_type=ctx.run_type,
+        )
+    deploy = factory.create_deploy_for_run(
+        ctx=ctx,
+        account=account,
+        associated_account=account,
+        node=node,
+        deploy_hash="0" * 64,
+        dispatch_attempts=1,
+        dispatch_duration=0.1,
+        typeof=DeployType.TRANSFER_NATIVE,
+        )
+    info = factory.create_execution_info(ExecutionAspect.STEP, ctx)
+    lock = factory.create_execution_lock(ExecutionAspect.STEP, ctx.network, ctx.run_index, ctx.run_type, 1, 1)
+    named_key = factory.create_named_key(account, ContractType.TRANSFER_U512_STORED, "transfer", "0" * 64)
+
+    return [
+        (cache.state, cache.state.decrement_account_balance, (account, 1)),
+        (cache.state, cache.state.get_account_balance, (account, )),
+        (cache.state, cache.state.get_deploy, (ctx, deploy.deploy_hash)),
+        (cache.state, cache.state.get_deploy_on_finalisation, (ctx.network, deploy.deploy_hash)),
+        (cache.state, cache.state.get_deploys, (network_id, ctx.run_type, ctx.run_index)),
+        (cache.state, cache.state.get_deploys_pending, (network_id, ctx.run_type, ctx.run_index)),
+        (cache.state, cache.state.get_named_keys, (ctx, account, ContractType.TRANSFER_U512_STORED)),
+        (cache.state, cache.state.increment_account_balance, (account, 1)),
+        (cache.state, cache.state.set_account, (account, )),
+        (cache.state, cache.state.set_deploy, (deploy, )),
+        (cache.state, cache.state.set_named_key, (ctx, named_key)),
+        (cache.orchestration, cache.orchestration.get_context, (ctx.network, ctx.run_index, ctx.run_type)),
+        (cache.orchestration, cache.orchestration.get_deploy_count, (ctx, ExecutionAspect.STEP)),
+        (cache.orchestration, cache.orchestration.get_info, (ctx, ExecutionAspect.STEP)),
+        (cache.orchestration, cache.orchestration.increment_deploy_count, (ctx, ExecutionAspect.STEP)),
+        (cache.orchestration, cache.orchestration.increment_deploy_counts, (ctx, )),
+        (cache.orchestration, cache.orchestration.set_context, (ctx, )),
+        (cache.orchestration, cache.orchestration.set_info, (info, )),
+        (cache.orchestration, cache.orchestration.set_lock, (ExecutionAspect.STEP, lock)),
+        (cache.orchestration, cache.orchestration._set_info_update, (ctx, ExecutionAspect.STEP, ExecutionStatus.COMPLETE)),
+    ]
+
+
+# Entry point.
+if __name__ == '__main__':
+    main(ARGS.parse_args())
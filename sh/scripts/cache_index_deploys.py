@@ -0,0 +1,60 @@
+import argparse
+import itertools
+
+from stests.core import cache
+from stests.core import factory
+from stests.core.cache.model import StorePartition
+from stests.core.utils import args_validator
+from stests.core.utils import cli as utils
+from stests.core.utils import env
+
+
+
+# CLI argument parser.
+ARGS = argparse.ArgumentParser("Backfills deploy hash indexes of previously cached deploys.")
+
+# CLI argument: network name.
+ARGS.add_argument(
+    "--net",
+    default=env.get_network_name(),
+    dest="network",
+    help="Network name {type}{id}, e.g. nctl1.",
+    type=args_validator.validate_network,
+    )
+
+# CLI argument: number of index entries written per round trip.
+ARGS.add_argument(
+    "--batch-size",
+    default=500,
+    dest="batch_size",
+    help="Number of deploys whose index entries are written per round trip.",
+    type=args_validator.validate_batch_size,
+    )
+
+
+def main(args):
+    """Entry point.
+
+    :param args: Parsed CLI arguments.
+
+    """
+    # Pull deploys lazily & push index entries in batches.
+    network_id = factory.create_network_id(args.network)
+    deploys = cache.state.stream_deploys_for_network(network_id)
+    count = 0
+    while True:
+        chunk = list(itertools.islice(deploys, args.batch_size))
+        if not chunk:
+            break
+        with cache.batch(StorePartition.STATE):
+            for deploy in chunk:
+                cache.state.set_deploy_index(deploy)
+        count += len(chunk)
+
+    # Notify.
+    utils.log(f"Deploy hash indexes of network {args.network} were successfully backfilled :: deploys={count}")
+
+
+# Entry point.
+if __name__ == '__main__':
+    main(ARGS.parse_args())
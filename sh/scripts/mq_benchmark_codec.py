@@ -0,0 +1,129 @@
+import argparse
+import uuid
+
+import dramatiq
+from beautifultable import BeautifulTable
+
+from stests.core import factory
+from stests.core.cache import codec
+from stests.core.mq import encoder
+from stests.core.types.chain import DeployType
+from stests.core.types.orchestration import ExecutionContext
+from stests.core.utils import args_validator
+from stests.core.utils import cli as utils
+from stests.generators.meta import GENERATOR_MAP
+
+
+
+# CLI argument parser.
+ARGS = argparse.ArgumentParser("Displays number of broker bytes per dispatched deploy when messages are encoded by each supported codec.")
+
+# CLI argument: network name.
+ARGS.add_argument(
+    "--net",
+    default="lrt1",
+    dest="network",
+    help="Network name {type}{id}, e.g. nctl1.",
+    type=args_validator.validate_network,
+    )
+
+# CLI argument: run type.
+ARGS.add_argument(
+    "--type",
+    default="wg-100",
+    dest="run_type",
+    help="Generator type - e.g. wg-100.",
+    type=args_validator.validate_run_type,
+    )
+
+
+# Table columns.
+COLS = [
+    ("Codec", BeautifulTable.ALIGN_LEFT),
+    ("Bytes / Deploy (async step)", BeautifulTable.ALIGN_RIGHT),
+    ("Bytes / Deploy (sync step)", BeautifulTable.ALIGN_RIGHT),
+    ("% of JSON", BeautifulTable.ALIGN_RIGHT),
+]
+
+
+def main(args):
+    """Entry point.
+
+    :param args: Parsed CLI arguments.
+
+    """
+    encoder.initialise()
+
+    # Measure.
+    ctx = _get_context(args)
+    sizes_async = codec.get_sizes(_get_message(ctx, False).asdict())
+    sizes_sync = codec.get_sizes(_get_message(ctx, True).asdict())
+
+    # Set table.
+    cols = [i for i, _ in COLS]
+    rows = map(lambda i: [
+        i,
+        sizes_async[i],
+        sizes_sync[i],
+        format((sizes_sync[i] / sizes_sync["JSON"]) * 100, '.1f'),
+    ], sizes_sync)
+    t = utils.get_table(cols, rows)
+    for key, aligmnent in COLS:
+        t.column_alignments[key] = aligmnent
+
+    # Render.
+    print(t)
+    print(f"{args.network} - {args.run_type} - message = do_transfer - active codec = {encoder.EnvVars.CODEC}")
+
+
+def _get_context(args) -> ExecutionContext:
+    """Returns execution context of a run as passed along chain of execution.
+
+    """
+    generator = GENERATOR_MAP[args.run_type]
+    network_id = factory.create_network_id(args.network)
+
+    return factory.create_execution_context(
+        args=generator.Arguments.create(generator.ARGS.parse_args([])),
+        prune_on_completion=False,
+        deploys_per_second=0,
+        key_algorithm="ED25519",
+        loop_count=0,
+        loop_interval_ms=0,
+        execution_mode="sequential",
+        network_id=network_id,
+        node_id=factory.create_node_id(network_id, 1),
+        run_index=1,
+        run_type=args.run_type,
+        )
+
+
+def _get_message(ctx, is_sync: bool) -> dramatiq.Message:
+    """Returns message dispatched per deploy - within sync steps messages also carry the group's completion callback.
+
+    """
+    options = dict()
+    if is_sync:
+        options["group_completion_uuid"] = str(uuid.uuid4())
+        options["group_completion_callbacks"] = [
+            dramatiq.Message(
+                queue_name="orchestration.engine.step",
+                actor_name="do_step_verification",
+                args=(ctx, ),
+                kwargs={},
+                options={},
+                ).asdict()
+            ]
+
+    return dramatiq.Message(
+        queue_name="orchestration.generators.accounts",
+        actor_name="do_transfer",
+        args=(ctx, 0, 1, int(25e8), DeployType.TRANSFER_NATIVE),
+        kwargs={},
+        options=options,
+        )
+
+
+# Entry point.
+if __name__ == '__main__':
+    main(ARGS.parse_args())
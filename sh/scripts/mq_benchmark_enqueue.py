@@ -0,0 +1,121 @@
+import argparse
+import time
+
+import dramatiq
+from beautifultable import BeautifulTable
+
+from stests.core.mq import brokers
+from stests.core.mq import encoder
+from stests.core.mq.extensions import message_group
+from stests.core.utils import cli as utils
+
+
+
+# CLI argument parser.
+ARGS = argparse.ArgumentParser("Displays number of messages per second enqueued by a message group when enqueued one at a time & in batches.")
+
+# CLI argument: group sizes.
+ARGS.add_argument(
+    "--children",
+    default="1000,10000,100000,1000000",
+    dest="children",
+    help="Comma separated set of group sizes, i.e. number of child messages per group.",
+    type=lambda i: [int(j) for j in i.split(",")],
+    )
+
+# CLI argument: message payload size.
+ARGS.add_argument(
+    "--payload",
+    default=256,
+    dest="payload",
+    help="Size (in bytes) of each message's payload.",
+    type=int,
+    )
+
+# CLI argument: max. group size enqueued one at a time.
+ARGS.add_argument(
+    "--serial-max",
+    default=100000,
+    dest="serial_max",
+    help="Max. group size whose messages are enqueued one at a time - larger groups are enqueued in batches only.",
+    type=int,
+    )
+
+
+# Queue to which messages are enqueued - flushed after each measurement.
+_QUEUE = "stests.benchmark.enqueue"
+
+# Table columns.
+COLS = [
+    ("Children", BeautifulTable.ALIGN_RIGHT),
+    ("Serial (msgs/sec)", BeautifulTable.ALIGN_RIGHT),
+    ("Batched (msgs/sec)", BeautifulTable.ALIGN_RIGHT),
+    ("Speedup", BeautifulTable.ALIGN_RIGHT),
+]
+
+
+def main(args):
+    """Entry point.
+
+    :param args: Parsed CLI arguments.
+
+    """
+    encoder.initialise()
+    broker = brokers.get_broker()
+    dramatiq.set_broker(broker)
+    dramatiq.set_encoder(encoder)
+    broker.declare_queue(_QUEUE)
+
+    # Measure.
+    data = []
+    for count in args.children:
+        messages = [_get_message(args.payload, i) for i in range(count)]
+        serial = None if count > args.serial_max else _measure(broker, lambda: [broker.enqueue(i) for i in messages])
+        batched = _measure(broker, lambda: message_group.MessageGroup(messages, broker=broker).run())
+        data.append((count, None if serial is None else count / serial, count / batched))
+
+    # Set table.
+    cols = [i for i, _ in COLS]
+    rows = map(lambda i: [
+        i[0],
+        "-" if i[1] is None else format(i[1], '.0f'),
+        format(i[2], '.0f'),
+        "-" if i[1] is None else f"{format(i[2] / i[1], '.1f')}x",
+    ], data)
+    t = utils.get_table(cols, rows)
+    for key, aligmnent in COLS:
+        t.column_alignments[key] = aligmnent
+
+    # Render.
+    print(t)
+    print(f"broker = {brokers.EnvVars.TYPE} - payload = {args.payload} bytes - batch size = {message_group.EnvVars.ENQUEUE_BATCH_SIZE}")
+
+
+def _get_message(payload: int, index: int) -> dramatiq.Message:
+    """Returns a message to be enqueued.
+
+    """
+    return dramatiq.Message(
+        queue_name=_QUEUE,
+        actor_name="do_benchmark",
+        args=(index, "0" * payload),
+        kwargs={},
+        options={},
+        )
+
+
+def _measure(broker: dramatiq.Broker, func) -> float:
+    """Returns elapsed time (in seconds) of an enqueue - queue is flushed once measured.
+
+    """
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    broker.flush(_QUEUE)
+
+    return elapsed
+
+
+# Entry point.
+if __name__ == '__main__':
+    main(ARGS.parse_args())
@@ -0,0 +1,41 @@
+import argparse
+
+import dramatiq
+from dramatiq.brokers.stub import StubBroker
+
+from stests.core.mq import queues
+from stests.core.mq.queues import QueueFamily
+from stests.workers import utils as workers
+
+
+
+# CLI argument parser.
+ARGS = argparse.ArgumentParser("Displays names of queues of a family, i.e. the queues consumed by that family's worker pool.")
+
+# CLI argument: queue family.
+ARGS.add_argument(
+    "family",
+    choices=[i.name for i in QueueFamily],
+    help="Family of queues, e.g. DISPATCH.",
+    type=str.upper,
+    )
+
+
+def main(args):
+    """Entry point.
+
+    :param args: Parsed CLI arguments.
+
+    """
+    # Declare actors against a stub broker - queue names are thereby resolved without connecting to a broker.
+    dramatiq.set_broker(StubBroker())
+    workers.import_monitoring_actors()
+    workers.import_orchestration_actors()
+
+    # Render space delimited so as to be passable to dramatiq's --queues option.
+    print(" ".join(queues.get_queues(dramatiq.get_broker().get_declared_queues(), QueueFamily[args.family])))
+
+
+# Entry point.
+if __name__ == '__main__':
+    main(ARGS.parse_args())
@@ -0,0 +1,94 @@
+import argparse
+
+from beautifultable import BeautifulTable
+
+from stests.core import cache
+from stests.core import factory
+from stests.core.cache import codec
+from stests.core.utils import args_validator
+from stests.core.utils import cli as utils
+from stests.core.utils import env
+
+
+
+# CLI argument parser.
+ARGS = argparse.ArgumentParser("Displays size of a run's cached deploys when encoded by each supported cache codec.")
+
+# CLI argument: network name.
+ARGS.add_argument(
+    "--net",
+    default=env.get_network_name(),
+    dest="network",
+    help="Network name {type}{id}, e.g. nctl1.",
+    type=args_validator.validate_network,
+    )
+
+# CLI argument: run type.
+ARGS.add_argument(
+    "--type",
+    default="wg-100",
+    dest="run_type",
+    help="Generator type - e.g. wg-100.",
+    type=args_validator.validate_run_type,
+    )
+
+# CLI argument: run index.
+ARGS.add_argument(
+    "--run",
+    default=1,
+    dest="run_index",
+    help="Run identifier.",
+    type=args_validator.validate_run_index,
+    )
+
+
+# Table columns.
+COLS = [
+    ("Codec", BeautifulTable.ALIGN_LEFT),
+    ("Total Bytes", BeautifulTable.ALIGN_RIGHT),
+    ("Bytes / Deploy", BeautifulTable.ALIGN_RIGHT),
+    ("% of JSON", BeautifulTable.ALIGN_RIGHT),
+]
+
+
+def main(args):
+    """Entry point.
+    
+    :param args: Parsed CLI arguments.
+
+    """
+    # Pull data.
+    network_id = factory.create_network_id(args.network)
+    data = cache.state.stream_deploys(network_id, args.run_type, args.run_index)
+
+    # Measure.
+    count, totals = 0, dict()
+    for deploy in data:
+        count += 1
+        for codec_type, size in codec.get_sizes(deploy).items():
+            totals[codec_type] = totals.get(codec_type, 0) + size
+    if not count:
+        utils.log("No run deploys found.")
+        return
+
+    # Set table.
+    cols = [i for i, _ in COLS]
+    rows = map(lambda i: [
+        i[0],
+        i[1],
+        format(i[1] / count, '.1f'),
+        format((i[1] / totals["JSON"]) * 100, '.1f'),
+    ], totals.items())
+    t = utils.get_table(cols, rows)
+    for key, aligmnent in COLS:
+        t.column_alignments[key] = aligmnent    
+
+    # Render.
+    print(t)
+    print(f"{network_id.name} - {args.run_type}  - Run {args.run_index} - deploys = {count} - active codec = {codec.EnvVars.TYPE}")
+
+
+# Entry point.
+if __name__ == '__main__':
+    with cache.read_only():
+        main(ARGS.parse_args())
@@ -0,0 +1,109 @@
+import argparse
+
+from beautifultable import BeautifulTable
+
+from stests.core.cache import stats
+from stests.core.utils import cli as utils
+from stests.core.utils.misc import get_histogram_percentile
+
+
+
+# CLI argument parser.
+ARGS = argparse.ArgumentParser("Displays cache operation statistics published by worker processes (see STESTS_CACHE_STATS_ENABLED).")
+
+# CLI argument: max. number of operations to display.
+ARGS.add_argument(
+    "--top",
+    default=25,
+    dest="top",
+    help="Maximum number of operations to display, ordered by total time spent.",
+    type=int,
+    )
+
+# CLI argument: reset flag.
+ARGS.add_argument(
+    "--reset",
+    action="store_true",
+    dest="reset",
+    help="Deletes published statistics once displayed.",
+    )
+
+
+# Table columns.
+COLS = [
+    ("Partition", BeautifulTable.ALIGN_LEFT),
+    ("Operation", BeautifulTable.ALIGN_LEFT),
+    ("Function", BeautifulTable.ALIGN_LEFT),
+    ("Calls", BeautifulTable.ALIGN_RIGHT),
+    ("Errors", BeautifulTable.ALIGN_RIGHT),
+    ("Retries", BeautifulTable.ALIGN_RIGHT),
+    ("Local Hits", BeautifulTable.ALIGN_RIGHT),
+    ("Total (s)", BeautifulTable.ALIGN_RIGHT),
+    ("Mean (ms)", BeautifulTable.ALIGN_RIGHT),
+    ("p50 (ms)", BeautifulTable.ALIGN_RIGHT),
+    ("p95 (ms)", BeautifulTable.ALIGN_RIGHT),
+    ("Keys Matched", BeautifulTable.ALIGN_RIGHT),
+    ("KB Read", BeautifulTable.ALIGN_RIGHT),
+    ("KB Written", BeautifulTable.ALIGN_RIGHT),
+]
+
+
+def main(args):
+    """Entry point.
+
+    :param args: Parsed CLI arguments.
+
+    """
+    # Pull data.
+    data = stats.get_snapshot_published()
+    if not data:
+        utils.log("No cache statistics found.")
+        return
+
+    # Sort data.
+    data = sorted(data.items(), key=lambda i: i[1].get("latency_ms", 0), reverse=True)
+
+    # Set table.
+    cols = [i for i, _ in COLS]
+    rows = map(lambda i: [
+        i[0][0],
+        i[0][1],
+        i[0][2],
+        int(i[1].get("calls", 0)),
+        int(i[1].get("errors", 0)),
+        int(i[1].get("retries", 0)),
+        int(i[1].get("local_hits", 0)),
+        format(i[1].get("latency_ms", 0) / 1000, '.3f'),
+        format(i[1].get("latency_ms", 0) / max(i[1].get("calls", 0), 1), '.3f'),
+        _get_percentile_label(i[1], 0.5),
+        _get_percentile_label(i[1], 0.95),
+        int(i[1].get("keys_matched", 0)),
+        format(i[1].get("bytes_read", 0) / 1024, '.1f'),
+        format(i[1].get("bytes_written", 0) / 1024, '.1f'),
+    ], data[:args.top])
+    t = utils.get_table(cols, rows)
+    for key, aligmnent in COLS:
+        t.column_alignments[key] = aligmnent
+
+    # Render.
+    print(t)
+    print(f"Cache operations: {len(data)} - total calls = {int(sum(i.get('calls', 0) for _, i in data))}")
+
+    # Reset.
+    if args.reset:
+        stats.reset_published()
+        utils.log("Cache statistics reset.")
+
+
+def _get_percentile_label(counters, percentile) -> str:
+    """Returns a latency percentile formatted for display purposes.
+
+    """
+    bound = get_histogram_percentile(counters, percentile, stats.LATENCY_BUCKETS, "calls")
+
+    return f"> {stats.LATENCY_BUCKETS[-1]}" if bound is None else f"<= {bound}"
+
+
+# Entry point.
+if __name__ == '__main__':
+    main(ARGS.parse_args())
@@ -2,6 +2,7 @@ import argparse
 import json
 
 from stests import chain
+from stests.core import cache
 from stests.core.utils import args_validator
 from stests.core.utils import env
 from arg_utils import get_network_node
@@ -53,4 +54,5 @@ def main(args):
 
 # Entry point.
 if __name__ == '__main__':
-    main(ARGS.parse_args())
+    with cache.read_only():
+        main(ARGS.parse_args())
@@ -1,6 +1,7 @@
 import argparse
 
 from stests import chain
+from stests.core import cache
 from stests.core.utils import args_validator
 from stests.core.utils import cli as utils
 from stests.core.utils import env
@@ -57,4 +58,5 @@ def main(args):
 
 # Entry point.
 if __name__ == '__main__':
-    main(ARGS.parse_args())
+    with cache.read_only():
+        main(ARGS.parse_args())
@@ -48,13 +48,13 @@ def main(args):
         return
 
     # Sort data.
-    data = sorted(data, key=lambda i: f"{i.contract_type}.{i.name}")
+    data = sorted(data, key=lambda i: f"{i.contract_type.name}.{i.name}")
 
     # Set table cols/rows.
     cols = [i for i, _ in COLS]
     rows = map(lambda i: [
         network_id.name,
-        i.contract_type,
+        i.contract_type.name,
         i.name,      
         i.hash,      
     ], data)
@@ -72,4 +72,5 @@ def main(args):
 
 # Entry point.
 if __name__ == '__main__':
-    main(ARGS.parse_args())
+    with cache.read_only():
+        main(ARGS.parse_args())
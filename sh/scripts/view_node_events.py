@@ -2,6 +2,7 @@ import argparse
 import json
 
 from stests import chain
+from stests.core import cache
 from stests.core.types.infra import Node
 from stests.core.types.infra import NodeEventInfo
 from stests.core.utils import args_validator
@@ -89,4 +90,5 @@ def _on_event_callback(node: Node, info: NodeEventInfo, payload: dict):
 
 # Entry point.
 if __name__ == '__main__':
-    main(ARGS.parse_args())
\ No newline at end of file
+    with cache.read_only():
+        main(ARGS.parse_args())
\ No newline at end of file
@@ -1,13 +1,16 @@
 import argparse
-import statistics
+import itertools
+import math
 
 from beautifultable import BeautifulTable
 
 from stests.core import cache
 from stests.core import factory
+from stests.core.types.orchestration import ExecutionAspect
 from stests.core.utils import args_validator
 from stests.core.utils import cli as utils
 from stests.core.utils import env
+from stests.core.utils.misc import get_histogram_percentile
 
 
 
@@ -41,6 +44,57 @@ ARGS.add_argument(
     type=args_validator.validate_run_index,
     )
 
+# CLI argument: dispatch time window start.
+ARGS.add_argument(
+    "--from",
+    default=None,
+    dest="ts_from",
+    help="Dispatch time (ISO 8601) from which deploys are displayed.",
+    type=args_validator.validate_timestamp,
+    )
+
+# CLI argument: dispatch time window end.
+ARGS.add_argument(
+    "--to",
+    default=None,
+    dest="ts_to",
+    help="Dispatch time (ISO 8601) upto which deploys are displayed.",
+    type=args_validator.validate_timestamp,
+    )
+
+# CLI argument: max. number of deploys to display.
+ARGS.add_argument(
+    "--limit",
+    default=None,
+    dest="limit",
+    help="Maximum number of deploys to display.",
+    type=int,
+    )
+
+# CLI argument: latest flag.
+ARGS.add_argument(
+    "--latest",
+    action="store_true",
+    dest="latest",
+    help="Displays most recently dispatched deploys first.",
+    )
+
+# CLI argument: stream flag.
+ARGS.add_argument(
+    "--stream",
+    action="store_true",
+    dest="stream",
+    help="Renders deploys in pages as they are pulled from cache (unsorted) so as to bound memory usage.",
+    )
+
+# CLI argument: summary flag.
+ARGS.add_argument(
+    "--summary",
+    action="store_true",
+    dest="summary",
+    help="Displays finalization statistics aggregated whilst the run was monitored - deploys are not pulled from cache.",
+    )
+
 
 # Table columns.
 COLS = [
@@ -56,6 +110,58 @@ COLS = [
     ("Block Hash", BeautifulTable.ALIGN_RIGHT),
 ]
 
+# Number of deploys rendered per page when streaming.
+PAGE_SIZE = 1000
+
+
+class _FinalizationStats():
+    """Running finalization statistics - accumulated as deploys are rendered.
+
+    """
+    def __init__(self):
+        self.count = 0
+        self.finalized = 0
+        self.maxima = None
+        self.mean = 0.0
+        self.minima = None
+        self.sum_sq_deltas = 0.0
+
+    @property
+    def stdev(self):
+        return math.sqrt(self.sum_sq_deltas / (self.finalized - 1))
+
+    @classmethod
+    def from_counters(cls, counters, count):
+        """Returns statistics derived from running aggregates maintained by the cache.
+
+        """
+        stats = cls()
+        stats.finalized = int(counters.get("count", 0))
+        stats.count = max(count, stats.finalized)
+        if stats.finalized:
+            stats.maxima = counters["max"]
+            stats.minima = counters["min"]
+            stats.mean = counters["sum"] / stats.finalized
+            stats.sum_sq_deltas = max(counters["sum_sq"] - counters["sum"] * stats.mean, 0.0)
+
+        return stats
+
+    def update(self, deploy):
+        """Folds a deploy into the running statistics.
+
+        """
+        self.count += 1
+        duration = deploy.finalization_duration
+        if not duration:
+            return
+
+        self.finalized += 1
+        self.maxima = duration if self.maxima is None else max(self.maxima, duration)
+        self.minima = duration if self.minima is None else min(self.minima, duration)
+        delta = duration - self.mean
+        self.mean += delta / self.finalized
+        self.sum_sq_deltas += delta * (duration - self.mean)
+
 
 def main(args):
     """Entry point.
@@ -63,39 +169,77 @@ def main(args):
     :param args: Parsed CLI arguments.
 
     """
-    # Pull data.
+    # Summaries are resolved from running aggregates - O(1) irrespective of run size.
     network_id = factory.create_network_id(args.network)
-    data = cache.state.get_deploys(network_id, args.run_type, args.run_index)
-    if not data:
+    if args.summary:
+        _render_finalization_summary(args, network_id)
+        return
+
+    # Pull data - windowed queries are resolved (in dispatch order) from the run's deploy time index.
+    is_windowed = args.ts_from or args.ts_to or args.limit or args.latest
+    if is_windowed:
+        data = iter(cache.state.get_deploys_by_time(
+            network_id,
+            args.run_type,
+            args.run_index,
+            ts_from=args.ts_from,
+            ts_to=args.ts_to,
+            limit=args.limit,
+            reverse=args.latest,
+            ))
+    else:
+        data = cache.state.stream_deploys(network_id, args.run_type, args.run_index)
+    first = next(data, None)
+    if first is None:
         utils.log("No run deploys found.")
         return
+    data = itertools.chain([first], data)
 
-    # Sort data.
-    data = sorted(data, key=lambda i: i.dispatch_timestamp)
+    # Sort data - requires that all deploys are held in memory.
+    if not args.stream and not is_windowed:
+        data = sorted(data, key=lambda i: i.dispatch_timestamp)
 
     # Render views.
-    _render_table(args, network_id, data)
-    _render_finalization_stats(data)
+    stats = _FinalizationStats()
+    _render_table(args, network_id, data, stats)
+    _render_finalization_stats(stats)
 
 
-def _render_table(args, network_id, data):
-    """Renders table of deploys.
+def _render_table(args, network_id, data, stats):
+    """Renders table of deploys - when streaming a table is rendered per page.
+    
+    """
+    page_size = PAGE_SIZE if args.stream else None
+    data = enumerate(data, 1)
+    while True:
+        page = list(itertools.islice(data, page_size))
+        if not page:
+            break
+        for _, deploy in page:
+            stats.update(deploy)
+        _render_page(page)
+
+    print(f"{network_id.name} - {args.run_type}  - Run {args.run_index}")
+
+
+def _render_page(page):
+    """Renders a page of deploys.
     
     """
     # Set table cols/rows.
     cols = [i for i, _ in COLS]
     rows = map(lambda i: [
-        data.index(i) + 1,
-        f"# {i.dispatch_node_index}",
-        i.dispatch_timestamp.isoformat(),
-        i.account,
-        i.deploy_hash,      
-        i.typeof.name,
-        i.status.name,      
-        i.label_finalization_duration,
-        f"{i.era_id or '--'}::{i.round_id or '??'}",
-        i.block_hash or "--"
-    ], data)
+        i[0],
+        f"# {i[1].dispatch_node_index}",
+        i[1].dispatch_timestamp.isoformat(),
+        i[1].account,
+        i[1].deploy_hash,      
+        i[1].typeof.name,
+        i[1].status.name,      
+        i[1].label_finalization_duration,
+        f"{i[1].era_id or '--'}::{i[1].round_id or '??'}",
+        i[1].block_hash or "--"
+    ], page)
 
     # Set table.
     t = utils.get_table(cols, rows)
@@ -104,27 +248,48 @@ def _render_table(args, network_id, data):
 
     # Render.
     print(t)
-    print(f"{network_id.name} - {args.run_type}  - Run {args.run_index}")
 
 
-def _render_finalization_stats(data):
+def _render_finalization_stats(stats):
     """Renders finalization stats.
     
     """
-    times = [i.finalization_duration for i in data if i.finalization_duration]
-    if not times or len(times) == 1:
+    if stats.finalized < 2:
         return
 
-    maxima = max(times)
-    minima = min(times)
-    avg = statistics.mean(times)
-    stdev = statistics.stdev(times)
-    # variance = format(statistics.variance(times), '.3f') if len(times) > 1 else 'N/A'
+    print(f"Finalized = {stats.finalized} :: %={int((stats.finalized / stats.count) * 100)} :: Avg={format(stats.mean, '.3f')}s :: Max={format(stats.maxima, '.3f')}s :: Min={format(stats.minima, '.3f')}s :: Std Dev= {format(stats.stdev, '.3f')}s")
+
+
+def _render_finalization_summary(args, network_id):
+    """Renders finalization stats aggregated whilst the run was monitored.
+    
+    """
+    ctx = cache.orchestration.get_context(network_id.name, args.run_index, args.run_type)
+    if ctx is None:
+        utils.log("No run found.")
+        return
+
+    counters = cache.orchestration.get_finalisation_stats(ctx, ExecutionAspect.RUN)
+    if not counters:
+        utils.log("No run finalization statistics found.")
+        return
+
+    stats = _FinalizationStats.from_counters(counters, cache.orchestration.get_deploy_count(ctx, ExecutionAspect.RUN))
+    print(f"{network_id.name} - {args.run_type}  - Run {args.run_index}")
+    _render_finalization_stats(stats)
+    print(f"Percentiles :: p50={_get_percentile_label(counters, 0.5)} :: p95={_get_percentile_label(counters, 0.95)} :: p99={_get_percentile_label(counters, 0.99)}")
+
+
+def _get_percentile_label(counters, percentile) -> str:
+    """Returns upper bound of finalization latency histogram bucket within which a percentile falls.
+
+    """
+    bound = get_histogram_percentile(counters, percentile, cache.orchestration.FINALISATION_BUCKETS, "count")
 
-    # print(f"Finalized = {len(times)} :: %={int((len(times) / len(data)) * 100)} :: Avg={format(avg, '.3f')}s :: Max={format(maxima, '.3f')}s :: Min={format(minima, '.3f')}s :: Variance={variance}s :: Std Dev= {format(stdev, '.3f')}s")
-    print(f"Finalized = {len(times)} :: %={int((len(times) / len(data)) * 100)} :: Avg={format(avg, '.3f')}s :: Max={format(maxima, '.3f')}s :: Min={format(minima, '.3f')}s :: Std Dev= {format(stdev, '.3f')}s")
+    return f"> {cache.orchestration.FINALISATION_BUCKETS[-1]}s" if bound is None else f"<= {bound}s"
 
 
 # Entry point.
 if __name__ == '__main__':
-    main(ARGS.parse_args())
+    with cache.read_only():
+        main(ARGS.parse_args())
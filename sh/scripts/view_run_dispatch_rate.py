@@ -0,0 +1,135 @@
+import argparse
+import collections
+import math
+
+from beautifultable import BeautifulTable
+
+from stests.core import cache
+from stests.core import factory
+from stests.core.orchestration import pacing
+from stests.core.utils import args_validator
+from stests.core.utils import cli as utils
+from stests.core.utils import env
+
+
+
+# CLI argument parser.
+ARGS = argparse.ArgumentParser("Displays target versus achieved deploy dispatch rate of a run.")
+
+# CLI argument: network name.
+ARGS.add_argument(
+    "--net",
+    default=env.get_network_name(),
+    dest="network",
+    help="Network name {type}{id}, e.g. nctl1.",
+    type=args_validator.validate_network,
+    )
+
+# CLI argument: run type.
+ARGS.add_argument(
+    "--type",
+    default="wg-100",
+    dest="run_type",
+    help="Generator type - e.g. wg-100.",
+    type=args_validator.validate_run_type,
+    )
+
+# CLI argument: run index.
+ARGS.add_argument(
+    "--run",
+    default=1,
+    dest="run_index",
+    help="Run identifier.",
+    type=args_validator.validate_run_index,
+    )
+
+
+# Table columns.
+COLS = [
+    ("Metric", BeautifulTable.ALIGN_LEFT),
+    ("Value", BeautifulTable.ALIGN_RIGHT),
+]
+
+
+def main(args):
+    """Entry point.
+
+    :param args: Parsed CLI arguments.
+
+    """
+    # Pull data.
+    network_id = factory.create_network_id(args.network)
+    ctx = cache.orchestration.get_context(network_id.name, args.run_index, args.run_type)
+    if ctx is None:
+        utils.log("No run found.")
+        return
+    timestamps = [i.dispatch_timestamp.timestamp() for i in cache.state.get_deploys_by_time(
+        network_id,
+        args.run_type,
+        args.run_index,
+        )]
+    if len(timestamps) < 2:
+        utils.log("Insufficient run deploys found.")
+        return
+
+    # Measure.
+    gaps = sorted((j - i) * 1000 for i, j in zip(timestamps, timestamps[1:]))
+    per_second = _get_per_second_counts(timestamps)
+    per_second_mean = sum(per_second) / len(per_second)
+
+    # Set table.
+    cols = [i for i, _ in COLS]
+    rows = [
+        ["Deploys", len(timestamps)],
+        ["Target Rate (deploys/s)", ctx.deploys_per_second or "-"],
+        ["Achieved Rate (deploys/s)", format((len(timestamps) - 1) / (timestamps[-1] - timestamps[0]), '.2f')],
+        ["Dispatch Gap p50 (ms)", format(_get_percentile(gaps, 0.5), '.1f')],
+        ["Dispatch Gap p95 (ms)", format(_get_percentile(gaps, 0.95), '.1f')],
+        ["Dispatch Gap Max (ms)", format(gaps[-1], '.1f')],
+        ["Deploys / Second Min", min(per_second)],
+        ["Deploys / Second Mean", format(per_second_mean, '.2f')],
+        ["Deploys / Second Max", max(per_second)],
+        ["Deploys / Second Std Dev", format(_get_stdev(per_second, per_second_mean), '.2f')],
+    ]
+    t = utils.get_table(cols, rows)
+    for key, aligmnent in COLS:
+        t.column_alignments[key] = aligmnent
+
+    # Render.
+    print(t)
+    print(f"{network_id.name} - {args.run_type}  - Run {args.run_index} - pacing = {pacing.EnvVars.MODE}")
+
+
+def _get_per_second_counts(timestamps):
+    """Returns number of deploys dispatched within each whole second of a run - partial first & last seconds are excluded.
+
+    """
+    counts = collections.Counter(int(i) for i in timestamps)
+    first, last = int(timestamps[0]), int(timestamps[-1])
+    if last - first >= 2:
+        first, last = first + 1, last - 1
+
+    return [counts[i] for i in range(first, last + 1)]
+
+
+def _get_percentile(values, percentile):
+    """Returns nearest rank percentile of a sorted set of values.
+
+    """
+    return values[max(math.ceil(len(values) * percentile) - 1, 0)]
+
+
+def _get_stdev(values, mean):
+    """Returns sample standard deviation of a set of values.
+
+    """
+    if len(values) < 2:
+        return 0.0
+
+    return math.sqrt(sum((i - mean) ** 2 for i in values) / (len(values) - 1))
+
+
+# Entry point.
+if __name__ == '__main__':
+    with cache.read_only():
+        main(ARGS.parse_args())
@@ -63,7 +63,7 @@ def main(args):
     """
     # Pull data.
     network_id = factory.create_network_id(args.network)
-    data = cache.orchestration.get_info_list(network_id, args.run_type)
+    data = cache.orchestration.stream_info_list(network_id, args.run_type)
     data = [i for i in data if i.aspect == ExecutionAspect.RUN]
     if not data:
         utils.log("No run information found.")
@@ -77,9 +77,9 @@ def main(args):
                 break
 
     # Associate info with execution context.
-    ctx_list = cache.orchestration.get_context_list(network_id, args.run_type)
+    ctx_map = {(i.run_type, i.run_index): i for i in cache.orchestration.stream_context_list(network_id, args.run_type)}
     for i in data:
-        i.ctx = _get_ctx(i, ctx_list)
+        i.ctx = ctx_map.get((i.run_type, i.run_index))
 
     # Associate info with deploy count.
     keys, counts = cache.orchestration.get_deploy_count_list(network_id, args.run_type)
@@ -108,15 +108,6 @@ def main(args):
     print("----------------------------------------------------------------------------------------------------------------------------")
 
 
-def _get_ctx(i, ctx_list):
-    """Returns execution context associated with a run.
-    
-    """
-    for ctx in ctx_list:
-        if i.run_type == ctx.run_type and i.run_index == ctx.run_index:
-            return ctx
-
-
 def _get_deploy_count(i: ExecutionInfo, counts):
     """Returns count of deploys dispatched during course of a run.
     
@@ -149,4 +140,5 @@ def _get_row(i, counts):
 
 # Entry point.
 if __name__ == '__main__':
-    main(ARGS.parse_args())
+    with cache.read_only():
+        main(ARGS.parse_args())
@@ -35,6 +35,9 @@ alias stests-interactive-orchestration='$STESTS_PATH_SH/workers/interactive.sh o
 # ###############################################################
 
 alias stests-workers=$STESTS_PATH_SH/workers/start.sh
+alias stests-workers-benchmark-codec='_exec_cmd $STESTS_PATH_SH_SCRIPTS/mq_benchmark_codec.py'
+alias stests-workers-benchmark-enqueue='_exec_cmd $STESTS_PATH_SH_SCRIPTS/mq_benchmark_enqueue.py'
+alias stests-workers-queues='_exec_cmd $STESTS_PATH_SH_SCRIPTS/mq_view_queues.py'
 alias stests-workers-reload=$STESTS_PATH_SH/workers/reload.sh
 alias stests-workers-restart=$STESTS_PATH_SH/workers/restart.sh
 alias stests-workers-start=$STESTS_PATH_SH/workers/start.sh
@@ -61,6 +64,11 @@ alias stests-register-nctl='$STESTS_PATH_SH/cache/register_nctl.sh'
 
 alias stests-cache-flush='$STESTS_PATH_SH/cache/flush.sh'
 alias stests-cache-flush-infra='$STESTS_PATH_SH/cache/flush_infra.sh'
+alias stests-cache-benchmark-counters='_exec_cmd $STESTS_PATH_SH_SCRIPTS/cache_benchmark_counters.py'
+alias stests-cache-benchmark-encoder='_exec_cmd $STESTS_PATH_SH_SCRIPTS/cache_benchmark_encoder.py'
+alias stests-cache-benchmark-keys='_exec_cmd $STESTS_PATH_SH_SCRIPTS/cache_benchmark_keys.py'
+alias stests-cache-index-deploys='_exec_cmd $STESTS_PATH_SH_SCRIPTS/cache_index_deploys.py'
+alias stests-cache-view-stats='_exec_cmd $STESTS_PATH_SH_SCRIPTS/view_cache_stats.py'
 # alias stests-chain-set-contracts='_exec_cmd $STESTS_PATH_SH_SCRIPTS/chain_set_contracts.py'                       # TODO: reinstate when client is updated
 alias stests-cache-set-bonding-key='_exec_cmd $STESTS_PATH_SH_SCRIPTS/cache_set_bonding_key.py'
 alias stests-cache-set-faucet-key='_exec_cmd $STESTS_PATH_SH_SCRIPTS/cache_set_faucet_key.py'
@@ -117,6 +125,8 @@ alias stests-view-validator-account-keys='_exec_cmd $STESTS_PATH_SH_SCRIPTS/view
 # Views #6: generator information.
 alias stests-view-run='_exec_cmd $STESTS_PATH_SH_SCRIPTS/view_run.py'
 alias stests-view-run-deploys='_exec_cmd $STESTS_PATH_SH_SCRIPTS/view_run_deploys.py'
+alias stests-view-run-deploy-sizes='_exec_cmd $STESTS_PATH_SH_SCRIPTS/view_cache_codec_sizes.py'
+alias stests-view-run-dispatch-rate='_exec_cmd $STESTS_PATH_SH_SCRIPTS/view_run_dispatch_rate.py'
 alias stests-view-runs='_exec_cmd $STESTS_PATH_SH_SCRIPTS/view_runs.py'
 
 # ###############################################################
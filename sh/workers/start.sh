@@ -41,6 +41,8 @@ function main()
 	# Launch daemon.
 	log "workers :: supervisord launching ..."
 	pushd $STESTS_HOME
+	export STESTS_WORKERS_ORCHESTRATION_QUEUES=$(pipenv run python3 $STESTS_PATH_SH_SCRIPTS/mq_view_queues.py ORCHESTRATION)
+	export STESTS_WORKERS_DISPATCH_QUEUES=$(pipenv run python3 $STESTS_PATH_SH_SCRIPTS/mq_view_queues.py DISPATCH)
 	pipenv run supervisord -c $STESTS_PATH_OPS/config/supervisord.conf
 	popd -1
 	log "workers :: supervisord launched"
@@ -1,4 +1,9 @@
+import stests.core.cache.aio as aio
+import stests.core.cache.local as local
 import stests.core.cache.ops.infra as infra
 import stests.core.cache.ops.monitoring as monitoring
 import stests.core.cache.ops.orchestration as orchestration
 import stests.core.cache.ops.state as state
+import stests.core.cache.retention as retention
+from stests.core.cache.ops.utils import cache_batch as batch
+from stests.core.cache.ops.utils import cache_read_only as read_only
@@ -0,0 +1,43 @@
+import asyncio
+import functools
+import inspect
+import types
+import typing
+
+from stests.core.cache.ops import infra as _infra
+from stests.core.cache.ops import monitoring as _monitoring
+from stests.core.cache.ops import orchestration as _orchestration
+from stests.core.cache.ops import state as _state
+
+
+
+def _get_awaitable(func: typing.Callable) -> typing.Callable:
+    """Returns an awaitable flavour of a cache function - composite functions are run within a worker thread.
+
+    """
+    if hasattr(func, "aio"):
+        return func.aio
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    return wrapper
+
+
+def _get_namespace(module: types.ModuleType) -> types.SimpleNamespace:
+    """Returns a namespace exposing awaitable flavours of a cache module's public functions.
+
+    """
+    return types.SimpleNamespace(**{
+        name: _get_awaitable(func)
+        for name, func in inspect.getmembers(module, inspect.isfunction)
+        if not name.startswith("_") and func.__module__ == module.__name__
+    })
+
+
+# Awaitable cache functions - mirror synchronous cache modules.
+infra = _get_namespace(_infra)
+monitoring = _get_namespace(_monitoring)
+orchestration = _get_namespace(_orchestration)
+state = _get_namespace(_state)
@@ -0,0 +1,193 @@
+import dataclasses
+import json
+import typing
+import zlib
+
+from stests.core.utils import encoder
+from stests.core.utils import env
+from stests.core.utils.exceptions import InvalidEnvironmentVariable
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Codec applied when encaching values.
+    TYPE = env.get_var("CACHE_CODEC", "JSON")
+
+    # Size (in bytes) above which compact values are compressed.
+    ZLIB_THRESHOLD = env.get_var("CACHE_CODEC_ZLIB_THRESHOLD", 1024, int)
+
+
+# Version tag: compact encoding.
+_TAG_COMPACT = b"\x01"
+
+# Version tag: compact encoding + zlib compression.
+_TAG_COMPACT_ZLIB = b"\x02"
+
+# Key under which a compacted data class is emitted, i.e. {"~": [type id, field value 1, ... field value N]}.
+_DCLASS_KEY = "~"
+
+
+class _Schemas():
+    """Positional schemas of registered data classes.
+
+    """
+    def __init__(self):
+        self.ids = dict()
+        self.types = dict()
+        self.size = 0
+
+    def refresh(self):
+        """Rebuilds schemas whenever the encoder's set of registered data classes is extended.
+
+        """
+        if self.size == len(encoder.DCLASS_MAP):
+            return
+
+        ids, types = dict(), dict()
+        for type_key, dcls in encoder.DCLASS_MAP.items():
+            if not dataclasses.is_dataclass(dcls):
+                continue
+            type_id = zlib.crc32(type_key.encode("utf-8")) & 0xFFFFFF
+            if type_id in types:
+                raise ValueError(f"Codec type id collision: {type_key} :: {types[type_id][0]}")
+            fields = tuple(i.name for i in dataclasses.fields(dcls))
+            ids[type_key] = type_id
+            types[type_id] = (type_key, fields)
+
+        self.ids, self.types, self.size = ids, types, len(encoder.DCLASS_MAP)
+
+
+# Process wide data class schemas.
+_SCHEMAS = _Schemas()
+
+
+def decode(value: typing.Union[bytes, str]) -> typing.Any:
+    """Decodes a cached value irrespective of the codec with which it was encoded.
+
+    :param value: Value pulled from cache.
+    :returns: Decoded domain object(s).
+
+    """
+    if value is None:
+        return None
+
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+
+    tag = value[:1]
+    if tag == _TAG_COMPACT:
+        return encoder.decode(_expand(json.loads(value[1:])))
+
+    if tag == _TAG_COMPACT_ZLIB:
+        return encoder.decode(_expand(json.loads(zlib.decompress(value[1:]))))
+
+    # Untagged values were encoded as JSON.
+    return encoder.decode(json.loads(value))
+
+
+def encode(data: typing.Any, codec_type: str = None) -> bytes:
+    """Encodes a domain object(s) in readiness for encaching.
+
+    :param data: Domain object(s) to be encached.
+    :param codec_type: Type of codec to apply - defaults to that set via environment.
+    :returns: Encoded value.
+
+    """
+    codec_type = codec_type or EnvVars.TYPE
+    try:
+        codec = CODECS[codec_type]
+    except KeyError:
+        raise InvalidEnvironmentVariable("CACHE_CODEC", codec_type, CODECS)
+
+    return codec(data)
+
+
+def encode_compact(data: typing.Any, zlib_threshold: int = None) -> bytes:
+    """Encodes a domain object(s) as whitespace free JSON with data classes emitted positionally.
+
+    :param data: Domain object(s) to be encached.
+    :param zlib_threshold: Size (in bytes) above which encoded value is compressed.
+    :returns: Version tagged encoded value.
+
+    """
+    zlib_threshold = EnvVars.ZLIB_THRESHOLD if zlib_threshold is None else zlib_threshold
+    value = json.dumps(_compact(encoder.encode(data)), separators=(",", ":")).encode("utf-8")
+    if zlib_threshold and len(value) > zlib_threshold:
+        return _TAG_COMPACT_ZLIB + zlib.compress(value)
+
+    return _TAG_COMPACT + value
+
+
+def encode_json(data: typing.Any) -> bytes:
+    """Encodes a domain object(s) as indented JSON - i.e. the original untagged cache value format.
+
+    :param data: Domain object(s) to be encached.
+    :returns: Encoded value.
+
+    """
+    return json.dumps(encoder.encode(data), indent=4).encode("utf-8")
+
+
+def get_sizes(data: typing.Any) -> typing.Dict[str, int]:
+    """Returns size (in bytes) of a domain object(s) when encoded by each supported codec.
+
+    :param data: Domain object(s) to be measured.
+    :returns: Map: codec type -> encoded size.
+
+    """
+    return {
+        "JSON": len(encode_json(data)),
+        "COMPACT": len(encode_compact(data, zlib_threshold=0)),
+        "COMPACT_ZLIB": len(encode_compact(data, zlib_threshold=1)),
+    }
+
+
+def _compact(obj: typing.Any) -> typing.Any:
+    """Replaces encoded data classes with positional equivalents.
+
+    """
+    if isinstance(obj, dict) and '_type_key' in obj:
+        _SCHEMAS.refresh()
+        type_id = _SCHEMAS.ids[obj['_type_key']]
+        _, fields = _SCHEMAS.types[type_id]
+        return {_DCLASS_KEY: [type_id] + [_compact(obj.get(i)) for i in fields]}
+
+    if isinstance(obj, dict):
+        return {k: _compact(v) for k, v in obj.items()}
+
+    if isinstance(obj, (tuple, list)):
+        return [_compact(i) for i in obj]
+
+    return obj
+
+
+def _expand(obj: typing.Any) -> typing.Any:
+    """Replaces positional data classes with encoded equivalents.
+
+    """
+    if isinstance(obj, dict) and _DCLASS_KEY in obj:
+        _SCHEMAS.refresh()
+        type_id, values = obj[_DCLASS_KEY][0], obj[_DCLASS_KEY][1:]
+        try:
+            type_key, fields = _SCHEMAS.types[type_id]
+        except KeyError:
+            raise ValueError(f"Codec type id unrecognized: {type_id}")
+        expanded = {k: _expand(v) for k, v in zip(fields, values)}
+        expanded['_type_key'] = type_key
+        return expanded
+
+    if isinstance(obj, dict):
+        return {k: _expand(v) for k, v in obj.items()}
+
+    if isinstance(obj, list):
+        return [_expand(i) for i in obj]
+
+    return obj
+
+
+# Map: codec type -> encoding function.
+CODECS = {
+    "COMPACT": encode_compact,
+    "JSON": encode_json,
+}
@@ -0,0 +1,221 @@
+import collections
+import os
+import threading
+import time
+import typing
+import uuid
+
+from stests.core.cache.model import StoreOperation
+from stests.core.cache.model import StorePartition
+from stests.core.cache import stores
+from stests.core.utils import env
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Max. number of items held in process local cache.
+    MAX_ITEMS = env.get_var("CACHE_LOCAL_MAX_ITEMS", 1024, int)
+
+    # Time (in seconds) after which a process local item is considered stale - 0 disables process local caching.
+    TTL = env.get_var("CACHE_LOCAL_TTL", 60, int)
+
+
+# Set of partitions whose reads are cached within process.
+PARTITIONS = {
+    StorePartition.INFRA,
+}
+
+# Set of operations whose results are cached within process.
+READ_OPERATIONS = {
+    StoreOperation.GET_COUNT,
+    StoreOperation.GET_MANY,
+    StoreOperation.GET_ONE,
+    StoreOperation.GET_ONE_BY_INDEX,
+    StoreOperation.GET_ONE_FROM_MANY,
+}
+
+# Set of operations that invalidate process local caches.
+WRITE_OPERATIONS = {
+    StoreOperation.COUNTER_DECR,
+    StoreOperation.COUNTER_INCR,
+    StoreOperation.DELETE_INDEX,
+    StoreOperation.DELETE_MANY,
+    StoreOperation.DELETE_ONE,
+    StoreOperation.DELETE_RUN,
+    StoreOperation.EVAL_SCRIPT,
+    StoreOperation.SET_INDEX,
+    StoreOperation.SET_ONE,
+    StoreOperation.SET_ONE_SINGLETON,
+}
+
+# Channel over which invalidation notifications are published.
+_CHANNEL_PREFIX = "stests:cache:invalidate"
+
+
+class _LocalCache():
+    """A process local TTL/LRU cache of decoded cache reads.
+
+    """
+    def __init__(self):
+        self.items = collections.OrderedDict()
+        self.lock = threading.Lock()
+        self.origin = uuid.uuid4().hex
+        self.pid = os.getpid()
+        self.stats = self.get_stats_zeroed()
+        self.subscriptions = dict()
+
+    @staticmethod
+    def get_stats_zeroed() -> typing.Dict[str, int]:
+        """Returns initial statistics.
+
+        """
+        return {
+            "evictions": 0,
+            "expirations": 0,
+            "hits": 0,
+            "invalidations": 0,
+            "misses": 0,
+        }
+
+    def reset_on_fork(self):
+        """Discards state inherited from a parent process.
+
+        """
+        if self.pid == os.getpid():
+            return
+        with self.lock:
+            if self.pid != os.getpid():
+                self.items = collections.OrderedDict()
+                self.origin = uuid.uuid4().hex
+                self.pid = os.getpid()
+                self.stats = self.get_stats_zeroed()
+                self.subscriptions = dict()
+
+
+# Process local cache.
+_CACHE = _LocalCache()
+
+
+def get_item(partition: StorePartition, operation: StoreOperation, obj: typing.Any) -> typing.Tuple[bool, typing.Any]:
+    """Returns a previously cached read.
+
+    Note: cached domain objects are shared within a process, callers that mutate them must re-encache them.
+
+    :param partition: Cache partition to which operation pertains.
+    :param operation: Cache operation being applied.
+    :param obj: Key to which operation is being applied.
+
+    :returns: 2 member tuple -> (was found flag, cached value).
+
+    """
+    _CACHE.reset_on_fork()
+    key = _get_key(partition, operation, obj)
+    with _CACHE.lock:
+        try:
+            expiry, value = _CACHE.items[key]
+        except KeyError:
+            _CACHE.stats["misses"] += 1
+            return False, None
+
+        if expiry < time.monotonic():
+            del _CACHE.items[key]
+            _CACHE.stats["expirations"] += 1
+            _CACHE.stats["misses"] += 1
+            return False, None
+
+        _CACHE.items.move_to_end(key)
+        _CACHE.stats["hits"] += 1
+
+    return True, value
+
+
+def get_stats() -> typing.Dict[str, int]:
+    """Returns process local cache statistics.
+
+    :returns: Map: statistic -> value.
+
+    """
+    _CACHE.reset_on_fork()
+    with _CACHE.lock:
+        return {**_CACHE.stats, "items": len(_CACHE.items)}
+
+
+def invalidate(partition: StorePartition, notify: bool = True):
+    """Invalidates process local reads of a partition, and if required, notifies other processes to do likewise.
+
+    :param partition: Cache partition to be invalidated.
+    :param notify: Flag indicating whether other processes will be notified.
+
+    """
+    _CACHE.reset_on_fork()
+    with _CACHE.lock:
+        for key in [i for i in _CACHE.items if i[0] == partition]:
+            del _CACHE.items[key]
+        _CACHE.stats["invalidations"] += 1
+
+    if notify:
+        with stores.get_store(partition) as store:
+            store.publish(_get_channel(partition), _CACHE.origin)
+
+
+def is_enabled(partition: StorePartition) -> bool:
+    """Returns flag indicating whether reads from a partition are cached within process.
+
+    :param partition: Cache partition to which operation pertains.
+
+    """
+    return EnvVars.TTL > 0 and partition in PARTITIONS
+
+
+def set_item(partition: StorePartition, operation: StoreOperation, obj: typing.Any, value: typing.Any):
+    """Caches a read.
+
+    :param partition: Cache partition to which operation pertains.
+    :param operation: Cache operation being applied.
+    :param obj: Key to which operation was applied.
+    :param value: Decoded read.
+
+    """
+    _CACHE.reset_on_fork()
+    if partition not in _CACHE.subscriptions:
+        _subscribe(partition)
+
+    key = _get_key(partition, operation, obj)
+    with _CACHE.lock:
+        _CACHE.items[key] = (time.monotonic() + EnvVars.TTL, value)
+        _CACHE.items.move_to_end(key)
+        while len(_CACHE.items) > EnvVars.MAX_ITEMS:
+            _CACHE.items.popitem(last=False)
+            _CACHE.stats["evictions"] += 1
+
+
+def _get_channel(partition: StorePartition) -> str:
+    """Returns name of channel over which a partition's invalidation notifications are published.
+
+    """
+    return f"{_CHANNEL_PREFIX}:{partition.name}"
+
+
+def _get_key(partition: StorePartition, operation: StoreOperation, obj: typing.Any) -> typing.Tuple:
+    """Returns key under which a read is cached.
+
+    """
+    return partition, operation, obj.key, getattr(obj, "field", None)
+
+
+def _subscribe(partition: StorePartition):
+    """Listens in a background thread for invalidation notifications issued by other processes.
+
+    """
+    with _CACHE.lock:
+        if partition in _CACHE.subscriptions:
+            return
+
+        def _on_message(message):
+            if message["data"] != _CACHE.origin.encode("utf-8"):
+                invalidate(partition, notify=False)
+
+        pubsub = stores.get_store(partition).pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{_get_channel(partition): _on_message})
+        _CACHE.subscriptions[partition] = pubsub.run_in_thread(sleep_time=1.0, daemon=True)
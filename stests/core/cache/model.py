@@ -1,76 +1,328 @@
 import enum
-import json
+import itertools
 import os
 import pwd
+import string
+import threading
 import typing
 
-from stests.core.utils import encoder
+from stests.core.cache import codec
 
 
 
 # Some partitions require that the OS user account name is prefixed to all keys within the partition.
 _OS_USER = pwd.getpwuid(os.getuid())[0]
 
+# Name of set within which keys cached during the course of a run are registered.
+RUN_KEYS = "run-keys"
+
+# Delimiter between the key of a sharded counter & the index of one of it's shards.
+SHARD_DELIMITER = "~"
+
+# Thread local holder of ordinal by which a worker selects the counter shards to which it writes.
+_WORKER = threading.local()
+
+# Source of worker ordinals - offset by process id so that workers of different processes are spread.
+_WORKER_ORDINALS = itertools.count()
+
+
+class KeyPath(list):
+    """Paths of a key alongside their joined form & the key of the run key set within which a run scoped key is registered.
+    
+    """
+    __slots__ = ("path", "run_keys_key")
+
+
+class KeyTemplate():
+    """A key schema declared once per collection & compiled into a formatter.
+
+    Schemas are colon delimited paths whose fields are formatted as per str.format, e.g.
+    "{network}:{run_type}:R-{run_index:03}:{collection}".  Constants are bound upon compilation,
+    formatting then requires a single pass over the remaining fields.
+
+    """
+    def __init__(self, schema: str, **constants: typing.Any):
+        self.schema = schema
+        self.fields, self.format = _compile_key_template(schema, constants)
+
 
 class ItemKey():
     """A key of an encached item.
+
+    Counters may be sharded, i.e. spread over N keys each written to by a subset of workers & summed upon read.
+    Shard 0 is the unsharded key itself, further shards are suffixed with their index, e.g. "...:deploy-count:-~3".
+    Counters held within collection hashes are not sharded.
     
     """
-    def __init__(self, paths: typing.List[str], names: typing.List[str]):
-        path = ":".join([str(i) for i in paths])
-        name = ".".join([str(i) for i in names])
-        self.key = f"{path}:{name}"
+    def __init__(self, paths: typing.List[str], names: typing.List[str], shards: int = 1):
+        self.paths = get_key_path(paths)
+        self.path = self.paths.path
+        self.name = ".".join([str(i) for i in names])
+        self.key = f"{self.path}:{self.name}"
+        self.run_keys_key = self.paths.run_keys_key
+        self.shards = shards
+
+    @property
+    def shard_key(self) -> str:
+        """Key of counter shard to which the calling worker writes - chosen by process & thread.
+
+        """
+        if self.shards == 1:
+            return self.key
+
+        return get_shard_key(self.key, _get_worker_ordinal() % self.shards)
+
+    @property
+    def shard_keys(self) -> typing.List[str]:
+        """Keys of all counter shards.
+
+        """
+        return [get_shard_key(self.key, i) for i in range(self.shards)]
     
     def apply_key_prefix(self):
         self.key = f"{_OS_USER}:{self.key}"
+        self.path = f"{_OS_USER}:{self.path}"
+        if self.run_keys_key is not None:
+            self.run_keys_key = f"{_OS_USER}:{self.run_keys_key}"
+
+    def apply_key_hash_tag(self, namespace: str):
+        self.key = get_hash_tagged_key(namespace, self.key, self.paths)
+        self.path = get_hash_tagged_key(namespace, self.path, self.paths)
+        if self.run_keys_key is not None:
+            self.run_keys_key = get_hash_tagged_key(namespace, self.run_keys_key, self.paths)
+
+
+class IndexKey():
+    """A key of a secondary index entry, i.e. a field within a hash mapping an attribute value to an item key.
+    
+    """
+    def __init__(self, paths: typing.List[str], field: str):
+        self.paths = get_key_path(paths)
+        self.key = self.paths.path
+        self.field = str(field)
+        self.run_keys_key = self.paths.run_keys_key
+
+    def apply_key_prefix(self):
+        self.key = f"{_OS_USER}:{self.key}"
+        if self.run_keys_key is not None:
+            self.run_keys_key = f"{_OS_USER}:{self.run_keys_key}"
+
+    def apply_key_hash_tag(self, namespace: str):
+        self.key = get_hash_tagged_key(namespace, self.key, self.paths)
+        if self.run_keys_key is not None:
+            self.run_keys_key = get_hash_tagged_key(namespace, self.run_keys_key, self.paths)
+
+
+class IndexPruneKey():
+    """A key used to prune entries from an index - pruned fields are those held within a scoped sub-index.
+    
+    """
+    def __init__(self, paths: typing.List[str], scope_paths: typing.List[str]):
+        self.paths = get_key_path(paths)
+        self.scope_paths = get_key_path(scope_paths)
+        self.key = self.paths.path
+        self.scope_key = self.scope_paths.path
+
+    def apply_key_prefix(self):
+        self.key = f"{_OS_USER}:{self.key}"
+        self.scope_key = f"{_OS_USER}:{self.scope_key}"
+
+    def apply_key_hash_tag(self, namespace: str):
+        self.key = get_hash_tagged_key(namespace, self.key, self.paths)
+        self.scope_key = get_hash_tagged_key(namespace, self.scope_key, self.scope_paths)
+
+
+class TimeIndexKey():
+    """A key of a time ordered index entry, i.e. a member within a sorted set scored by timestamp mapping to an item key.
+    
+    """
+    def __init__(self, paths: typing.List[str], timestamp: float, remove: bool = False):
+        self.paths = get_key_path(paths)
+        self.key = self.paths.path
+        self.timestamp = timestamp
+        self.remove = remove
+        self.run_keys_key = self.paths.run_keys_key
+
+    def apply_key_prefix(self):
+        self.key = f"{_OS_USER}:{self.key}"
+        if self.run_keys_key is not None:
+            self.run_keys_key = f"{_OS_USER}:{self.run_keys_key}"
+
+    def apply_key_hash_tag(self, namespace: str):
+        self.key = get_hash_tagged_key(namespace, self.key, self.paths)
+        if self.run_keys_key is not None:
+            self.run_keys_key = get_hash_tagged_key(namespace, self.run_keys_key, self.paths)
 
 
 class Item():
     """An item to be encached alongside it's key.
     
     """
-    def __init__(self, item_key: ItemKey, data: typing.Any, expiration: int = None):
+    def __init__(
+        self,
+        item_key: ItemKey,
+        data: typing.Any,
+        expiration: int = None,
+        indexes: typing.List[typing.Union[IndexKey, TimeIndexKey]] = None,
+        codec_type: str = None,
+        ):
         self.key = item_key.key
+        self.name = item_key.name
+        self.path = item_key.path
+        self.paths = item_key.paths
+        self.run_keys_key = item_key.run_keys_key
         self.data = data
         self.expiration = expiration
+        self.indexes = indexes or []
+        self.codec_type = codec_type
 
     @property
-    def data_as_json(self):
-        return json.dumps(encoder.encode(self.data), indent=4)
+    def data_encoded(self) -> bytes:
+        return codec.encode(self.data, self.codec_type)
 
     def apply_key_prefix(self):
         self.key = f"{_OS_USER}:{self.key}"
+        self.path = f"{_OS_USER}:{self.path}"
+        if self.run_keys_key is not None:
+            self.run_keys_key = f"{_OS_USER}:{self.run_keys_key}"
+        for index in self.indexes:
+            index.apply_key_prefix()
+
+    def apply_key_hash_tag(self, namespace: str):
+        self.key = get_hash_tagged_key(namespace, self.key, self.paths)
+        self.path = get_hash_tagged_key(namespace, self.path, self.paths)
+        if self.run_keys_key is not None:
+            self.run_keys_key = get_hash_tagged_key(namespace, self.run_keys_key, self.paths)
+        for index in self.indexes:
+            index.apply_key_hash_tag(namespace)
 
 
 class CountDecrementKey(ItemKey):
     """A key used to decrement a counter.
     
     """
-    def __init__(self, paths: typing.List[str], names: typing.List[str], amount: int):
-        super().__init__(paths, names)
+    def __init__(self, paths: typing.List[str], names: typing.List[str], amount: int, shards: int = 1):
+        super().__init__(paths, names, shards)
         self.amount = amount
 
 
 class CountIncrementKey(ItemKey):
-    """A key used to increment a counter.
+    """A key used to increment a counter - a sharded counter is incremented via the calling worker's shard.
     
     """
-    def __init__(self, paths: typing.List[str], names: typing.List[str], amount: int):
-        super().__init__(paths, names)
+    def __init__(self, paths: typing.List[str], names: typing.List[str], amount: int, shards: int = 1):
+        super().__init__(paths, names, shards)
         self.amount = amount
         
 
+class RunPruneKey():
+    """A key used to prune keys registered during the course of a run - optionally restricted to those matching a pattern.
+    
+    """
+    def __init__(self, paths: typing.List[str], match_paths: typing.List[str] = None):
+        self.paths = get_key_path(paths)
+        self.key = f"{self.paths.path}:{RUN_KEYS}"
+        self.match_paths = None if match_paths is None else get_key_path(match_paths)
+        self.match = None if match_paths is None else f"{self.match_paths.path}*"
+        # Pattern matching run's keys when a run has no key set, i.e. was cached prior to key set registration.
+        self.scan_match = f"{self.paths.path}:*" if match_paths is None else self.match
+
+    def apply_key_prefix(self):
+        self.key = f"{_OS_USER}:{self.key}"
+        self.scan_match = f"{_OS_USER}:{self.scan_match}"
+        if self.match is not None:
+            self.match = f"{_OS_USER}:{self.match}"
+
+    def apply_key_hash_tag(self, namespace: str):
+        self.key = get_hash_tagged_key(namespace, self.key, self.paths)
+        self.scan_match = get_hash_tagged_key(namespace, self.scan_match, self.paths if self.match is None else self.match_paths)
+        if self.match is not None:
+            self.match = get_hash_tagged_key(namespace, self.match, self.match_paths)
+
+
+class ScriptKey():
+    """A key used to invoke a server side script.
+    
+    """
+    def __init__(
+        self,
+        script: str,
+        item_keys: typing.List[ItemKey],
+        args: typing.List[typing.Any] = None,
+        register_keys: bool = False,
+        ):
+        self.script = script
+        self.item_keys = item_keys
+        self.args = args or []
+        self.register_keys = register_keys
+
+    @property
+    def key(self) -> str:
+        return self.item_keys[0].key
+
+    @property
+    def keys(self) -> typing.List[str]:
+        # Scripts that create run scoped keys are passed the run's key set as final key.
+        if self.register_keys:
+            return [i.shard_key for i in self.item_keys] + [self.item_keys[0].run_keys_key]
+
+        return [i.shard_key for i in self.item_keys]
+
+    def apply_key_prefix(self):
+        for item_key in self.item_keys:
+            item_key.apply_key_prefix()
+
+    def apply_key_hash_tag(self, namespace: str):
+        for item_key in self.item_keys:
+            item_key.apply_key_hash_tag(namespace)
+
+
 class SearchKey():
     """A key used to perform a cache search.
     
     """
     def __init__(self, paths: typing.List[str], wildcard="*"):
-        path = ':'.join([str(i) for i in paths])
-        self.key = f"{path}{wildcard}"
+        self.paths = get_key_path(paths)
+        self.path = self.paths.path
+        self.wildcard = wildcard
+        self.key = f"{self.path}{wildcard}"
+
+    def apply_key_prefix(self):
+        self.key = f"{_OS_USER}:{self.key}"
+        self.path = f"{_OS_USER}:{self.path}"
+
+    def apply_key_hash_tag(self, namespace: str):
+        self.key = get_hash_tagged_key(namespace, self.key, self.paths)
+        self.path = get_hash_tagged_key(namespace, self.path, self.paths)
+
+
+class TimeRangeKey():
+    """A key used to query a time ordered index - optionally windowed by timestamp & paginated.
+    
+    """
+    def __init__(
+        self,
+        paths: typing.List[str],
+        ts_from: float = None,
+        ts_to: float = None,
+        offset: int = 0,
+        limit: int = None,
+        reverse: bool = False,
+        ):
+        self.paths = get_key_path(paths)
+        self.key = self.paths.path
+        self.score_min = "-inf" if ts_from is None else ts_from
+        self.score_max = "+inf" if ts_to is None else ts_to
+        self.offset = offset
+        self.limit = limit
+        self.reverse = reverse
 
     def apply_key_prefix(self):
         self.key = f"{_OS_USER}:{self.key}"
 
+    def apply_key_hash_tag(self, namespace: str):
+        self.key = get_hash_tagged_key(namespace, self.key, self.paths)
+
 
 class StoreOperation(enum.Enum):
     """Enumeration over types of cache operation.
@@ -87,7 +339,16 @@ class StoreOperation(enum.Enum):
 
     # Flush a key set.
     DELETE_MANY = enum.auto()
+
+    # Prune entries from a secondary index.
+    DELETE_INDEX = enum.auto()
+
+    # Prune keys registered during the course of a run.
+    DELETE_RUN = enum.auto()
     
+    # Evaluate a server side script.
+    EVAL_SCRIPT = enum.auto()
+
     # Get count of matched cache item.
     GET_COUNT = enum.auto()
 
@@ -97,16 +358,31 @@ class StoreOperation(enum.Enum):
     # Get value of many cached counters.
     GET_COUNTER_MANY = enum.auto()
 
+    # Get values of a set of counters held within a hash.
+    GET_COUNTERS = enum.auto()
+
     # Get a single cached item.
     GET_ONE = enum.auto()
 
+    # Get a single cached item by resolving it's key from a secondary index.
+    GET_ONE_BY_INDEX = enum.auto()
+
     # Get a single cached item from a collection.
     GET_ONE_FROM_MANY = enum.auto()
 
     # Get a collection of cached items.
     GET_MANY = enum.auto()
 
-    # Set an item.
+    # Get a collection of cached items as a lazily evaluated stream.
+    GET_MANY_STREAM = enum.auto()
+
+    # Get a collection of cached items by resolving their keys from a time ordered index.
+    GET_MANY_BY_TIME = enum.auto()
+
+    # Set secondary index entries of an item.
+    SET_INDEX = enum.auto()
+
+    # Set an item (plus associated secondary index entries).
     SET_ONE = enum.auto()
 
     # Set cached item plus flag indicating whether it already was cached.
@@ -134,3 +410,127 @@ class StorePartition(enum.Enum):
 
     # Workflow state
     WORKFLOW = enum.auto()
+
+
+def get_hash_tagged_key(namespace: str, key: str, paths: typing.List[str]) -> str:
+    """Returns a key (or search pattern) qualified for use within a sharded store.
+
+    Keys are namespaced by partition.  Run scoped keys, i.e. those whose 3rd path is a run index, are
+    also hash tagged by network:run-type:run-index so that a run's keys are colocated upon a single slot.
+
+    :param namespace: Namespace of partition to which key pertains.
+    :param key: Key (or search pattern) to be qualified.
+    :param paths: Paths from which key was derived.
+
+    :returns: A namespaced, and if run scoped, hash tagged key.
+
+    """
+    if len(paths) >= 3 and (paths[2].startswith("R-") or paths[2] == "*"):
+        scope = ":".join(paths[:3])
+        idx = key.find(scope)
+        key = f"{key[:idx]}{{{scope}}}{key[idx + len(scope):]}"
+
+    return f"{namespace}:{key}"
+
+
+def get_shard_key(key: str, index: int) -> str:
+    """Returns key of a counter shard.
+
+    :param key: Key of a sharded counter.
+    :param index: Index of a shard.
+
+    :returns: Key of shard - shard 0 being the counter key itself.
+
+    """
+    return key if index == 0 else f"{key}{SHARD_DELIMITER}{index}"
+
+
+def get_key_path(paths: typing.List[typing.Any]) -> KeyPath:
+    """Returns paths of a key - paths formatted from a key template are returned as is.
+
+    :param paths: Paths from which key is derived.
+
+    :returns: Key paths alongside their joined form.
+
+    """
+    if isinstance(paths, KeyPath):
+        return paths
+
+    key_path = KeyPath([str(i) for i in paths])
+    key_path.path = ":".join(key_path)
+    key_path.run_keys_key = get_run_keys_key(key_path)
+
+    return key_path
+
+
+def get_run_keys_key(paths: typing.List[str]) -> typing.Optional[str]:
+    """Returns key of set within which a run scoped key is registered so that a run can be pruned without scanning.
+
+    :param paths: Paths from which key was derived.
+
+    :returns: Key of a run's key set - None if key is not run scoped.
+
+    """
+    if len(paths) >= 3 and paths[2].startswith("R-") and "*" not in paths[2]:
+        return ":".join(paths[:3] + [RUN_KEYS])
+
+
+def _compile_key_template(schema: str, constants: typing.Dict[str, typing.Any]) -> typing.Tuple[typing.List[str], typing.Callable]:
+    """Compiles a key schema into a formatter accepting the schema's unbound fields as keyword arguments.
+
+    """
+    # Map schema onto paths, i.e. lists of format string fragments - constants are formatted upon compilation.
+    formatter = string.Formatter()
+    fields, paths = [], [[]]
+    for literal, field, spec, conversion in formatter.parse(schema):
+        for idx, text in enumerate(literal.split(":")):
+            if idx > 0:
+                paths.append([])
+            paths[-1].append((_escape(text), False))
+        if field is None:
+            continue
+        if not field.isidentifier():
+            raise ValueError(f"Invalid key template field: {field}")
+        if field in constants:
+            value = formatter.format_field(formatter.convert_field(constants[field], conversion), spec)
+            paths[-1].append((_escape(value), False))
+        else:
+            if field not in fields:
+                fields.append(field)
+            paths[-1].append((f"{{{field}{'!' + conversion if conversion else ''}{':' + spec if spec else ''}}}", True))
+
+    # Pre-split paths into format strings - constant paths are folded, i.e. formatted upon compilation.
+    formats = []
+    for parts in paths:
+        path = "".join(i for i, _ in parts)
+        if any(is_field for _, is_field in parts):
+            formats.append((path, True))
+        else:
+            formats.append((path.format_map({}), False))
+
+    def _format(**kwargs) -> KeyPath:
+        key_path = KeyPath([path.format_map(kwargs) if is_field else path for path, is_field in formats])
+        key_path.path = ":".join(key_path)
+        key_path.run_keys_key = get_run_keys_key(key_path)
+
+        return key_path
+
+    return fields, _format
+
+
+def _escape(text: str) -> str:
+    """Returns text escaped for inclusion within a format string.
+
+    """
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def _get_worker_ordinal() -> int:
+    """Returns ordinal of calling worker (i.e. thread) - assigned upon first use.
+
+    """
+    try:
+        return _WORKER.ordinal
+    except AttributeError:
+        _WORKER.ordinal = os.getpid() + next(_WORKER_ORDINALS)
+        return _WORKER.ordinal
@@ -8,6 +8,7 @@ from stests.core.cache.model import SearchKey
 from stests.core.cache.model import StoreOperation
 from stests.core.cache.model import StorePartition
 from stests.core.cache.ops.utils import cache_op
+from stests.core.cache.ops.utils import register_hash_collections
 from stests.core.types.chain import ContractType
 from stests.core.types.chain import NamedKey
 from stests.core.types.infra import Network
@@ -26,6 +27,12 @@ COL_NAMED_KEY = "named-key"
 COL_NETWORK = "network"
 COL_NODE = "node"
 
+# Collections stored as hashes when operating in collection hash mode.
+register_hash_collections(_PARTITION, {
+    COL_NAMED_KEY,
+    COL_NODE,
+})
+
 
 @cache_op(_PARTITION, StoreOperation.GET_ONE_FROM_MANY)
 def get_named_key(network: str, contract_type: ContractType, name: str) -> ItemKey:
@@ -1,20 +1,33 @@
+import bisect
 import random
 import typing
+from datetime import datetime
 
 from stests.core import factory
 from stests.core.cache.model import CountIncrementKey
 from stests.core.cache.model import Item
 from stests.core.cache.model import ItemKey
+from stests.core.cache.model import KeyTemplate
+from stests.core.cache.model import RunPruneKey
+from stests.core.cache.model import ScriptKey
 from stests.core.cache.model import SearchKey
 from stests.core.cache.model import StoreOperation
 from stests.core.cache.model import StorePartition
+from stests.core.cache.model import TimeIndexKey
+from stests.core.cache.model import TimeRangeKey
+from stests.core.cache.ops.utils import cache_batch
 from stests.core.cache.ops.utils import cache_op
+from stests.core.cache.ops.utils import EnvVars
+from stests.core.cache import retention
+from stests.core.cache import scripts
+from stests.core.types.chain import Deploy
 from stests.core.types.infra import NetworkIdentifier
 from stests.core.types.orchestration import ExecutionAspect
 from stests.core.types.orchestration import ExecutionContext
 from stests.core.types.orchestration import ExecutionInfo
 from stests.core.types.orchestration import ExecutionLock
 from stests.core.types.orchestration import ExecutionStatus
+from stests.core.types.orchestration import ExecutionSummary
 import stests.core.cache.ops.infra as infra
 
 
@@ -25,55 +38,129 @@ _PARTITION = StorePartition.ORCHESTRATION
 # Cache collections.
 COL_CONTEXT = "context"
 COL_DEPLOY_COUNT = "deploy-count"
+COL_DISPATCH_TOKENS = "dispatch-tokens"
+COL_FINALISATION_STATS = "finalisation-stats"
 COL_GENERATOR_RUN_COUNT = "generator-run-count"
 COL_INFO = "info"
 COL_LOCK = "lock"
+COL_SUMMARY = "summary"
+COL_SUMMARY_RETAINED_INDEX = "index-summary-retained"
 
-# Cache collection item expiration times.
-EXPIRATION_COL_CONTEXT = 3600
-EXPIRATION_COL_INFO = 3600
+# Cache key templates.
+_KEY_DEPLOY_COUNT = KeyTemplate("{network}:{run_type}:R-{run_index:03}:{collection}", collection=COL_DEPLOY_COUNT)
+_KEY_DISPATCH_TOKENS = KeyTemplate("{network}:{run_type}:R-{run_index:03}:{collection}", collection=COL_DISPATCH_TOKENS)
+_KEY_FINALISATION_STATS = KeyTemplate("{network}:{run_type}:R-{run_index:03}:{collection}", collection=COL_FINALISATION_STATS)
+_KEY_INFO = KeyTemplate("{network}:{run_type}:R-{run_index:03}:{collection}", collection=COL_INFO)
+_KEY_LOCK = KeyTemplate("{network}:{run_type}:R-{run_index:03}:{collection}", collection=COL_LOCK)
+_KEY_RUN = KeyTemplate("{network}:{run_type}:R-{run_index:03}")
+_KEY_SUMMARY = KeyTemplate("{network}:{run_type}:{collection}", collection=COL_SUMMARY)
+_KEY_SUMMARY_RETAINED_INDEX = KeyTemplate("{network}:{collection}", collection=COL_SUMMARY_RETAINED_INDEX)
 
+# Cache collection item expiration times - see retention.get_expiration.
+EXPIRATION_COL_CONTEXT = retention.get_expiration(_PARTITION, COL_CONTEXT, 3600)
+EXPIRATION_COL_INFO = retention.get_expiration(_PARTITION, COL_INFO, 3600)
+EXPIRATION_COL_LOCK = retention.get_expiration(_PARTITION, COL_LOCK, 3600)
 
-@cache_op(_PARTITION, StoreOperation.DELETE_MANY)
-def delete_locks(ctx: ExecutionContext) -> SearchKey:
+# Time (in seconds) within which repeated retention sweep requests are discarded.
+EXPIRATION_SWEEP_LOCK = 60
+
+# Upper bounds (in seconds) of finalisation latency histogram buckets - a final unbounded bucket is implied.
+FINALISATION_BUCKETS = (1, 2, 5, 10, 15, 20, 30, 45, 60, 90, 120, 180, 300, 600)
+
+
+@cache_op(_PARTITION, StoreOperation.EVAL_SCRIPT)
+def acquire_dispatch_token(ctx: ExecutionContext, burst: int = 1) -> ScriptKey:
+    """Acquires (atomically) a token from a run's dispatch token bucket - the bucket is shared by all dispatching workers.
+
+    :param ctx: Execution context information.
+    :param burst: Max. number of tokens accumulated by an idle bucket.
+
+    :returns: Time (in milliseconds) to wait before dispatching, 0 = dispatch immediately.
+
+    """
+    return ScriptKey(
+        script=scripts.ACQUIRE_TOKENS,
+        item_keys=[
+            ItemKey(
+                paths=_KEY_DISPATCH_TOKENS.format(
+                    network=ctx.network,
+                    run_type=ctx.run_type,
+                    run_index=ctx.run_index,
+                ),
+                names=["-"],
+            ),
+        ],
+        args=[ctx.deploys_per_second, burst, 1],
+        register_keys=True,
+    )
+
+
+@cache_op(_PARTITION, StoreOperation.DELETE_RUN)
+def delete_locks(ctx: ExecutionContext) -> RunPruneKey:
     """Flushes previous run locks.
 
     :param ctx: Execution context information.
 
-    :returns: A generator of keypaths to be flushed.
+    :returns: Cache run prune key.
     
     """
-    return SearchKey(
-        paths=[
-            ctx.network,
-            ctx.run_type,
-            ctx.label_run_index,
-            COL_LOCK,
-        ]
+    return RunPruneKey(
+        paths=_KEY_RUN.format(
+            network=ctx.network,
+            run_type=ctx.run_type,
+            run_index=ctx.run_index,
+        ),
+        match_paths=_KEY_LOCK.format(
+            network=ctx.network,
+            run_type=ctx.run_type,
+            run_index=ctx.run_index,
+        )
     )
 
 
-def prune_on_run_completion(ctx: ExecutionContext) -> SearchKey:
+def prune_on_run_completion(ctx: ExecutionContext):
     """Deletes data cached during the course of a run.
 
     :param ctx: Execution context information.
-    :returns: Cache search key under which all records will be deleted.
 
     """
     _delete_on_run_completion_1(ctx)
     _delete_on_run_completion_2(ctx)
 
 
-@cache_op(_PARTITION, StoreOperation.DELETE_MANY)
-def _delete_on_run_completion_1(ctx: ExecutionContext) -> SearchKey:
+@cache_op(_PARTITION, StoreOperation.DELETE_RUN)
+def prune_on_run_eviction(summary: typing.Union[ExecutionContext, ExecutionSummary]) -> RunPruneKey:
+    """Deletes all data cached during the course of a run - invoked once a run has been compacted.
+
+    :param summary: Summary of a compacted run (or context of a run to be discarded).
+
+    :returns: Cache run prune key under which all records will be deleted.
+
+    """
+    return RunPruneKey(
+        paths=_KEY_RUN.format(
+            network=summary.network,
+            run_type=summary.run_type,
+            run_index=summary.run_index,
+        )
+    )
+
+
+@cache_op(_PARTITION, StoreOperation.DELETE_RUN)
+def _delete_on_run_completion_1(ctx: ExecutionContext) -> RunPruneKey:
     """Deletes data cached during the course of a run.
 
     :param ctx: Execution context information.
-    :returns: Cache search key under which all records will be deleted.
+    :returns: Cache run prune key under which matched records will be deleted.
 
     """
-    return SearchKey(
-        paths=[
+    return RunPruneKey(
+        paths=_KEY_RUN.format(
+            network=ctx.network,
+            run_type=ctx.run_type,
+            run_index=ctx.run_index,
+        ),
+        match_paths=[
             ctx.network,
             ctx.run_type,
             ctx.label_run_index,
@@ -83,16 +170,21 @@ def _delete_on_run_completion_1(ctx: ExecutionContext) -> SearchKey:
     )
 
 
-@cache_op(_PARTITION, StoreOperation.DELETE_MANY)
-def _delete_on_run_completion_2(ctx: ExecutionContext) -> SearchKey:
+@cache_op(_PARTITION, StoreOperation.DELETE_RUN)
+def _delete_on_run_completion_2(ctx: ExecutionContext) -> RunPruneKey:
     """Deletes data cached during the course of a run.
 
     :param ctx: Execution context information.
-    :returns: Cache search key under which all records will be deleted.
+    :returns: Cache run prune key under which matched records will be deleted.
 
     """
-    return SearchKey(
-        paths=[
+    return RunPruneKey(
+        paths=_KEY_RUN.format(
+            network=ctx.network,
+            run_type=ctx.run_type,
+            run_index=ctx.run_index,
+        ),
+        match_paths=[
             ctx.network,
             ctx.run_type,
             ctx.label_run_index,
@@ -114,11 +206,11 @@ def get_context(network: str, run_index: int, run_type: str) -> ItemKey:
 
     """
     return ItemKey(
-        paths=[
-            network,
-            run_type,
-            f"R-{str(run_index).zfill(3)}",
-        ],
+        paths=_KEY_RUN.format(
+            network=network,
+            run_type=run_type,
+            run_index=run_index,
+        ),
         names=[
             COL_CONTEXT,
         ],
@@ -135,14 +227,7 @@ def get_context_list(network_id: NetworkIdentifier, run_type: str) -> SearchKey:
     :returns: Cached run context information.
 
     """
-    return SearchKey(
-        paths=[
-            network_id.name,
-            "WG-*" if run_type is None else run_type,
-            "R-*",
-            COL_CONTEXT,
-        ]
-    )
+    return _get_context_list_search_key(network_id, run_type)
 
 
 @cache_op(_PARTITION, StoreOperation.GET_COUNTER_ONE)
@@ -155,22 +240,7 @@ def get_deploy_count(ctx: ExecutionContext, aspect: ExecutionAspect) -> ItemKey:
     :returns: Count of deploys.
 
     """
-    if aspect == ExecutionAspect.RUN:
-        names = ["-"]
-    elif aspect == ExecutionAspect.PHASE:
-        names = [ctx.label_phase_index]
-    elif aspect == ExecutionAspect.STEP:
-        names = [ctx.label_phase_index, ctx.label_step_index]
-
-    return ItemKey(
-        paths=[
-            ctx.network,
-            ctx.run_type,
-            ctx.label_run_index,
-            COL_DEPLOY_COUNT,
-        ],
-        names=names,
-    )
+    return _get_deploy_count_key(ctx, aspect)
 
 
 @cache_op(_PARTITION, StoreOperation.GET_COUNTER_MANY)
@@ -197,12 +267,11 @@ def get_deploy_count_list(network_id: NetworkIdentifier, run_type: str = None, r
 
     elif run_index:
         return SearchKey(
-            paths=[
-                network_id.name,
-                run_type,
-                f"R-{str(run_index).zfill(3)}",
-                COL_DEPLOY_COUNT,
-            ]
+            paths=_KEY_DEPLOY_COUNT.format(
+                network=network_id.name,
+                run_type=run_type,
+                run_index=run_index,
+            )
         )
 
     else:
@@ -216,6 +285,19 @@ def get_deploy_count_list(network_id: NetworkIdentifier, run_type: str = None, r
         )
 
 
+@cache_op(_PARTITION, StoreOperation.GET_COUNTERS)
+def get_finalisation_stats(ctx: ExecutionContext, aspect: ExecutionAspect) -> ItemKey:
+    """Returns running statistics of deploy finalisation latency within the scope of an execution aspect.
+
+    :param ctx: Execution context information.
+    :param aspect: Aspect of execution in scope.
+
+    :returns: Map: counter -> value, i.e. count, sum, sum_sq, min, max & a counter per histogram bucket (le_N | le_inf).
+
+    """
+    return _get_finalisation_stats_key(ctx, aspect)
+
+
 @cache_op(_PARTITION, StoreOperation.GET_ONE)
 def get_info(ctx: ExecutionContext, aspect: ExecutionAspect) -> ItemKey:
     """Decaches domain object: ExecutionInfo.
@@ -225,22 +307,7 @@ def get_info(ctx: ExecutionContext, aspect: ExecutionAspect) -> ItemKey:
     :returns: Keypath to domain object instance.
 
     """
-    if aspect == ExecutionAspect.RUN:
-        names = ["-"]
-    elif aspect == ExecutionAspect.PHASE:
-        names = [ctx.label_phase_index]
-    elif aspect == ExecutionAspect.STEP:
-        names = [ctx.label_phase_index, ctx.label_step_index]
-
-    return ItemKey(
-        paths=[
-            ctx.network,
-            ctx.run_type,
-            ctx.label_run_index,
-            COL_INFO,
-        ],
-        names=names,
-    )
+    return _get_info_key(ctx, aspect)
 
 
 @cache_op(_PARTITION, StoreOperation.GET_MANY)
@@ -254,32 +321,64 @@ def get_info_list(network_id: NetworkIdentifier, run_type: str, run_index: int =
     :returns: Keypath to domain object instance.
 
     """
-    if not run_type:
-        return SearchKey(
-            paths=[
-                network_id.name,
-                "*",
-                COL_INFO,
-            ]
-        )
-    elif run_index:
-        return SearchKey(
-            paths=[
-                network_id.name,
-                run_type,
-                f"R-{str(run_index).zfill(3)}",
-                COL_INFO,
-            ]
-        )
-    else:
-        return SearchKey(
-            paths=[
-                network_id.name,
-                run_type,
-                "*",
-                COL_INFO,
-            ]
-        )
+    return _get_info_list_search_key(network_id, run_type, run_index)
+
+
+@cache_op(_PARTITION, StoreOperation.GET_ONE)
+def get_summary(network_id: NetworkIdentifier, run_type: str, run_index: int) -> ItemKey:
+    """Decaches domain object: ExecutionSummary.
+    
+    :param network_id: Identifier of network being tested.
+    :param run_type: Type of run that was executed.
+    :param run_index: Index of a run.
+
+    :returns: Keypath to domain object instance.
+
+    """
+    return ItemKey(
+        paths=_KEY_SUMMARY.format(
+            network=network_id.name,
+            run_type=run_type,
+        ),
+        names=[
+            f"R-{str(run_index).zfill(3)}",
+        ],
+    )
+
+
+@cache_op(_PARTITION, StoreOperation.GET_MANY)
+def get_summary_list(network_id: NetworkIdentifier, run_type: str = None) -> SearchKey:
+    """Decaches domain object: ExecutionSummary.
+    
+    :param network_id: Identifier of network being tested.
+    :param run_type: Type of run that was executed.
+
+    :returns: Cache search key.
+
+    """
+    return SearchKey(
+        paths=[
+            network_id.name,
+            run_type or "*",
+            COL_SUMMARY,
+        ]
+    )
+
+
+@cache_op(_PARTITION, StoreOperation.GET_MANY_BY_TIME)
+def get_summary_list_retained(network_id: NetworkIdentifier) -> TimeRangeKey:
+    """Decaches domain object: ExecutionSummary - summaries of runs whose detail is retained, ordered by completion time.
+    
+    :param network_id: Identifier of network being tested.
+
+    :returns: Cache time range key.
+
+    """
+    return TimeRangeKey(
+        paths=_KEY_SUMMARY_RETAINED_INDEX.format(
+            network=network_id.name,
+        ),
+    )
 
 
 @cache_op(_PARTITION, StoreOperation.COUNTER_INCR)
@@ -295,36 +394,38 @@ def increment_deploy_count(
     :param amount: Amount by which to increment counter.
 
     """
-    if aspect == ExecutionAspect.RUN:
-        names = ["-"]
-    elif aspect == ExecutionAspect.PHASE:
-        names = [ctx.label_phase_index]
-    elif aspect == ExecutionAspect.STEP:
-        names = [ctx.label_phase_index, ctx.label_step_index]
+    item_key = _get_deploy_count_key(ctx, aspect)
 
     return CountIncrementKey(
-        paths=[
-            ctx.network,
-            ctx.run_type,
-            ctx.label_run_index,
-            COL_DEPLOY_COUNT,
-        ],
-        names=names,
+        paths=item_key.paths,
+        names=[item_key.name],
         amount=amount,
+        shards=item_key.shards,
     )
 
 
-def increment_deploy_counts(ctx: ExecutionContext, amount: int = 1) -> int:
+@cache_op(_PARTITION, StoreOperation.EVAL_SCRIPT)
+def increment_deploy_counts(ctx: ExecutionContext, amount: int = 1) -> ScriptKey:
     """Increments (atomically) count of run deploys.
 
+    Step completion is decided by the step's deploy batch verifier - as each caller is returned a unique
+    step count, exactly one caller observes the final count, so the script need not evaluate completion.
+
     :param ctx: Execution context information.
+    :param amount: Amount by which to increment counters.
+
+    :returns: 3 member list -> run, phase & step deploy counts - run & phase counts are those of the calling worker's shard.
 
     """
-    # TODO: increment as a batch.
-    return (
-        increment_deploy_count(ctx, ExecutionAspect.RUN, amount),
-        increment_deploy_count(ctx, ExecutionAspect.PHASE, amount),
-        increment_deploy_count(ctx, ExecutionAspect.STEP, amount)
+    return ScriptKey(
+        script=scripts.INCREMENT_COUNTS,
+        item_keys=[
+            _get_deploy_count_key(ctx, ExecutionAspect.RUN),
+            _get_deploy_count_key(ctx, ExecutionAspect.PHASE),
+            _get_deploy_count_key(ctx, ExecutionAspect.STEP),
+        ],
+        args=[amount],
+        register_keys=True,
     )
 
 
@@ -365,15 +466,38 @@ def set_lock(aspect: ExecutionAspect, lock: ExecutionLock) -> Item:
 
     return Item(
         data=lock,
+        item_key=ItemKey(
+            paths=_KEY_LOCK.format(
+                network=lock.network,
+                run_type=lock.run_type,
+                run_index=lock.run_index,
+            ),
+            names=names,
+        ),
+        expiration=EXPIRATION_COL_LOCK,
+    )
+
+
+@cache_op(_PARTITION, StoreOperation.SET_ONE_SINGLETON)
+def set_sweep_lock() -> Item:
+    """Encaches a lock: retention sweep - ensures that concurrently starting workers request a single sweep.
+
+    :returns: Item to be cached.
+
+    """
+    return Item(
+        data={
+            "ts_locked": datetime.utcnow().timestamp(),
+        },
         item_key=ItemKey(
             paths=[
-                lock.network,
-                lock.run_type,
-                lock.label_run_index,
                 COL_LOCK,
             ],
-            names=names,
+            names=[
+                "sweep",
+            ],
         ),
+        expiration=EXPIRATION_SWEEP_LOCK,
     )
 
 
@@ -389,19 +513,33 @@ def set_context(ctx: ExecutionContext) -> Item:
     return Item(
         data=ctx,
         item_key=ItemKey(
-            paths=[
-                ctx.network,
-                ctx.run_type,
-                ctx.label_run_index,
-            ],
+            paths=_KEY_RUN.format(
+                network=ctx.network,
+                run_type=ctx.run_type,
+                run_index=ctx.run_index,
+            ),
             names=[
                 COL_CONTEXT,
             ],
         ),
-        expiration=EXPIRATION_COL_CONTEXT
+        # Messages referencing a context may be consumed long after it was last encached, hence whilst
+        # passing by reference contexts are retained for longer.
+        expiration=_get_context_expiration(),
     )
 
 
+def set_context_and_info(ctx: ExecutionContext, info: ExecutionInfo):
+    """Encaches domain objects: ExecutionContext + ExecutionInfo.
+    
+    :param ctx: Execution context information.
+    :param info: ExecutionInfo domain object instance to be cached.
+
+    """
+    with cache_batch(_PARTITION):
+        set_context(ctx)
+        set_info(info)
+
+
 @cache_op(_PARTITION, StoreOperation.SET_ONE)
 def set_info(info: ExecutionInfo) -> Item:
     """Encaches domain object: ExecutionInfo.
@@ -421,15 +559,16 @@ def set_info(info: ExecutionInfo) -> Item:
     return Item(
         data=info,
         item_key=ItemKey(
-            paths=[
-                info.network,
-                info.run_type,
-                info.label_run_index,
-                COL_INFO,
-            ],
+            paths=_KEY_INFO.format(
+                network=info.network,
+                run_type=info.run_type,
+                run_index=info.run_index,
+            ),
             names=names,
         ),
-        expiration=EXPIRATION_COL_INFO
+        expiration=EXPIRATION_COL_INFO,
+        # Info is JSON encoded so that it can be updated in place by a server side script.
+        codec_type="JSON",
     )    
 
 
@@ -441,6 +580,239 @@ def set_info_update(ctx: ExecutionContext, aspect: ExecutionAspect, status: Exec
     :param status: New execution status.
 
     """
-    info = get_info(ctx, aspect)
-    info.end(status, None)
-    set_info(info)
+    # Info encoded by another codec is updated client side.
+    if _set_info_update(ctx, aspect, status) == -1:
+        info = get_info(ctx, aspect)
+        info.end(status, None)
+        set_info(info)
+
+
+@cache_op(_PARTITION, StoreOperation.EVAL_SCRIPT)
+def _set_info_update(ctx: ExecutionContext, aspect: ExecutionAspect, status: ExecutionStatus) -> ScriptKey:
+    """Updates (atomically) domain object: ExecutionInfo.
+    
+    :param ctx: Execution context information.
+    :param aspect: Aspect of execution in scope.
+    :param status: New execution status.
+
+    :returns: Cache script key.
+
+    """
+    return ScriptKey(
+        script=scripts.UPDATE_INFO,
+        item_keys=[
+            _get_info_key(ctx, aspect),
+        ],
+        args=[status.name, datetime.utcnow().timestamp(), EXPIRATION_COL_INFO or 0],
+    )
+
+
+@cache_op(_PARTITION, StoreOperation.SET_ONE)
+def set_summary(summary: ExecutionSummary) -> Item:
+    """Encaches domain object: ExecutionSummary.
+    
+    :param summary: ExecutionSummary domain object instance to be cached.
+
+    :returns: Keypath + domain object instance.
+
+    """
+    return Item(
+        data=summary,
+        item_key=ItemKey(
+            paths=_KEY_SUMMARY.format(
+                network=summary.network,
+                run_type=summary.run_type,
+            ),
+            names=[
+                summary.label_run_index,
+            ],
+        ),
+        # Summaries of runs whose detail has been evicted are dropped from the retained index.
+        indexes=[
+            TimeIndexKey(
+                paths=_KEY_SUMMARY_RETAINED_INDEX.format(
+                    network=summary.network,
+                ),
+                timestamp=summary.ts_end.timestamp(),
+                remove=summary.is_evicted,
+            ),
+        ],
+    )
+
+
+@cache_op(_PARTITION, StoreOperation.GET_MANY_STREAM)
+def stream_context_list(network_id: NetworkIdentifier, run_type: str) -> SearchKey:
+    """Decaches domain object: ExecutionContext - contexts are yielded lazily in chunks so as to bound memory usage.
+    
+    :param network_id: Identifier of network being tested.
+    :param run_type: Generator run type, e.g. wg-100.
+
+    :returns: Cache search key.
+
+    """
+    return _get_context_list_search_key(network_id, run_type)
+
+
+@cache_op(_PARTITION, StoreOperation.GET_MANY_STREAM)
+def stream_info_list(network_id: NetworkIdentifier, run_type: str, run_index: int = None) -> SearchKey:
+    """Decaches domain object: ExecutionInfo - information is yielded lazily in chunks so as to bound memory usage.
+    
+    :param network_id: Identifier of network being tested.
+    :param run_type: Type of run that was executed.
+    :param run_index: Index of a run.
+
+    :returns: Cache search key.
+
+    """
+    return _get_info_list_search_key(network_id, run_type, run_index)
+
+
+@cache_op(_PARTITION, StoreOperation.EVAL_SCRIPT)
+def update_finalisation_stats(deploy: Deploy) -> ScriptKey:
+    """Folds (atomically) a deploy's finalisation latency into running statistics of it's run, phase & step.
+
+    :param deploy: A finalised deploy dispatched during the course of a run.
+
+    :returns: 3 member list -> run, phase & step finalised deploy counts.
+
+    """
+    duration = deploy.finalization_duration
+    idx = bisect.bisect_left(FINALISATION_BUCKETS, duration)
+    bucket = f"le_{FINALISATION_BUCKETS[idx]}" if idx < len(FINALISATION_BUCKETS) else "le_inf"
+
+    return ScriptKey(
+        script=scripts.UPDATE_STATS,
+        item_keys=[
+            _get_finalisation_stats_key(deploy, ExecutionAspect.RUN),
+            _get_finalisation_stats_key(deploy, ExecutionAspect.PHASE),
+            _get_finalisation_stats_key(deploy, ExecutionAspect.STEP),
+        ],
+        args=[duration, duration * duration, bucket],
+        register_keys=True,
+    )
+
+
+def _get_context_expiration() -> typing.Optional[int]:
+    """Returns time (in seconds) after which an execution context expires - extended whilst messages reference contexts.
+
+    """
+    # JIT import to avoid circularity.
+    from stests.core.orchestration import references
+
+    if not references.EnvVars.ENABLED or EXPIRATION_COL_CONTEXT is None:
+        return EXPIRATION_COL_CONTEXT
+
+    return max(EXPIRATION_COL_CONTEXT, references.EnvVars.TTL)
+
+
+def _get_deploy_count_key(ctx: ExecutionContext, aspect: ExecutionAspect) -> ItemKey:
+    """Returns key under which count of deploys within the scope of an execution aspect is cached.
+
+    Run & phase counts are incremented by every deploy & so are sharded, step counts are
+    not as they are used to index a step's deploys.
+
+    """
+    if aspect == ExecutionAspect.RUN:
+        names = ["-"]
+    elif aspect == ExecutionAspect.PHASE:
+        names = [ctx.label_phase_index]
+    elif aspect == ExecutionAspect.STEP:
+        names = [ctx.label_phase_index, ctx.label_step_index]
+
+    return ItemKey(
+        paths=_KEY_DEPLOY_COUNT.format(
+            network=ctx.network,
+            run_type=ctx.run_type,
+            run_index=ctx.run_index,
+        ),
+        names=names,
+        shards=1 if aspect == ExecutionAspect.STEP else EnvVars.COUNTER_SHARDS,
+    )
+
+
+def _get_finalisation_stats_key(ctx: typing.Union[Deploy, ExecutionContext], aspect: ExecutionAspect) -> ItemKey:
+    """Returns key under which running statistics of deploy finalisation latency within the scope of an execution aspect are cached.
+
+    """
+    if aspect == ExecutionAspect.RUN:
+        names = ["-"]
+    elif aspect == ExecutionAspect.PHASE:
+        names = [f"P-{str(ctx.phase_index).zfill(2)}"]
+    elif aspect == ExecutionAspect.STEP:
+        names = [f"P-{str(ctx.phase_index).zfill(2)}", f"S-{str(ctx.step_index).zfill(2)}"]
+
+    return ItemKey(
+        paths=_KEY_FINALISATION_STATS.format(
+            network=ctx.network,
+            run_type=ctx.run_type,
+            run_index=ctx.run_index,
+        ),
+        names=names,
+    )
+
+
+def _get_info_key(ctx: ExecutionContext, aspect: ExecutionAspect) -> ItemKey:
+    """Returns key under which execution information within the scope of an execution aspect is cached.
+
+    """
+    if aspect == ExecutionAspect.RUN:
+        names = ["-"]
+    elif aspect == ExecutionAspect.PHASE:
+        names = [ctx.label_phase_index]
+    elif aspect == ExecutionAspect.STEP:
+        names = [ctx.label_phase_index, ctx.label_step_index]
+
+    return ItemKey(
+        paths=_KEY_INFO.format(
+            network=ctx.network,
+            run_type=ctx.run_type,
+            run_index=ctx.run_index,
+        ),
+        names=names,
+    )
+
+
+def _get_context_list_search_key(network_id: NetworkIdentifier, run_type: str) -> SearchKey:
+    """Returns key used to search for execution contexts.
+
+    """
+    return SearchKey(
+        paths=[
+            network_id.name,
+            "WG-*" if run_type is None else run_type,
+            "R-*",
+            COL_CONTEXT,
+        ]
+    )
+
+
+def _get_info_list_search_key(network_id: NetworkIdentifier, run_type: str, run_index: int = None) -> SearchKey:
+    """Returns key used to search for execution information.
+
+    """
+    if not run_type:
+        return SearchKey(
+            paths=[
+                network_id.name,
+                "*",
+                "*",
+                COL_INFO,
+            ]
+        )
+    elif run_index:
+        return SearchKey(
+            paths=_KEY_INFO.format(
+                network=network_id.name,
+                run_type=run_type,
+                run_index=run_index,
+            )
+        )
+    else:
+        return SearchKey(
+            paths=[
+                network_id.name,
+                run_type,
+                "*",
+                COL_INFO,
+            ]
+        )
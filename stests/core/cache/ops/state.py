@@ -1,25 +1,35 @@
 import random
 import typing
+from datetime import datetime
 
 from stests.core import factory
 from stests.core.cache.model import CountDecrementKey
 from stests.core.cache.model import CountIncrementKey
+from stests.core.cache.model import IndexKey
+from stests.core.cache.model import IndexPruneKey
 from stests.core.cache.model import Item
 from stests.core.cache.model import ItemKey
+from stests.core.cache.model import KeyTemplate
+from stests.core.cache.model import RunPruneKey
 from stests.core.cache.model import SearchKey
 from stests.core.cache.model import StoreOperation
 from stests.core.cache.model import StorePartition
+from stests.core.cache.model import TimeIndexKey
+from stests.core.cache.model import TimeRangeKey
 from stests.core.cache.ops.infra import get_network
 from stests.core.cache.ops.infra import get_nodes
 from stests.core.cache.ops.utils import cache_op
+from stests.core.cache.ops.utils import register_hash_collections
 from stests.core.types.chain import Account
 from stests.core.types.chain import AccountIdentifier
 from stests.core.types.chain import ContractType
 from stests.core.types.chain import Deploy
+from stests.core.types.chain import DeployStatus
 from stests.core.types.chain import NamedKey
 from stests.core.types.infra import NetworkIdentifier
 from stests.core.types.infra import NodeEventInfo
 from stests.core.types.orchestration import ExecutionContext
+from stests.core.types.orchestration import ExecutionSummary
 
 
 
@@ -31,8 +41,36 @@ COL_ACCOUNT = "account"
 COL_ACCOUNT_BALANCE = "account-balance"
 COL_NAMED_KEY = "named-key"
 COL_DEPLOY = "deploy"
+COL_DEPLOY_INDEX = "index-deploy"
+COL_DEPLOY_PENDING_INDEX = "index-deploy-pending"
+COL_DEPLOY_TIME_INDEX = "index-deploy-time"
 COL_TRANSFER = "transfer"
 
+# Cache key templates.
+_KEY_ACCOUNT = KeyTemplate("{network}:{run_type}:R-{run_index:03}:{collection}", collection=COL_ACCOUNT)
+_KEY_ACCOUNT_BALANCE = KeyTemplate("{network}:{run_type}:R-{run_index:03}:{collection}", collection=COL_ACCOUNT_BALANCE)
+_KEY_DEPLOY = KeyTemplate("{network}:{run_type}:R-{run_index:03}:{collection}", collection=COL_DEPLOY)
+_KEY_DEPLOY_INDEX = KeyTemplate("{network}:{collection}", collection=COL_DEPLOY_INDEX)
+_KEY_DEPLOY_INDEX_RUN = KeyTemplate("{network}:{run_type}:R-{run_index:03}:{collection}", collection=COL_DEPLOY_INDEX)
+_KEY_DEPLOY_PENDING_INDEX = KeyTemplate("{network}:{run_type}:R-{run_index:03}:{collection}", collection=COL_DEPLOY_PENDING_INDEX)
+_KEY_DEPLOY_TIME_INDEX = KeyTemplate("{network}:{run_type}:R-{run_index:03}:{collection}", collection=COL_DEPLOY_TIME_INDEX)
+_KEY_NAMED_KEY = KeyTemplate("{network}:{run_type}:R-{run_index:03}:{collection}:A-{account_index:06}:{contract_type}", collection=COL_NAMED_KEY)
+_KEY_RUN = KeyTemplate("{network}:{run_type}:R-{run_index:03}")
+
+# Set of deploy states whereby a deploy is awaiting finalisation.
+_PENDING_DEPLOY_STATUSES = {
+    DeployStatus.DISPATCHED,
+    DeployStatus.PENDING,
+}
+
+# Collections stored as hashes when operating in collection hash mode.
+register_hash_collections(_PARTITION, {
+    COL_ACCOUNT,
+    COL_ACCOUNT_BALANCE,
+    COL_DEPLOY,
+    COL_NAMED_KEY,
+})
+
 
 @cache_op(_PARTITION, StoreOperation.COUNTER_DECR)
 def decrement_account_balance(account: Account, amount: int) -> CountDecrementKey:
@@ -45,12 +83,11 @@ def decrement_account_balance(account: Account, amount: int) -> CountDecrementKe
 
     """
     return CountDecrementKey(
-        paths=[
-            account.network,
-            account.run_type,
-            account.label_run_index,
-            COL_ACCOUNT_BALANCE,
-        ],
+        paths=_KEY_ACCOUNT_BALANCE.format(
+            network=account.network,
+            run_type=account.run_type,
+            run_index=account.run_index,
+        ),
         names=[
             account.label_index,
         ],
@@ -70,12 +107,11 @@ def decrement_account_balance_on_deploy_finalisation(deploy: Deploy, cost: int)
         return
     
     return CountDecrementKey(
-        paths=[
-            deploy.network,
-            deploy.run_type,
-            deploy.label_run_index,
-            COL_ACCOUNT_BALANCE,
-        ],
+        paths=_KEY_ACCOUNT_BALANCE.format(
+            network=deploy.network,
+            run_type=deploy.run_type,
+            run_index=deploy.run_index,
+        ),
         names=[
             deploy.label_account_index,
         ],
@@ -83,20 +119,50 @@ def decrement_account_balance_on_deploy_finalisation(deploy: Deploy, cost: int)
     )
 
 
-@cache_op(_PARTITION, StoreOperation.DELETE_MANY)
-def prune_on_run_completion(ctx: ExecutionContext) -> SearchKey:
+def prune_on_run_completion(ctx: typing.Union[ExecutionContext, ExecutionSummary]):
     """Deletes data cached during the course of a run.
 
+    :param ctx: Execution context information - or summary of a run being evicted.
+
+    """
+    _delete_deploy_index_on_run_completion(ctx)
+    _delete_on_run_completion(ctx)
+
+
+@cache_op(_PARTITION, StoreOperation.DELETE_INDEX)
+def _delete_deploy_index_on_run_completion(ctx: typing.Union[ExecutionContext, ExecutionSummary]) -> IndexPruneKey:
+    """Deletes network deploy index entries of deploys dispatched during the course of a run.
+
     :param ctx: Execution context information.
-    :returns: Cache search key under which all records will be deleted.
+    :returns: Cache index prune key.
 
     """
-    return SearchKey(
-        paths=[
-            ctx.network,
-            ctx.run_type,
-            ctx.label_run_index,
-        ]
+    return IndexPruneKey(
+        paths=_KEY_DEPLOY_INDEX.format(
+            network=ctx.network,
+        ),
+        scope_paths=_KEY_DEPLOY_INDEX_RUN.format(
+            network=ctx.network,
+            run_type=ctx.run_type,
+            run_index=ctx.run_index,
+        )
+    )
+
+
+@cache_op(_PARTITION, StoreOperation.DELETE_RUN)
+def _delete_on_run_completion(ctx: typing.Union[ExecutionContext, ExecutionSummary]) -> RunPruneKey:
+    """Deletes data cached during the course of a run.
+
+    :param ctx: Execution context information.
+    :returns: Cache run prune key under which all records will be deleted.
+
+    """
+    return RunPruneKey(
+        paths=_KEY_RUN.format(
+            network=ctx.network,
+            run_type=ctx.run_type,
+            run_index=ctx.run_index,
+        )
     )
 
 
@@ -107,12 +173,11 @@ def get_account(account_id: AccountIdentifier) -> ItemKey:
     :returns: Cache item key.
     """
     return ItemKey(
-        paths=[
-            account_id.run.network.name,
-            account_id.run.type,
-            account_id.label_run_index,
-            COL_ACCOUNT,
-        ],
+        paths=_KEY_ACCOUNT.format(
+            network=account_id.run.network.name,
+            run_type=account_id.run.type,
+            run_index=account_id.run.index,
+        ),
         names=[
             account_id.label_index,
         ]
@@ -126,12 +191,11 @@ def get_account_balance(account: Account) -> ItemKey:
     :returns: Cache item key.
     """
     return ItemKey(
-        paths=[
-            account.network,
-            account.run_type,
-            account.label_run_index,
-            COL_ACCOUNT_BALANCE,
-        ],
+        paths=_KEY_ACCOUNT_BALANCE.format(
+            network=account.network,
+            run_type=account.run_type,
+            run_index=account.run_index,
+        ),
         names=[
             account.label_index,
         ],
@@ -154,53 +218,41 @@ def get_account_by_index(ctx: ExecutionContext, index: int) -> Account:
         ))
 
 
-@cache_op(_PARTITION, StoreOperation.GET_ONE_FROM_MANY)
-def get_deploy(ctx: ExecutionContext, deploy_hash: str) -> ItemKey:
+@cache_op(_PARTITION, StoreOperation.GET_ONE_BY_INDEX)
+def get_deploy(ctx: ExecutionContext, deploy_hash: str) -> IndexKey:
     """Decaches domain object: Deploy.
 
     :param ctx: Execution context information.    
     :param deploy_hash: A deploy hash.
 
-    :returns: Cache item key.
+    :returns: Cache index key.
 
     """
-    return ItemKey(
-        paths=[
-            ctx.network,
-            ctx.run_type,
-            ctx.label_run_index,
-            COL_DEPLOY,
-        ],
-        names=[
-            "*.*",
-            deploy_hash,
-            "A-*"
-        ],
+    return IndexKey(
+        paths=_KEY_DEPLOY_INDEX_RUN.format(
+            network=ctx.network,
+            run_type=ctx.run_type,
+            run_index=ctx.run_index,
+        ),
+        field=deploy_hash,
     )
 
 
-@cache_op(_PARTITION, StoreOperation.GET_ONE_FROM_MANY)
-def get_deploy_on_finalisation(network_name: str, deploy_hash: str) -> ItemKey:
+@cache_op(_PARTITION, StoreOperation.GET_ONE_BY_INDEX)
+def get_deploy_on_finalisation(network_name: str, deploy_hash: str) -> IndexKey:
     """Decaches domain object: Deploy.
     
     :param network_name: Name of network to which deploy was dispatched.
     :param deploy_hash: A deploy hash.
 
-    :returns: Cache item key.
+    :returns: Cache index key.
 
     """
-    return ItemKey(
-        paths=[
-            network_name,
-            "WG-*",
-            "R-*",
-            COL_DEPLOY,
-        ],
-        names=[
-            "*.*",
-            deploy_hash,
-            "A-*"
-        ],
+    return IndexKey(
+        paths=_KEY_DEPLOY_INDEX.format(
+            network=network_name,
+        ),
+        field=deploy_hash,
     )
 
 
@@ -215,13 +267,93 @@ def get_deploys(network_id: NetworkIdentifier, run_type: str, run_index: int) ->
     :returns: Cache search key.
 
     """
-    return SearchKey(
-        paths=[
-            network_id.name,
-            run_type,
-            f"R-{str(run_index).zfill(3)}",
-            COL_DEPLOY,
-        ]
+    return _get_deploys_search_key(network_id, run_type, run_index)
+
+
+@cache_op(_PARTITION, StoreOperation.GET_MANY_BY_TIME)
+def get_deploys_by_time(
+    network_id: NetworkIdentifier,
+    run_type: str,
+    run_index: int,
+    ts_from: datetime = None,
+    ts_to: datetime = None,
+    offset: int = 0,
+    limit: int = None,
+    reverse: bool = False,
+    ) -> TimeRangeKey:
+    """Decaches domain object: Deploy - deploys are ordered by dispatch time.
+    
+    :param network_id: Identifier of network to which deploys were dispatched.
+    :param run_type: Type of run that was executed.
+    :param run_index: Index of a run.
+    :param ts_from: Dispatch time (inclusive) from which deploys are returned.
+    :param ts_to: Dispatch time (inclusive) upto which deploys are returned.
+    :param offset: Number of deploys to skip - used for pagination.
+    :param limit: Max. number of deploys to return.
+    :param reverse: Flag indicating whether most recently dispatched deploys are returned first.
+
+    :returns: Cache time range key.
+
+    """
+    return TimeRangeKey(
+        paths=_KEY_DEPLOY_TIME_INDEX.format(
+            network=network_id.name,
+            run_type=run_type,
+            run_index=run_index,
+        ),
+        ts_from=None if ts_from is None else ts_from.timestamp(),
+        ts_to=None if ts_to is None else ts_to.timestamp(),
+        offset=offset,
+        limit=limit,
+        reverse=reverse,
+    )
+
+
+@cache_op(_PARTITION, StoreOperation.GET_MANY)
+def get_deploys_for_network(network_id: NetworkIdentifier) -> SearchKey:
+    """Decaches domain object: Deploy.
+    
+    :param network_id: Identifier of network to which deploys were dispatched.
+
+    :returns: Cache search key.
+
+    """
+    return _get_deploys_for_network_search_key(network_id)
+
+
+def get_deploys_latest(network_id: NetworkIdentifier, run_type: str, run_index: int, limit: int) -> typing.List[Deploy]:
+    """Decaches domain object: Deploy - most recently dispatched deploys are returned first.
+    
+    :param network_id: Identifier of network to which deploys were dispatched.
+    :param run_type: Type of run that was executed.
+    :param run_index: Index of a run.
+    :param limit: Max. number of deploys to return.
+
+    :returns: Most recently dispatched deploys.
+
+    """
+    return get_deploys_by_time(network_id, run_type, run_index, limit=limit, reverse=True)
+
+
+@cache_op(_PARTITION, StoreOperation.GET_MANY_BY_TIME)
+def get_deploys_pending(network_id: NetworkIdentifier, run_type: str, run_index: int, limit: int = None) -> TimeRangeKey:
+    """Decaches domain object: Deploy - deploys awaiting finalisation are returned oldest first.
+    
+    :param network_id: Identifier of network to which deploys were dispatched.
+    :param run_type: Type of run that was executed.
+    :param run_index: Index of a run.
+    :param limit: Max. number of deploys to return.
+
+    :returns: Cache time range key.
+
+    """
+    return TimeRangeKey(
+        paths=_KEY_DEPLOY_PENDING_INDEX.format(
+            network=network_id.name,
+            run_type=run_type,
+            run_index=run_index,
+        ),
+        limit=limit,
     )
 
 
@@ -235,14 +367,13 @@ def get_named_keys(ctx: ExecutionContext, account: Account, contract_type: Contr
 
     """
     return SearchKey(
-        paths=[
-            ctx.network,
-            ctx.run_type,
-            ctx.label_run_index,
-            COL_NAMED_KEY,
-            account.label_index,
-            contract_type.name,            
-        ]
+        paths=_KEY_NAMED_KEY.format(
+            network=ctx.network,
+            run_type=ctx.run_type,
+            run_index=ctx.run_index,
+            account_index=account.index,
+            contract_type=contract_type.name,
+        )
     )
 
 
@@ -257,12 +388,11 @@ def increment_account_balance(account: Account, amount: int) -> CountIncrementKe
 
     """
     return CountIncrementKey(
-        paths=[
-            account.network,
-            account.run_type,
-            account.label_run_index,
-            COL_ACCOUNT_BALANCE,
-        ],
+        paths=_KEY_ACCOUNT_BALANCE.format(
+            network=account.network,
+            run_type=account.run_type,
+            run_index=account.run_index,
+        ),
         names=[
             account.label_index,
         ],
@@ -280,12 +410,11 @@ def set_account(account: Account) -> Item:
     return Item(
         data=account,
         item_key=ItemKey(
-            paths=[
-                account.network,
-                account.run_type,
-                account.label_run_index,
-                COL_ACCOUNT,
-            ],
+            paths=_KEY_ACCOUNT.format(
+                network=account.network,
+                run_type=account.run_type,
+                run_index=account.run_index,
+            ),
             names=[
                 account.label_index,
             ]
@@ -304,19 +433,24 @@ def set_deploy(deploy: Deploy) -> Item:
     """
     return Item(
         data=deploy,
-        item_key=ItemKey(
-            paths=[
-                deploy.network,
-                deploy.run_type,
-                deploy.label_run_index,
-                COL_DEPLOY,
-            ],
-            names=[
-                str(deploy.dispatch_timestamp.timestamp()),
-                deploy.deploy_hash,
-                deploy.label_account_index,
-            ]
-        )
+        item_key=_get_deploy_key(deploy),
+        indexes=_get_deploy_indexes(deploy),
+    )
+
+
+@cache_op(_PARTITION, StoreOperation.SET_INDEX)
+def set_deploy_index(deploy: Deploy) -> Item:
+    """Encaches secondary index entries of domain object: Deploy.
+    
+    :param deploy: Deploy domain object instance previously cached.
+
+    :returns: Cache item.
+
+    """
+    return Item(
+        data=None,
+        item_key=_get_deploy_key(deploy),
+        indexes=_get_deploy_indexes(deploy),
     )
 
 
@@ -332,16 +466,125 @@ def set_named_key(ctx: ExecutionContext, named_key: NamedKey) -> Item:
     return Item(
         data=named_key,
         item_key=ItemKey(
-            paths=[
-                named_key.network,
-                named_key.run_type,
-                named_key.label_run_index,
-                COL_NAMED_KEY,
-                named_key.label_account_index,
-                named_key.contract_type.name,
-            ],
+            paths=_KEY_NAMED_KEY.format(
+                network=named_key.network,
+                run_type=named_key.run_type,
+                run_index=named_key.run_index,
+                account_index=named_key.account_index,
+                contract_type=named_key.contract_type.name,
+            ),
             names=[
                 named_key.name,
             ]
         )
     )
+
+
+@cache_op(_PARTITION, StoreOperation.GET_MANY_STREAM)
+def stream_deploys(network_id: NetworkIdentifier, run_type: str, run_index: int) -> SearchKey:
+    """Decaches domain object: Deploy - deploys are yielded lazily in chunks so as to bound memory usage.
+    
+    :param network_id: Identifier of network to which deploys were dispatched.
+    :param run_type: Type of run that was executed.
+    :param run_index: Index of a run.
+
+    :returns: Cache search key.
+
+    """
+    return _get_deploys_search_key(network_id, run_type, run_index)
+
+
+@cache_op(_PARTITION, StoreOperation.GET_MANY_STREAM)
+def stream_deploys_for_network(network_id: NetworkIdentifier) -> SearchKey:
+    """Decaches domain object: Deploy - deploys are yielded lazily in chunks so as to bound memory usage.
+    
+    :param network_id: Identifier of network to which deploys were dispatched.
+
+    :returns: Cache search key.
+
+    """
+    return _get_deploys_for_network_search_key(network_id)
+
+
+def _get_deploy_key(deploy: Deploy) -> ItemKey:
+    """Returns key under which a deploy is cached.
+
+    """
+    return ItemKey(
+        paths=_KEY_DEPLOY.format(
+            network=deploy.network,
+            run_type=deploy.run_type,
+            run_index=deploy.run_index,
+        ),
+        names=[
+            str(deploy.dispatch_timestamp.timestamp()),
+            deploy.deploy_hash,
+            deploy.label_account_index,
+        ]
+    )
+
+
+def _get_deploy_indexes(deploy: Deploy) -> typing.List[typing.Union[IndexKey, TimeIndexKey]]:
+    """Returns keys of indexes mapping a deploy hash & dispatch time to the key under which a deploy is cached.
+
+    """
+    return [
+        IndexKey(
+            paths=_KEY_DEPLOY_INDEX.format(
+                network=deploy.network,
+            ),
+            field=deploy.deploy_hash,
+        ),
+        IndexKey(
+            paths=_KEY_DEPLOY_INDEX_RUN.format(
+                network=deploy.network,
+                run_type=deploy.run_type,
+                run_index=deploy.run_index,
+            ),
+            field=deploy.deploy_hash,
+        ),
+        TimeIndexKey(
+            paths=_KEY_DEPLOY_TIME_INDEX.format(
+                network=deploy.network,
+                run_type=deploy.run_type,
+                run_index=deploy.run_index,
+            ),
+            timestamp=deploy.dispatch_timestamp.timestamp(),
+        ),
+        TimeIndexKey(
+            paths=_KEY_DEPLOY_PENDING_INDEX.format(
+                network=deploy.network,
+                run_type=deploy.run_type,
+                run_index=deploy.run_index,
+            ),
+            timestamp=deploy.dispatch_timestamp.timestamp(),
+            remove=deploy.status not in _PENDING_DEPLOY_STATUSES,
+        ),
+    ]
+
+
+def _get_deploys_for_network_search_key(network_id: NetworkIdentifier) -> SearchKey:
+    """Returns key used to search for a network's deploys.
+
+    """
+    return SearchKey(
+        paths=[
+            network_id.name,
+            "WG-*",
+            "R-*",
+            COL_DEPLOY,
+        ]
+    )
+
+
+def _get_deploys_search_key(network_id: NetworkIdentifier, run_type: str, run_index: int) -> SearchKey:
+    """Returns key used to search for a run's deploys.
+
+    """
+    return SearchKey(
+        paths=_KEY_DEPLOY.format(
+            network=network_id.name,
+            run_type=run_type,
+            run_index=run_index,
+        )
+    )
@@ -1,6 +1,9 @@
-import json
+import asyncio
+import collections
+import contextlib
 import typing
 import functools
+import threading
 import time
 
 import redis
@@ -9,27 +12,68 @@ from stests.core.cache.model import StoreOperation
 from stests.core.cache.model import StorePartition
 from stests.core.cache.model import CountDecrementKey
 from stests.core.cache.model import CountIncrementKey
+from stests.core.cache.model import IndexKey
+from stests.core.cache.model import IndexPruneKey
 from stests.core.cache.model import Item
 from stests.core.cache.model import ItemKey
+from stests.core.cache.model import RunPruneKey
+from stests.core.cache.model import ScriptKey
 from stests.core.cache.model import SearchKey
+from stests.core.cache.model import TimeIndexKey
+from stests.core.cache.model import TimeRangeKey
+from stests.core.cache.model import SHARD_DELIMITER
+from stests.core.cache import codec
+from stests.core.cache import local
+from stests.core.cache import scripts
+from stests.core.cache import stats
 from stests.core.cache import stores
 from stests.core.utils import encoder
+from stests.core.utils import env
+from stests.core.utils.exceptions import InvalidEnvironmentVariable
 
 
 
-def _decode_item(as_json: str) -> typing.Any:
+# Environment variables required by this module.
+class EnvVars:
+    # Collection storage mode: KEYS = key per item | HASH = hash per collection.
+    COLLECTION_MODE = env.get_var("CACHE_COLLECTION_MODE", "KEYS")
+
+    # Number of shards over which hot counters are spread - readers & writers must agree, 1 = unsharded.
+    COUNTER_SHARDS = env.get_var("CACHE_COUNTER_SHARDS", 1, int)
+
+    # Number of items pulled per round trip when streaming a collection.
+    STREAM_CHUNK_SIZE = env.get_var("CACHE_STREAM_CHUNK_SIZE", 1000, int)
+
+
+
+def _decode_item(value: bytes) -> typing.Any:
     """Returns a decoded encached domain object(s).
 
     """
-    if as_json is not None:
-        return encoder.decode(json.loads(as_json))
+    if value is not None:
+        stats.on_read(len(value))
+        return codec.decode(value)
+
+
+def _encode_item(item: Item) -> bytes:
+    """Returns an encoded item ready to be encached.
+
+    """
+    value = item.data_encoded
+    stats.on_write(len(value))
+
+    return value
 
 
 def _decr(store: typing.Callable, decrement: CountDecrementKey):
     """Decrements count under exactly matched key.
     
     """
-    store.decrby(decrement.key, decrement.amount)
+    key = decrement.shard_key
+    with store.pipeline(transaction=False) as pipe:
+        pipe.decrby(key, decrement.amount)
+        _register_run_key(pipe, decrement, key)
+        pipe.execute()
 
 
 def _delete_one(store: typing.Callable, item_key: ItemKey):
@@ -42,50 +86,137 @@ def _delete_one(store: typing.Callable, item_key: ItemKey):
 def _delete_many(store: typing.Callable, search_key: SearchKey):
     """Deletes items under matching keys.
 
+    """
+    _delete_matched(store, search_key.key)
+
+
+def _delete_matched(store: typing.Callable, match: str):
+    """Deletes keys matching a pattern.
+
+    """
+    chunk_size = 1000
+    keys = []
+    for key in _scan(store, match=match, count=chunk_size):
+        keys.append(key)
+        if len(keys) == chunk_size:
+            store.unlink(*keys)
+            keys = []
+    if keys:
+        store.unlink(*keys)
+
+
+def _delete_index(store: typing.Callable, prune_key: IndexPruneKey):
+    """Deletes index entries referenced by a scoped sub-index, and then the sub-index itself.
+
     """
     chunk_size = 1000
     cursor = '0'
     while cursor != 0:
-        cursor, keys = store.scan(cursor=cursor, match=search_key.key, count=chunk_size)
-        if keys:
-            store.delete(*keys)
+        cursor, entries = store.hscan(prune_key.scope_key, cursor=cursor, count=chunk_size)
+        if entries:
+            store.hdel(prune_key.key, *entries.keys())
+    store.unlink(prune_key.scope_key)
+
+
+def _delete_run(store: typing.Callable, prune_key: RunPruneKey):
+    """Deletes keys registered within a run's key set - memory is reclaimed by the server in the background.
+
+    """
+    # Runs cached prior to key set registration are pruned by scanning.
+    if not store.exists(prune_key.key):
+        _delete_matched(store, prune_key.scan_match)
+        return
+
+    chunk_size = 1000
+    keys = []
+    for key in store.sscan_iter(prune_key.key, match=prune_key.match, count=chunk_size):
+        stats.on_match()
+        keys.append(key)
+        if len(keys) == chunk_size:
+            _delete_run_keys(store, prune_key, keys)
+            keys = []
+    if keys:
+        _delete_run_keys(store, prune_key, keys)
+
+    # Key set is retained when a subset of a run's keys are pruned.
+    if prune_key.match is None:
+        store.unlink(prune_key.key)
+
+
+def _delete_run_keys(store: typing.Callable, prune_key: RunPruneKey, keys: typing.List[bytes]):
+    """Deletes a chunk of keys registered within a run's key set.
+
+    """
+    with store.pipeline(transaction=False) as pipe:
+        pipe.unlink(*keys)
+        if prune_key.match is not None:
+            pipe.srem(prune_key.key, *keys)
+        pipe.execute()
+
+
+def _eval_script(store: typing.Callable, script_key: ScriptKey) -> typing.Any:
+    """Evaluates a server side script.
+
+    """
+    return scripts.execute(store, script_key.script, script_key.keys, script_key.args)
 
 
 def _get_counter_one(store: typing.Callable, item_key: ItemKey) -> int:
-    """Returns count under exactly matched key.
+    """Returns count under exactly matched key - summed over shards.
     
     """
-    count = store.get(item_key.key)
-
-    return 0 if count is None else int(count)
+    return _get_counter_summed(store.mget(item_key.shard_keys))
 
 
 def _get_counter_many(store: typing.Callable, search_key: SearchKey) -> typing.Tuple[typing.List[str], typing.List[int]]:
-    """Returns counts under matched keys.
+    """Returns counts under matched keys - shards are folded into their counter.
     
     """
-    keys = []
-    chunk_size = 1000
-    cursor = '0'
-    while cursor != 0:
-        cursor, keys_ = store.scan(cursor=cursor, match=search_key.key, count=chunk_size)
-        keys += keys_
+    keys = list(_scan(store, match=search_key.key, count=1000))
+    if not keys:
+        return [], []
+
+    return _get_counter_many_folded(keys, store.mget(keys))
+
+
+def _get_counter_many_folded(keys: typing.List[bytes], counts: typing.List[bytes]) -> typing.Tuple[typing.List[str], typing.List[int]]:
+    """Returns counts under matched keys whereby counts of shards are summed under the key of their counter.
+
+    """
+    folded = dict()
+    for key, count in zip(keys, counts):
+        key = key.decode('utf8').split(SHARD_DELIMITER, 1)[0]
+        folded[key] = folded.get(key, 0) + (0 if count is None else int(count))
+
+    return list(folded.keys()), list(folded.values())
+
+
+def _get_counter_summed(counts: typing.List[bytes]) -> int:
+    """Returns count summed over a counter's shards - shards yet to be written to are skipped.
+
+    """
+    return sum(int(i) for i in counts if i is not None)
 
-    return [i.decode('utf8') for i in keys], [int(i) for i in store.mget(keys)]
+
+def _get_counters(store: typing.Callable, item_key: ItemKey) -> typing.Dict[str, float]:
+    """Returns set of counters held within a hash under exactly matched key.
+    
+    """
+    return _get_counters_decoded(store.hgetall(item_key.key))
+
+
+def _get_counters_decoded(counters: typing.Dict[bytes, bytes]) -> typing.Dict[str, float]:
+    """Returns set of counters pulled from a hash decoded as a map: counter -> value.
+    
+    """
+    return {k.decode("utf-8"): float(v) for k, v in counters.items()}
 
 
 def _get_count(store: typing.Callable, search_key: SearchKey) -> int:
     """Returns length of collection under matched keys.
     
     """
-    count = 0
-    chunk_size = 1000
-    cursor = '0'
-    while cursor != 0:
-        cursor, keys = store.scan(cursor=cursor, match=search_key.key, count=chunk_size)
-        count += len(keys)
-
-    return count
+    return sum(1 for _ in _scan(store, match=search_key.key, count=1000))
 
 
 def _get_one(store: typing.Callable, item_key: ItemKey) -> typing.Any:
@@ -95,57 +226,629 @@ def _get_one(store: typing.Callable, item_key: ItemKey) -> typing.Any:
     return _decode_item(store.get(item_key.key))
 
 
+def _get_one_by_index(store: typing.Callable, index_key: IndexKey) -> typing.Any:
+    """Returns item under key resolved from a secondary index.
+    
+    """
+    key = store.hget(index_key.key, index_key.field)
+    if key is None:
+        return
+
+    # Item may be held either under it's own key or within a collection hash.
+    path, name = key.rsplit(b":", 1)
+    with store.pipeline(transaction=False) as pipe:
+        pipe.get(key)
+        pipe.hget(path, name)
+        as_item, as_field = pipe.execute()
+
+    return _decode_item(as_item if as_item is not None else as_field)
+
+
 def _get_one_from_many(store: typing.Callable, item_key: ItemKey) -> typing.Any:
     """Returns item under first matched key.
     
     """
-    chunk_size = 1000
-    cursor = '0'
-    while cursor != 0:
-        cursor, keys = store.scan(cursor=cursor, match=item_key.key, count=chunk_size)
-        if keys:
-            return _decode_item(store.get(keys[0]))
+    for key in _scan(store, match=item_key.key, count=1000):
+        return _decode_item(store.get(key))
 
 
 def _get_many(store: typing.Callable, search_key: SearchKey) -> typing.List[typing.Any]:
     """Returns collection cached under all matched keys.
     
     """
-    keys = []
-    chunk_size = 2000
-    cursor = '0'
-    while cursor != 0:
-        cursor, keys_ = store.scan(cursor=cursor, match=search_key.key, count=chunk_size)
-        keys += keys_
+    keys = list(_scan(store, match=search_key.key, count=2000))
 
     return [_decode_item(i) for i in store.mget(keys)] if keys else []
 
 
+def _get_many_by_time(store: typing.Callable, range_key: TimeRangeKey) -> typing.List[typing.Any]:
+    """Returns collection cached under keys resolved from a time ordered index - in index order.
+    
+    """
+    num = -1 if range_key.limit is None else range_key.limit
+    if range_key.reverse:
+        keys = store.zrevrangebyscore(range_key.key, range_key.score_max, range_key.score_min, start=range_key.offset, num=num)
+    else:
+        keys = store.zrangebyscore(range_key.key, range_key.score_min, range_key.score_max, start=range_key.offset, num=num)
+    if not keys:
+        return []
+
+    # Items may be held either under their own keys or within collection hashes.
+    fields = _get_fields_by_path(keys)
+    with store.pipeline(transaction=False) as pipe:
+        pipe.mget(keys)
+        for path, names in fields.items():
+            pipe.hmget(path, names)
+        as_items, *as_fields = pipe.execute()
+
+    return _get_many_by_time_decoded(keys, fields, as_items, as_fields)
+
+
+def _get_many_by_time_decoded(
+    keys: typing.List[bytes],
+    fields: typing.Dict[bytes, typing.List[bytes]],
+    as_items: typing.List[bytes],
+    as_fields: typing.List[typing.List[bytes]],
+    ) -> typing.List[typing.Any]:
+    """Returns decoded items pulled from either their own keys or collection hash fields - in index order.
+    
+    """
+    as_fields = {(path, name): value for path, values in zip(fields, as_fields) for name, value in zip(fields[path], values)}
+
+    # Items expiring since being indexed are skipped.
+    values = [i if i is not None else as_fields.get(tuple(k.rsplit(b":", 1))) for i, k in zip(as_items, keys)]
+
+    return [_decode_item(i) for i in values if i is not None]
+
+
+def _get_many_stream(store: typing.Callable, search_key: SearchKey) -> typing.Iterator[typing.Any]:
+    """Yields collection cached under all matched keys - keys are pulled & decoded in chunks.
+    
+    """
+    keys = []
+    scan = lambda: _scan(store, match=search_key.key, count=EnvVars.STREAM_CHUNK_SIZE)
+    for key in _iterate_with_retry(scan, lambda i: i):
+        keys.append(key)
+        if len(keys) == EnvVars.STREAM_CHUNK_SIZE:
+            yield from _get_many_chunk(store, keys)
+            keys = []
+    if keys:
+        yield from _get_many_chunk(store, keys)
+
+
+def _get_many_chunk(store: typing.Callable, keys: typing.List[bytes]) -> typing.Iterator[typing.Any]:
+    """Yields items cached under a chunk of keys - items expiring whilst streaming are skipped.
+    
+    """
+    for value in _execute_with_retry(lambda i: i.mget(keys), store):
+        if value is not None:
+            yield _decode_item(value)
+
+
+def _get_fields_by_path(keys: typing.List[bytes]) -> typing.Dict[bytes, typing.List[bytes]]:
+    """Returns item keys grouped as collection hash fields.
+    
+    """
+    fields = collections.defaultdict(list)
+    for key in keys:
+        path, name = key.rsplit(b":", 1)
+        fields[path].append(name)
+
+    return fields
+
+
 def _incr(store: typing.Callable, item_key: CountIncrementKey) -> typing.Any:
     """Increments count under exactly matched key.
     
     """
-    return store.incrby(item_key.key, item_key.amount)
+    key = item_key.shard_key
+    with store.pipeline(transaction=False) as pipe:
+        pipe.incrby(key, item_key.amount)
+        _register_run_key(pipe, item_key, key)
+        return pipe.execute()[0]
+
+
+def _register_run_key(pipe: typing.Callable, obj: typing.Any, key: str):
+    """Registers a run scoped key within it's run's key set so that the run can subsequently be pruned without scanning.
+    
+    """
+    if obj.run_keys_key is not None:
+        pipe.sadd(obj.run_keys_key, key)
+
+
+def _set_index_entry(pipe: typing.Callable, index: typing.Union[IndexKey, TimeIndexKey], key: str):
+    """Sets (or removes) a secondary index entry mapping to an item key.
+    
+    """
+    if isinstance(index, TimeIndexKey) and index.remove:
+        pipe.zrem(index.key, key)
+    elif isinstance(index, TimeIndexKey):
+        pipe.zadd(index.key, {key: index.timestamp})
+    else:
+        pipe.hset(index.key, index.field, key)
+    _register_run_key(pipe, index, index.key)
+
+
+def _scan(store: typing.Callable, match: str, count: int, _type: str = None) -> typing.Iterator[bytes]:
+    """Yields keys matching a pattern.
+
+    """
+    for key in store.scan_iter(match=match, count=count, _type=_type):
+        stats.on_match()
+        yield key
+
+
+def _set_index(store: typing.Callable, item: Item) -> str:
+    """Sets secondary index entries of an item.
+    
+    """
+    with store.pipeline() as pipe:
+        for index in item.indexes:
+            _set_index_entry(pipe, index, item.key)
+        pipe.execute()
+
+    return item.key
 
 
 def _set_one(store: typing.Callable, item: Item) -> str:
-    """Set item under a key.
+    """Set item under a key - secondary index entries & run key registrations are written atomically alongside.
     
     """
-    store.set(item.key, item.data_as_json, ex=item.expiration)
+    if not item.indexes and item.run_keys_key is None:
+        store.set(item.key, _encode_item(item), ex=item.expiration)
+    else:
+        with store.pipeline(transaction=True) as pipe:
+            pipe.set(item.key, _encode_item(item), ex=item.expiration)
+            _register_run_key(pipe, item, item.key)
+            for index in item.indexes:
+                _set_index_entry(pipe, index, item.key)
+            pipe.execute()
 
     return item.key
 
 
 def _set_one_singleton(store: typing.Callable, item: Item) -> typing.Tuple[str, bool]:
-    """Sets item under a key if not already cached.
+    """Sets item (plus expiry) under a key if not already cached.
+    
+    """
+    with store.pipeline(transaction=True) as pipe:
+        pipe.set(item.key, _encode_item(item), ex=item.expiration, nx=True)
+        _register_run_key(pipe, item, item.key)
+        return item.key, bool(pipe.execute()[0])
+
+
+def _get_hash_keys(store: typing.Callable, path: str, wildcard: str = "") -> typing.List[str]:
+    """Returns keys of collection hashes matching a path - an exactly matched path is resolved without scanning.
+    
+    """
+    if "*" not in path and store.exists(path):
+        return [path]
+
+    return list(_scan(store, match=f"{path}{wildcard}", count=1000, _type="hash"))
+
+
+def _hash_decr(store: typing.Callable, decrement: CountDecrementKey):
+    """Decrements count under a collection hash field.
+    
+    """
+    with store.pipeline(transaction=False) as pipe:
+        pipe.hincrby(decrement.path, decrement.name, -decrement.amount)
+        _register_run_key(pipe, decrement, decrement.path)
+        pipe.execute()
+
+
+def _hash_delete_one(store: typing.Callable, item_key: ItemKey):
+    """Deletes item under a collection hash field.
+    
+    """
+    store.hdel(item_key.path, item_key.name)
+
+
+def _hash_delete_many(store: typing.Callable, search_key: SearchKey):
+    """Deletes collection hashes under matching keys.
+
+    """
+    keys = _get_hash_keys(store, search_key.path, search_key.wildcard)
+    if keys:
+        store.unlink(*keys)
+
+
+def _hash_get_counter_one(store: typing.Callable, item_key: ItemKey) -> int:
+    """Returns count under a collection hash field.
+    
+    """
+    count = store.hget(item_key.path, item_key.name)
+
+    return 0 if count is None else int(count)
+
+
+def _hash_get_counter_many(store: typing.Callable, search_key: SearchKey) -> typing.Tuple[typing.List[str], typing.List[int]]:
+    """Returns counts under matched collection hashes.
+    
+    """
+    keys, counts = [], []
+    for key in _get_hash_keys(store, search_key.path, search_key.wildcard):
+        for field, count in store.hgetall(key).items():
+            keys.append(f"{key.decode('utf8')}:{field.decode('utf8')}")
+            counts.append(int(count))
+
+    return keys, counts
+
+
+def _hash_get_count(store: typing.Callable, search_key: SearchKey) -> int:
+    """Returns length of matched collection hashes.
+    
+    """
+    return sum(store.hlen(i) for i in _get_hash_keys(store, search_key.path, search_key.wildcard))
+
+
+def _hash_get_one(store: typing.Callable, item_key: ItemKey) -> typing.Any:
+    """Returns item under a collection hash field.
+    
+    """
+    return _decode_item(store.hget(item_key.path, item_key.name))
+
+
+def _hash_get_one_from_many(store: typing.Callable, item_key: ItemKey) -> typing.Any:
+    """Returns item under first matched collection hash field.
+    
+    """
+    for key in _get_hash_keys(store, item_key.path):
+        for _, value in store.hscan_iter(key, match=item_key.name, count=1000):
+            return _decode_item(value)
+
+
+def _hash_get_many(store: typing.Callable, search_key: SearchKey) -> typing.List[typing.Any]:
+    """Returns collection cached under matched collection hashes.
+    
+    """
+    return [_decode_item(j) for i in _get_hash_keys(store, search_key.path, search_key.wildcard) for j in store.hvals(i)]
+
+
+def _hash_get_many_stream(store: typing.Callable, search_key: SearchKey) -> typing.Iterator[typing.Any]:
+    """Yields collection cached under matched collection hashes - fields are pulled & decoded in chunks.
+    
+    """
+    for key in _execute_with_retry(lambda i: _get_hash_keys(i, search_key.path, search_key.wildcard), store):
+        hscan = lambda: store.hscan_iter(key, count=EnvVars.STREAM_CHUNK_SIZE)
+        for _, value in _iterate_with_retry(hscan, lambda i: i[0]):
+            yield _decode_item(value)
+
+
+def _hash_incr(store: typing.Callable, item_key: CountIncrementKey) -> typing.Any:
+    """Increments count under a collection hash field.
+    
+    """
+    with store.pipeline(transaction=False) as pipe:
+        pipe.hincrby(item_key.path, item_key.name, item_key.amount)
+        _register_run_key(pipe, item_key, item_key.path)
+        return pipe.execute()[0]
+
+
+def _hash_set_one(store: typing.Callable, item: Item) -> str:
+    """Set item under a collection hash field - secondary index entries are written atomically alongside.
+    
+    """
+    _validate_hashed_item(item)
+    with store.pipeline(transaction=True) as pipe:
+        pipe.hset(item.path, item.name, _encode_item(item))
+        _register_run_key(pipe, item, item.path)
+        for index in item.indexes:
+            _set_index_entry(pipe, index, item.key)
+        pipe.execute()
+
+    return item.key
+
+
+def _hash_set_one_singleton(store: typing.Callable, item: Item) -> typing.Tuple[str, bool]:
+    """Sets item under a collection hash field if not already cached.
+    
+    """
+    _validate_hashed_item(item)
+    with store.pipeline(transaction=True) as pipe:
+        pipe.hsetnx(item.path, item.name, _encode_item(item))
+        _register_run_key(pipe, item, item.path)
+        was_cached = bool(pipe.execute()[0])
+
+    return item.key, was_cached
+
+
+async def _delete_many_async(store: typing.Callable, search_key: SearchKey):
+    """Deletes items under matching keys - asyncio flavour.
+
+    """
+    await _delete_matched_async(store, search_key.key)
+
+
+async def _delete_matched_async(store: typing.Callable, match: str):
+    """Deletes keys matching a pattern - asyncio flavour.
+
+    """
+    chunk_size = 1000
+    keys = []
+    async for key in _scan_async(store, match=match, count=chunk_size):
+        keys.append(key)
+        if len(keys) == chunk_size:
+            await store.unlink(*keys)
+            keys = []
+    if keys:
+        await store.unlink(*keys)
+
+
+async def _delete_index_async(store: typing.Callable, prune_key: IndexPruneKey):
+    """Deletes index entries referenced by a scoped sub-index, and then the sub-index itself - asyncio flavour.
+
+    """
+    chunk_size = 1000
+    cursor = '0'
+    while cursor != 0:
+        cursor, entries = await store.hscan(prune_key.scope_key, cursor=cursor, count=chunk_size)
+        if entries:
+            await store.hdel(prune_key.key, *entries.keys())
+    await store.unlink(prune_key.scope_key)
+
+
+async def _delete_run_async(store: typing.Callable, prune_key: RunPruneKey):
+    """Deletes keys registered within a run's key set - asyncio flavour.
+
+    """
+    # Runs cached prior to key set registration are pruned by scanning.
+    if not await store.exists(prune_key.key):
+        await _delete_matched_async(store, prune_key.scan_match)
+        return
+
+    chunk_size = 1000
+    keys = []
+    async for key in store.sscan_iter(prune_key.key, match=prune_key.match, count=chunk_size):
+        stats.on_match()
+        keys.append(key)
+        if len(keys) == chunk_size:
+            await _delete_run_keys_async(store, prune_key, keys)
+            keys = []
+    if keys:
+        await _delete_run_keys_async(store, prune_key, keys)
+
+    # Key set is retained when a subset of a run's keys are pruned.
+    if prune_key.match is None:
+        await store.unlink(prune_key.key)
+
+
+async def _delete_run_keys_async(store: typing.Callable, prune_key: RunPruneKey, keys: typing.List[bytes]):
+    """Deletes a chunk of keys registered within a run's key set - asyncio flavour.
+
+    """
+    async with store.pipeline(transaction=False) as pipe:
+        pipe.unlink(*keys)
+        if prune_key.match is not None:
+            pipe.srem(prune_key.key, *keys)
+        await pipe.execute()
+
+
+async def _eval_script_async(store: typing.Callable, script_key: ScriptKey) -> typing.Any:
+    """Evaluates a server side script - asyncio flavour.
+
+    """
+    return await scripts.execute_async(store, script_key.script, script_key.keys, script_key.args)
+
+
+async def _get_counter_many_async(store: typing.Callable, search_key: SearchKey) -> typing.Tuple[typing.List[str], typing.List[int]]:
+    """Returns counts under matched keys - asyncio flavour.
+    
+    """
+    keys = [i async for i in _scan_async(store, match=search_key.key, count=1000)]
+    if not keys:
+        return [], []
+
+    return _get_counter_many_folded(keys, await store.mget(keys))
+
+
+async def _get_count_async(store: typing.Callable, search_key: SearchKey) -> int:
+    """Returns length of collection under matched keys - asyncio flavour.
+    
+    """
+    return len([i async for i in _scan_async(store, match=search_key.key, count=1000)])
+
+
+async def _get_one_by_index_async(store: typing.Callable, index_key: IndexKey) -> typing.Any:
+    """Returns item under key resolved from a secondary index - asyncio flavour.
+    
+    """
+    key = await store.hget(index_key.key, index_key.field)
+    if key is None:
+        return
+
+    # Item may be held either under it's own key or within a collection hash.
+    path, name = key.rsplit(b":", 1)
+    async with store.pipeline(transaction=False) as pipe:
+        pipe.get(key)
+        pipe.hget(path, name)
+        as_item, as_field = await pipe.execute()
+
+    return _decode_item(as_item if as_item is not None else as_field)
+
+
+async def _get_one_from_many_async(store: typing.Callable, item_key: ItemKey) -> typing.Any:
+    """Returns item under first matched key - asyncio flavour.
+    
+    """
+    async for key in _scan_async(store, match=item_key.key, count=1000):
+        return _decode_item(await store.get(key))
+
+
+async def _get_many_async(store: typing.Callable, search_key: SearchKey) -> typing.List[typing.Any]:
+    """Returns collection cached under all matched keys - asyncio flavour.
+    
+    """
+    keys = [i async for i in _scan_async(store, match=search_key.key, count=2000)]
+
+    return [_decode_item(i) for i in await store.mget(keys)] if keys else []
+
+
+async def _get_many_by_time_async(store: typing.Callable, range_key: TimeRangeKey) -> typing.List[typing.Any]:
+    """Returns collection cached under keys resolved from a time ordered index - asyncio flavour.
+    
+    """
+    num = -1 if range_key.limit is None else range_key.limit
+    if range_key.reverse:
+        keys = await store.zrevrangebyscore(range_key.key, range_key.score_max, range_key.score_min, start=range_key.offset, num=num)
+    else:
+        keys = await store.zrangebyscore(range_key.key, range_key.score_min, range_key.score_max, start=range_key.offset, num=num)
+    if not keys:
+        return []
+
+    # Items may be held either under their own keys or within collection hashes.
+    fields = _get_fields_by_path(keys)
+    async with store.pipeline(transaction=False) as pipe:
+        pipe.mget(keys)
+        for path, names in fields.items():
+            pipe.hmget(path, names)
+        as_items, *as_fields = await pipe.execute()
+
+    return _get_many_by_time_decoded(keys, fields, as_items, as_fields)
+
+
+async def _get_many_stream_async(store: typing.Callable, search_key: SearchKey) -> typing.AsyncIterator[typing.Any]:
+    """Returns an asynchronous iterator over collection cached under all matched keys.
+    
+    """
+    async def _get_chunk(keys):
+        return [_decode_item(i) for i in await _execute_with_retry_async(lambda j: j.mget(keys), store) if i is not None]
+
+    async def _iterate():
+        keys = []
+        scan = lambda: _scan_async(store, match=search_key.key, count=EnvVars.STREAM_CHUNK_SIZE)
+        async for key in _iterate_with_retry_async(scan, lambda i: i):
+            keys.append(key)
+            if len(keys) == EnvVars.STREAM_CHUNK_SIZE:
+                for item in await _get_chunk(keys):
+                    yield item
+                keys = []
+        if keys:
+            for item in await _get_chunk(keys):
+                yield item
+
+    return _iterate()
+
+
+async def _scan_async(store: typing.Callable, match: str, count: int, _type: str = None) -> typing.AsyncIterator[bytes]:
+    """Yields keys matching a pattern - asyncio flavour.
+
+    """
+    async for key in store.scan_iter(match=match, count=count, _type=_type):
+        stats.on_match()
+        yield key
+
+
+async def _set_index_async(store: typing.Callable, item: Item) -> str:
+    """Sets secondary index entries of an item - asyncio flavour.
+    
+    """
+    async with store.pipeline() as pipe:
+        for index in item.indexes:
+            _set_index_entry(pipe, index, item.key)
+        await pipe.execute()
+
+    return item.key
+
+
+async def _get_hash_keys_async(store: typing.Callable, path: str, wildcard: str = "") -> typing.List[str]:
+    """Returns keys of collection hashes matching a path - asyncio flavour.
+    
+    """
+    if "*" not in path and await store.exists(path):
+        return [path]
+
+    return [i async for i in _scan_async(store, match=f"{path}{wildcard}", count=1000, _type="hash")]
+
+
+async def _hash_delete_many_async(store: typing.Callable, search_key: SearchKey):
+    """Deletes collection hashes under matching keys - asyncio flavour.
+
+    """
+    keys = await _get_hash_keys_async(store, search_key.path, search_key.wildcard)
+    if keys:
+        await store.unlink(*keys)
+
+
+async def _hash_get_counter_many_async(store: typing.Callable, search_key: SearchKey) -> typing.Tuple[typing.List[str], typing.List[int]]:
+    """Returns counts under matched collection hashes - asyncio flavour.
     
     """
-    key, was_cached = item.key, bool(store.setnx(item.key, item.data_as_json))
-    if was_cached and item.expiration:
-        store.expire(key, item.expiration)
+    keys, counts = [], []
+    for key in await _get_hash_keys_async(store, search_key.path, search_key.wildcard):
+        for field, count in (await store.hgetall(key)).items():
+            keys.append(f"{key.decode('utf8')}:{field.decode('utf8')}")
+            counts.append(int(count))
 
-    return key, was_cached  
+    return keys, counts
+
+
+async def _hash_get_count_async(store: typing.Callable, search_key: SearchKey) -> int:
+    """Returns length of matched collection hashes - asyncio flavour.
+    
+    """
+    return sum([await store.hlen(i) for i in await _get_hash_keys_async(store, search_key.path, search_key.wildcard)])
+
+
+async def _hash_get_one_from_many_async(store: typing.Callable, item_key: ItemKey) -> typing.Any:
+    """Returns item under first matched collection hash field - asyncio flavour.
+    
+    """
+    for key in await _get_hash_keys_async(store, item_key.path):
+        async for _, value in store.hscan_iter(key, match=item_key.name, count=1000):
+            return _decode_item(value)
+
+
+async def _hash_get_many_async(store: typing.Callable, search_key: SearchKey) -> typing.List[typing.Any]:
+    """Returns collection cached under matched collection hashes - asyncio flavour.
+    
+    """
+    return [
+        _decode_item(j)
+        for i in await _get_hash_keys_async(store, search_key.path, search_key.wildcard)
+        for j in await store.hvals(i)
+        ]
+
+
+async def _hash_get_many_stream_async(store: typing.Callable, search_key: SearchKey) -> typing.AsyncIterator[typing.Any]:
+    """Returns an asynchronous iterator over collection cached under matched collection hashes.
+    
+    """
+    async def _iterate():
+        get_keys = lambda i: _get_hash_keys_async(i, search_key.path, search_key.wildcard)
+        for key in await _execute_with_retry_async(get_keys, store):
+            hscan = lambda: store.hscan_iter(key, count=EnvVars.STREAM_CHUNK_SIZE)
+            async for _, value in _iterate_with_retry_async(hscan, lambda i: i[0]):
+                yield _decode_item(value)
+
+    return _iterate()
+
+
+async def _hash_set_one_singleton_async(store: typing.Callable, item: Item) -> typing.Tuple[str, bool]:
+    """Sets item under a collection hash field if not already cached - asyncio flavour.
+    
+    """
+    _validate_hashed_item(item)
+    async with store.pipeline(transaction=True) as pipe:
+        pipe.hsetnx(item.path, item.name, _encode_item(item))
+        _register_run_key(pipe, item, item.path)
+        was_cached = bool((await pipe.execute())[0])
+
+    return item.key, was_cached
+
+
+def _get_pipelined_handler(handler: typing.Callable, parser: typing.Callable) -> typing.Callable:
+    """Returns an asyncio command wrapper that applies a batchable operation within it's own pipeline.
+    
+    """
+    async def _execute(store: typing.Callable, obj: typing.Any) -> typing.Any:
+        async with store.pipeline(transaction=True) as pipe:
+            handler(pipe, obj)
+            results = await pipe.execute()
+
+        return parser(obj, results[0])
+
+    return _execute
 
 
 # Map: operation -> redis command wrapper.
@@ -153,17 +856,155 @@ _HANDLERS = {
     StoreOperation.COUNTER_DECR: _decr,
     StoreOperation.DELETE_ONE: _delete_one,
     StoreOperation.DELETE_MANY: _delete_many,
+    StoreOperation.DELETE_INDEX: _delete_index,
+    StoreOperation.DELETE_RUN: _delete_run,
+    StoreOperation.EVAL_SCRIPT: _eval_script,
     StoreOperation.GET_COUNT: _get_count,
     StoreOperation.GET_COUNTER_ONE: _get_counter_one,
     StoreOperation.GET_COUNTER_MANY: _get_counter_many,
+    StoreOperation.GET_COUNTERS: _get_counters,
     StoreOperation.GET_ONE: _get_one,
+    StoreOperation.GET_ONE_BY_INDEX: _get_one_by_index,
     StoreOperation.GET_ONE_FROM_MANY: _get_one_from_many,
     StoreOperation.GET_MANY: _get_many,
+    StoreOperation.GET_MANY_BY_TIME: _get_many_by_time,
+    StoreOperation.GET_MANY_STREAM: _get_many_stream,
     StoreOperation.COUNTER_INCR: _incr,
+    StoreOperation.SET_INDEX: _set_index,
     StoreOperation.SET_ONE: _set_one,
     StoreOperation.SET_ONE_SINGLETON: _set_one_singleton,
 }
 
+# Map: operation -> redis command wrapper (collection hash mode).
+_HASH_HANDLERS = {
+    StoreOperation.COUNTER_DECR: _hash_decr,
+    StoreOperation.DELETE_ONE: _hash_delete_one,
+    StoreOperation.DELETE_MANY: _hash_delete_many,
+    StoreOperation.DELETE_RUN: _delete_run,
+    StoreOperation.GET_COUNT: _hash_get_count,
+    StoreOperation.GET_COUNTER_ONE: _hash_get_counter_one,
+    StoreOperation.GET_COUNTER_MANY: _hash_get_counter_many,
+    StoreOperation.GET_ONE: _hash_get_one,
+    StoreOperation.GET_ONE_FROM_MANY: _hash_get_one_from_many,
+    StoreOperation.GET_MANY: _hash_get_many,
+    StoreOperation.GET_MANY_BY_TIME: _get_many_by_time,
+    StoreOperation.GET_MANY_STREAM: _hash_get_many_stream,
+    StoreOperation.COUNTER_INCR: _hash_incr,
+    StoreOperation.SET_INDEX: _set_index,
+    StoreOperation.SET_ONE: _hash_set_one,
+    StoreOperation.SET_ONE_SINGLETON: _hash_set_one_singleton,
+}
+
+# Map: operation -> (pipelined redis command wrapper, pipelined result parser).
+_BATCH_HANDLERS = {
+    StoreOperation.COUNTER_DECR: (
+        lambda pipe, obj: [pipe.decrby(obj.shard_key, obj.amount), _register_run_key(pipe, obj, obj.shard_key)],
+        lambda obj, result: result,
+    ),
+    StoreOperation.COUNTER_INCR: (
+        lambda pipe, obj: [pipe.incrby(obj.shard_key, obj.amount), _register_run_key(pipe, obj, obj.shard_key)],
+        lambda obj, result: result,
+    ),
+    StoreOperation.DELETE_ONE: (
+        lambda pipe, obj: pipe.delete(obj.key),
+        lambda obj, result: None,
+    ),
+    StoreOperation.GET_COUNTER_ONE: (
+        lambda pipe, obj: pipe.mget(obj.shard_keys),
+        lambda obj, result: _get_counter_summed(result),
+    ),
+    StoreOperation.GET_COUNTERS: (
+        lambda pipe, obj: pipe.hgetall(obj.key),
+        lambda obj, result: _get_counters_decoded(result),
+    ),
+    StoreOperation.GET_ONE: (
+        lambda pipe, obj: pipe.get(obj.key),
+        lambda obj, result: _decode_item(result),
+    ),
+    StoreOperation.SET_INDEX: (
+        lambda pipe, obj: [_set_index_entry(pipe, i, obj.key) for i in obj.indexes],
+        lambda obj, result: obj.key,
+    ),
+    StoreOperation.SET_ONE: (
+        lambda pipe, obj: [pipe.set(obj.key, _encode_item(obj), ex=obj.expiration), _register_run_key(pipe, obj, obj.key)] + \
+                          [_set_index_entry(pipe, i, obj.key) for i in obj.indexes],
+        lambda obj, result: obj.key,
+    ),
+    StoreOperation.SET_ONE_SINGLETON: (
+        lambda pipe, obj: [pipe.set(obj.key, _encode_item(obj), ex=obj.expiration, nx=True), _register_run_key(pipe, obj, obj.key)],
+        lambda obj, result: (obj.key, bool(result)),
+    ),
+}
+
+# Map: operation -> (pipelined redis command wrapper, pipelined result parser) (collection hash mode).
+_BATCH_HASH_HANDLERS = {
+    StoreOperation.COUNTER_DECR: (
+        lambda pipe, obj: [pipe.hincrby(obj.path, obj.name, -obj.amount), _register_run_key(pipe, obj, obj.path)],
+        lambda obj, result: result,
+    ),
+    StoreOperation.COUNTER_INCR: (
+        lambda pipe, obj: [pipe.hincrby(obj.path, obj.name, obj.amount), _register_run_key(pipe, obj, obj.path)],
+        lambda obj, result: result,
+    ),
+    StoreOperation.DELETE_ONE: (
+        lambda pipe, obj: pipe.hdel(obj.path, obj.name),
+        lambda obj, result: None,
+    ),
+    StoreOperation.GET_COUNTER_ONE: (
+        lambda pipe, obj: pipe.hget(obj.path, obj.name),
+        lambda obj, result: 0 if result is None else int(result),
+    ),
+    StoreOperation.GET_ONE: (
+        lambda pipe, obj: pipe.hget(obj.path, obj.name),
+        lambda obj, result: _decode_item(result),
+    ),
+    StoreOperation.SET_INDEX: (
+        lambda pipe, obj: [_set_index_entry(pipe, i, obj.key) for i in obj.indexes],
+        lambda obj, result: obj.key,
+    ),
+    StoreOperation.SET_ONE: (
+        lambda pipe, obj: [_validate_hashed_item(obj), pipe.hset(obj.path, obj.name, _encode_item(obj))] + \
+                          [_register_run_key(pipe, obj, obj.path)] + \
+                          [_set_index_entry(pipe, i, obj.key) for i in obj.indexes],
+        lambda obj, result: obj.key,
+    ),
+}
+
+# Map: operation -> asyncio redis command wrapper.
+_ASYNC_HANDLERS = {
+    **{k: _get_pipelined_handler(*v) for k, v in _BATCH_HANDLERS.items()},
+    StoreOperation.DELETE_MANY: _delete_many_async,
+    StoreOperation.DELETE_INDEX: _delete_index_async,
+    StoreOperation.DELETE_RUN: _delete_run_async,
+    StoreOperation.EVAL_SCRIPT: _eval_script_async,
+    StoreOperation.GET_COUNT: _get_count_async,
+    StoreOperation.GET_COUNTER_MANY: _get_counter_many_async,
+    StoreOperation.GET_ONE_BY_INDEX: _get_one_by_index_async,
+    StoreOperation.GET_ONE_FROM_MANY: _get_one_from_many_async,
+    StoreOperation.GET_MANY: _get_many_async,
+    StoreOperation.GET_MANY_BY_TIME: _get_many_by_time_async,
+    StoreOperation.GET_MANY_STREAM: _get_many_stream_async,
+    StoreOperation.SET_INDEX: _set_index_async,
+}
+
+# Map: operation -> asyncio redis command wrapper (collection hash mode).
+_ASYNC_HASH_HANDLERS = {
+    **{k: _get_pipelined_handler(*v) for k, v in _BATCH_HASH_HANDLERS.items()},
+    StoreOperation.DELETE_MANY: _hash_delete_many_async,
+    StoreOperation.DELETE_RUN: _delete_run_async,
+    StoreOperation.GET_COUNT: _hash_get_count_async,
+    StoreOperation.GET_COUNTER_MANY: _hash_get_counter_many_async,
+    StoreOperation.GET_ONE_FROM_MANY: _hash_get_one_from_many_async,
+    StoreOperation.GET_MANY: _hash_get_many_async,
+    StoreOperation.GET_MANY_BY_TIME: _get_many_by_time_async,
+    StoreOperation.GET_MANY_STREAM: _hash_get_many_stream_async,
+    StoreOperation.SET_INDEX: _set_index_async,
+    StoreOperation.SET_ONE_SINGLETON: _hash_set_one_singleton_async,
+}
+
+# Map: partition -> set of collections stored as hashes when operating in collection hash mode.
+_HASH_COLLECTIONS = dict()
+
 # Set of partitions whereby keys are prefixed with os-user. 
 _USER_PARTITIONS = {
     StorePartition.ORCHESTRATION,
@@ -173,10 +1014,115 @@ _USER_PARTITIONS = {
 # Max. number of times an operation will be tried.
 _MAX_OP_ATTEMPTS = 5
 
+# Set of operations that may be served by a read replica when issued from within a read-only context.
+_REPLICA_OPERATIONS = {
+    StoreOperation.GET_COUNT,
+    StoreOperation.GET_COUNTER_ONE,
+    StoreOperation.GET_COUNTER_MANY,
+    StoreOperation.GET_COUNTERS,
+    StoreOperation.GET_ONE,
+    StoreOperation.GET_ONE_BY_INDEX,
+    StoreOperation.GET_ONE_FROM_MANY,
+    StoreOperation.GET_MANY,
+    StoreOperation.GET_MANY_BY_TIME,
+    StoreOperation.GET_MANY_STREAM,
+}
+
+# Thread local holder of currently active batch.
+_BATCH_SCOPE = threading.local()
+
+# Thread local holder of flag indicating whether a read-only context is active.
+_READ_ONLY_SCOPE = threading.local()
+
+
+class CacheBatch():
+    """Queues cache operations issued against a partition and flushes them within a single pipelined transaction.
+
+    """
+    def __init__(self, partition: StorePartition):
+        self.operations = []
+        self.partition = partition
+        self.results = None
+
+    def __enter__(self):
+        if getattr(_BATCH_SCOPE, "batch", None) is not None:
+            raise RuntimeError("Cache batches cannot be nested.")
+        _BATCH_SCOPE.batch = self
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _BATCH_SCOPE.batch = None
+        if exc_type is None:
+            self.results = self.flush()
+
+    def enqueue(self, operation: StoreOperation, obj: typing.Any):
+        """Queues an operation for subsequent pipelined execution.
+
+        :param operation: Cache operation to apply.
+        :param obj: Key or item to which operation will be applied.
+
+        """
+        handlers = _BATCH_HASH_HANDLERS if is_hashed(self.partition, obj) else _BATCH_HANDLERS
+        if operation not in handlers:
+            raise ValueError(f"Cache operation cannot be batched: {operation.name}")
+
+        self.operations.append((operation, obj, handlers[operation]))
+
+    def flush(self) -> typing.List[typing.Any]:
+        """Executes queued operations within a single round trip.
+
+        :returns: Per operation results in order of enqueueing.
+
+        """
+        if not self.operations:
+            return []
+
+        # An operation may issue several commands - the first command's result is the operation's result.
+        offsets = []
+        def _execute(store):
+            offsets.clear()
+            with store.pipeline(transaction=True) as pipe:
+                for _, obj, (handler, _) in self.operations:
+                    offsets.append(len(pipe.command_stack))
+                    handler(pipe, obj)
+                return pipe.execute()
+
+        with stats.instrument(self.partition, "BATCH", "flush"):
+            with stores.get_store(self.partition, _is_replica_eligible(*[i for i, _, _ in self.operations])) as store:
+                results = _execute_with_retry(_execute, store)
+
+        # Invalidate process local reads.
+        if local.is_enabled(self.partition) and \
+           local.WRITE_OPERATIONS.intersection([i for i, _, _ in self.operations]):
+            local.invalidate(self.partition)
+
+        return [
+            parser(obj, results[offset])
+            for (_, obj, (_, parser)), offset in zip(self.operations, offsets)
+            ]
+
+
+def cache_batch(partition: StorePartition) -> CacheBatch:
+    """Returns a context manager within which operations against a partition are pipelined.
+
+    Operations issued within the context return None, results are available via the
+    batch's results attribute once the context exits.
+
+    :param partition: Cache partition to which batched operations pertain.
+
+    :returns: A cache batch.
+
+    """
+    return CacheBatch(partition)
+
 
 def cache_op(partition: StorePartition, operation: StoreOperation) -> typing.Callable:
     """Decorator to orthoganally process a cache operation.
 
+    An asyncio flavour of the decorated function is exposed as it's aio attribute - awaitable
+    operations share the same key builders but cannot be batched.
+
     :param partition: Cache partition to which operation pertains.
     :param operation: Cache operation to apply.
 
@@ -186,32 +1132,258 @@ def cache_op(partition: StorePartition, operation: StoreOperation) -> typing.Cal
     def decorator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            # JIT extend encoder - ensures all types are registered.
-            encoder.initialise()
-            
-            
-            with stores.get_store(partition) as store:
+            with stats.instrument(partition, operation.name, func.__name__) as instrumentation:
+                # JIT extend encoder - ensures all types are registered.
+                encoder.initialise()
+
+                # Invoke inner function.
+                obj = func(*args, **kwargs)
+                if obj is None:
+                    return
+
+                # Apply key prefixing & namespacing.
+                _apply_key_scope(partition, obj)
+
+                # Defer operation when batching.
+                batch = getattr(_BATCH_SCOPE, "batch", None)
+                if batch is not None and batch.partition == partition:
+                    batch.enqueue(operation, obj)
+                    return
+
+                # Streams are pulled (& measured) whilst being consumed.
+                if operation == StoreOperation.GET_MANY_STREAM:
+                    return instrumentation.measure_iterator(_stream(partition, operation, obj))
+
+                # Process local reads are returned when cached.
+                is_local = local.is_enabled(partition)
+                if is_local and operation in local.READ_OPERATIONS:
+                    was_found, result = local.get_item(partition, operation, obj)
+                    if was_found:
+                        stats.on_local_hit()
+                        return result
+
+                # Store accessors are bound to a process wide connection pool per partition.
+                handler = _HASH_HANDLERS[operation] if is_hashed(partition, obj) else _HANDLERS[operation]
+                with stores.get_store(partition, _is_replica_eligible(operation)) as store:
+                    result = _execute_with_retry(lambda i: handler(i, obj), store)
+
+                # Maintain process local reads.
+                if is_local and operation in local.READ_OPERATIONS:
+                    local.set_item(partition, operation, obj, result)
+                elif is_local and operation in local.WRITE_OPERATIONS:
+                    local.invalidate(partition)
+
+                return result
+
+        @functools.wraps(func)
+        async def wrapper_async(*args, **kwargs):
+            with stats.instrument(partition, operation.name, func.__name__) as instrumentation:
+                # JIT extend encoder - ensures all types are registered.
+                encoder.initialise()
+
                 # Invoke inner function.
                 obj = func(*args, **kwargs)
                 if obj is None:
                     return
-                
-                # Apply key prefixing.
-                if partition in _USER_PARTITIONS:
-                    obj.apply_key_prefix()
-                
-                # Invoke operation applying retry semantics in case of broken pipes.
-                # TODO: revisit connection pooling, 
-                attempts = 0
-                handler = _HANDLERS[operation]
-                while attempts < _MAX_OP_ATTEMPTS:
-                    try:
-                        return handler(store, obj)
-                    except redis.ConnectionError as err:
-                        attempts += 1
-                        if attempts == _MAX_OP_ATTEMPTS:
-                            raise err
-                        time.sleep(float(0.01))
+
+                # Apply key prefixing & namespacing.
+                _apply_key_scope(partition, obj)
+
+                # Streams are pulled (& measured) whilst being consumed.
+                if operation == StoreOperation.GET_MANY_STREAM:
+                    return instrumentation.measure_iterator_async(_stream_async(partition, operation, obj))
+
+                # Process local reads are returned when cached.
+                is_local = local.is_enabled(partition)
+                if is_local and operation in local.READ_OPERATIONS:
+                    was_found, result = local.get_item(partition, operation, obj)
+                    if was_found:
+                        stats.on_local_hit()
+                        return result
+
+                # Store accessors are bound to an event loop wide connection pool per partition.
+                handler = _ASYNC_HASH_HANDLERS[operation] if is_hashed(partition, obj) else _ASYNC_HANDLERS[operation]
+                async with stores.get_store_async(partition, _is_replica_eligible(operation)) as store:
+                    result = await _execute_with_retry_async(lambda i: handler(i, obj), store)
+
+                # Maintain process local reads.
+                if is_local and operation in local.READ_OPERATIONS:
+                    local.set_item(partition, operation, obj, result)
+                elif is_local and operation in local.WRITE_OPERATIONS:
+                    local.invalidate(partition)
+
+                return result
+
+        wrapper.aio = wrapper_async
 
         return wrapper
     return decorator
+
+
+@contextlib.contextmanager
+def cache_read_only() -> typing.Iterator[None]:
+    """Returns a context manager within which read operations may be served by a read replica.
+
+    Intended for view & reporting tools so that their scans do not load the primary - writes,
+    locks & server side scripts are always applied against the primary.  Replica reads may lag.
+
+    """
+    is_read_only = getattr(_READ_ONLY_SCOPE, "is_read_only", False)
+    _READ_ONLY_SCOPE.is_read_only = True
+    try:
+        yield
+    finally:
+        _READ_ONLY_SCOPE.is_read_only = is_read_only
+
+
+def is_hashed(partition: StorePartition, obj: typing.Any) -> bool:
+    """Returns flag indicating whether a key pertains to a collection stored as a hash.
+
+    :param partition: Cache partition to which key pertains.
+    :param obj: Key or item to which an operation is being applied.
+
+    """
+    if EnvVars.COLLECTION_MODE == "KEYS":
+        return False
+    if EnvVars.COLLECTION_MODE != "HASH":
+        raise InvalidEnvironmentVariable("CACHE_COLLECTION_MODE", EnvVars.COLLECTION_MODE, "KEYS | HASH")
+
+    try:
+        return not _HASH_COLLECTIONS[partition].isdisjoint(obj.paths)
+    except (AttributeError, KeyError):
+        return False
+
+
+def register_hash_collections(partition: StorePartition, collections: typing.Set[str]):
+    """Registers a partition's collections that are stored as hashes when operating in collection hash mode.
+
+    :param partition: Cache partition to which collections pertain.
+    :param collections: Set of collection names.
+
+    """
+    _HASH_COLLECTIONS[partition] = _HASH_COLLECTIONS.get(partition, set()) | set(collections)
+
+
+def _apply_key_scope(partition: StorePartition, obj: typing.Any):
+    """Applies partition specific key prefixing & namespacing.
+
+    """
+    # Apply key prefixing.
+    if partition in _USER_PARTITIONS:
+        obj.apply_key_prefix()
+
+    # Apply key namespacing when partitions share a keyspace.
+    namespace = stores.get_key_namespace(partition)
+    if namespace is not None:
+        obj.apply_key_hash_tag(namespace)
+
+
+def _execute_with_retry(func: typing.Callable, store: typing.Callable) -> typing.Any:
+    """Invokes a store operation applying retry semantics in case of broken pipes.
+
+    """
+    attempts = 0
+    while attempts < _MAX_OP_ATTEMPTS:
+        try:
+            return func(store)
+        except redis.ConnectionError as err:
+            attempts += 1
+            if attempts == _MAX_OP_ATTEMPTS:
+                raise err
+            stats.on_retry()
+            time.sleep(float(0.01))
+
+
+async def _execute_with_retry_async(func: typing.Callable, store: typing.Callable) -> typing.Any:
+    """Awaits a store operation applying retry semantics in case of broken pipes.
+
+    """
+    attempts = 0
+    while attempts < _MAX_OP_ATTEMPTS:
+        try:
+            return await func(store)
+        except redis.ConnectionError as err:
+            attempts += 1
+            if attempts == _MAX_OP_ATTEMPTS:
+                raise err
+            stats.on_retry()
+            await asyncio.sleep(float(0.01))
+
+
+def _is_replica_eligible(*operations: StoreOperation) -> bool:
+    """Returns flag indicating whether a set of operations may be served by a read replica.
+
+    """
+    return getattr(_READ_ONLY_SCOPE, "is_read_only", False) and _REPLICA_OPERATIONS.issuperset(operations)
+
+
+def _iterate_with_retry(func: typing.Callable, get_identity: typing.Callable) -> typing.Iterator[typing.Any]:
+    """Yields from an iterator applying retry semantics in case of broken pipes - upon retry the iterator
+    is restarted & previously yielded members are skipped.
+
+    """
+    yielded = set()
+    attempts = 0
+    while True:
+        try:
+            for member in func():
+                identity = get_identity(member)
+                if identity not in yielded:
+                    yielded.add(identity)
+                    yield member
+            return
+        except redis.ConnectionError as err:
+            attempts += 1
+            if attempts == _MAX_OP_ATTEMPTS:
+                raise err
+            stats.on_retry()
+            time.sleep(float(0.01))
+
+
+async def _iterate_with_retry_async(func: typing.Callable, get_identity: typing.Callable) -> typing.AsyncIterator[typing.Any]:
+    """Yields from an asynchronous iterator applying retry semantics in case of broken pipes - asyncio flavour.
+
+    """
+    yielded = set()
+    attempts = 0
+    while True:
+        try:
+            async for member in func():
+                identity = get_identity(member)
+                if identity not in yielded:
+                    yielded.add(identity)
+                    yield member
+            return
+        except redis.ConnectionError as err:
+            attempts += 1
+            if attempts == _MAX_OP_ATTEMPTS:
+                raise err
+            stats.on_retry()
+            await asyncio.sleep(float(0.01))
+
+
+def _stream(partition: StorePartition, operation: StoreOperation, obj: typing.Any) -> typing.Iterator[typing.Any]:
+    """Yields a streamed collection - store accessor is held until stream is exhausted or closed.
+
+    """
+    handler = _HASH_HANDLERS[operation] if is_hashed(partition, obj) else _HANDLERS[operation]
+    with stores.get_store(partition, _is_replica_eligible(operation)) as store:
+        yield from handler(store, obj)
+
+
+async def _stream_async(partition: StorePartition, operation: StoreOperation, obj: typing.Any) -> typing.AsyncIterator[typing.Any]:
+    """Yields a streamed collection - asyncio flavour.
+
+    """
+    handler = _ASYNC_HASH_HANDLERS[operation] if is_hashed(partition, obj) else _ASYNC_HANDLERS[operation]
+    async with stores.get_store_async(partition, _is_replica_eligible(operation)) as store:
+        async for item in await handler(store, obj):
+            yield item
+
+
+def _validate_hashed_item(item: Item):
+    """Validates an item stored as a collection hash field - expiring a field would expire it's siblings.
+
+    """
+    if item.expiration:
+        raise ValueError(f"Items of collections stored as hashes cannot expire: {item.key}")
@@ -0,0 +1,66 @@
+import typing
+
+import redis
+
+from stests.core.cache.model import StorePartition
+from stests.core.cache import stores
+from stests.core.utils import env
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Max. number of completed runs (per network & run type) whose detail is retained: 0 = unlimited.
+    MAX_RUNS = env.get_var("CACHE_RETENTION_MAX_RUNS", 0, int)
+
+    # Max. number of bytes consumed by the store hosting the STATE partition before completed runs are evicted: 0 = unlimited.
+    MAX_MEMORY = env.get_var("CACHE_RETENTION_MAX_MEMORY", 0, int)
+
+    # Time (in seconds) after completion for which a run's detail is retained: 0 = indefinitely.
+    RUN_TTL = env.get_var("CACHE_RETENTION_RUN_TTL", 0, int)
+
+
+def get_expiration(partition: StorePartition, collection: str, default: typing.Optional[int]) -> typing.Optional[int]:
+    """Returns time (in seconds) after which items within a collection expire.
+
+    Overridden per collection by an environment variable, e.g. STESTS_CACHE_RETENTION_TTL_ORCHESTRATION_CONTEXT,
+    whereby 0 = never expire.
+
+    :param partition: Cache partition to which collection pertains.
+    :param collection: Name of a cache collection.
+    :param default: Expiration applied when not overridden.
+
+    :returns: Expiration in seconds - None if items do not expire.
+
+    """
+    expiration = env.get_var(f"CACHE_RETENTION_TTL_{partition.name}_{collection.replace('-', '_')}", default, int)
+
+    return expiration or None
+
+
+def get_used_memory(partition: StorePartition) -> typing.Optional[int]:
+    """Returns number of bytes consumed by the store hosting a partition.
+
+    :param partition: Cache partition whose store is being queried.
+
+    :returns: Used memory in bytes - None if store does not report memory usage.
+
+    """
+    try:
+        with stores.get_store(partition) as store:
+            info = store.info("memory")
+    except redis.ResponseError:
+        return None
+
+    # Cluster stores report per node.
+    if "used_memory" not in info:
+        return sum(i["used_memory"] for i in info.values())
+
+    return info["used_memory"]
+
+
+def is_enabled() -> bool:
+    """Returns flag indicating whether a retention policy is in force.
+
+    """
+    return bool(EnvVars.MAX_RUNS or EnvVars.MAX_MEMORY or EnvVars.RUN_TTL)
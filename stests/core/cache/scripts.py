@@ -0,0 +1,157 @@
+import hashlib
+import typing
+
+import redis
+
+
+
+# Script: acquires (args: rate per second, burst, tokens) from a token bucket, registering it within a run's key set (final key) -> returns time (ms) to wait before proceeding.
+ACQUIRE_TOKENS = "acquire-tokens"
+
+# Script: increments a set of counters by a common amount, registering each within a run's key set (final key) -> returns updated counts.
+INCREMENT_COUNTS = "increment-counts"
+
+# Script: folds a sample (args: sample, sample squared, histogram bucket) into a set of running statistics hashes, registering each within a run's key set (final key) -> returns updated sample counts.
+UPDATE_STATS = "update-stats"
+
+# Script: sets status & end timestamp of a JSON encoded execution info -> returns 1 = updated | 0 = not found | -1 = not JSON.
+UPDATE_INFO = "update-info"
+
+
+# Map: script name -> lua source.
+_SOURCES = {
+    ACQUIRE_TOKENS: """
+        local now = redis.call("time")
+        now = tonumber(now[1]) * 1000 + tonumber(now[2]) / 1000
+        local rate = tonumber(ARGV[1]) / 1000
+        local burst = tonumber(ARGV[2])
+        local bucket = redis.call("hmget", KEYS[1], "tokens", "ts")
+        local tokens = tonumber(bucket[1]) or burst
+        local ts = tonumber(bucket[2]) or now
+        tokens = math.min(burst, tokens + math.max(now - ts, 0) * rate) - tonumber(ARGV[3])
+        redis.call("hmset", KEYS[1], "tokens", tostring(tokens), "ts", string.format("%.3f", now))
+        redis.call("sadd", KEYS[#KEYS], KEYS[1])
+        if tokens >= 0 then
+            return 0
+        end
+        return math.ceil(-tokens / rate)
+    """,
+
+    INCREMENT_COUNTS: """
+        local run_keys = KEYS[#KEYS]
+        local counts = {}
+        for i = 1, #KEYS - 1 do
+            counts[i] = redis.call("incrby", KEYS[i], ARGV[1])
+            redis.call("sadd", run_keys, KEYS[i])
+        end
+        return counts
+    """,
+
+    UPDATE_STATS: """
+        local run_keys = KEYS[#KEYS]
+        local sample = tonumber(ARGV[1])
+        local counts = {}
+        for i = 1, #KEYS - 1 do
+            counts[i] = redis.call("hincrby", KEYS[i], "count", 1)
+            redis.call("hincrbyfloat", KEYS[i], "sum", ARGV[1])
+            redis.call("hincrbyfloat", KEYS[i], "sum_sq", ARGV[2])
+            redis.call("hincrby", KEYS[i], ARGV[3], 1)
+            local minima = tonumber(redis.call("hget", KEYS[i], "min"))
+            if not minima or sample < minima then
+                redis.call("hset", KEYS[i], "min", ARGV[1])
+            end
+            local maxima = tonumber(redis.call("hget", KEYS[i], "max"))
+            if not maxima or sample > maxima then
+                redis.call("hset", KEYS[i], "max", ARGV[1])
+            end
+            redis.call("sadd", run_keys, KEYS[i])
+        end
+        return counts
+    """,
+
+    UPDATE_INFO: """
+        local value = redis.call("get", KEYS[1])
+        if not value then
+            return 0
+        end
+        local decoded, info = pcall(cjson.decode, value)
+        if not decoded then
+            return -1
+        end
+        info["status"] = ARGV[1]
+        info["ts_end"] = tonumber(ARGV[2])
+        info["tp_duration"] = info["ts_end"] - info["ts_start"]
+        local expiration = tonumber(ARGV[3])
+        if expiration <= 0 then
+            expiration = redis.call("ttl", KEYS[1])
+        end
+        if expiration > 0 then
+            redis.call("set", KEYS[1], cjson.encode(info), "EX", expiration)
+        else
+            redis.call("set", KEYS[1], cjson.encode(info))
+        end
+        return 1
+    """,
+}
+
+# Map: script name -> sha1 digest under which the server caches the script.
+_DIGESTS = {k: hashlib.sha1(v.encode("utf-8")).hexdigest() for k, v in _SOURCES.items()}
+
+
+def execute(store: redis.Redis, script: str, keys: typing.List[str], args: typing.List[typing.Any]) -> typing.Any:
+    """Executes a registered script - the script is loaded upon first use by a server.
+
+    :param store: Cache store accessor.
+    :param script: Name of a registered script.
+    :param keys: Keys to which script will be applied.
+    :param args: Script arguments.
+
+    :returns: Script result.
+
+    """
+    try:
+        return store.evalsha(_DIGESTS[script], len(keys), *keys, *args)
+    except redis.exceptions.NoScriptError:
+        store.script_load(_SOURCES[script])
+
+    return store.evalsha(_DIGESTS[script], len(keys), *keys, *args)
+
+
+async def execute_async(store: typing.Any, script: str, keys: typing.List[str], args: typing.List[typing.Any]) -> typing.Any:
+    """Executes a registered script via an asyncio store accessor - the script is loaded upon first use by a server.
+
+    :param store: Asyncio cache store accessor.
+    :param script: Name of a registered script.
+    :param keys: Keys to which script will be applied.
+    :param args: Script arguments.
+
+    :returns: Script result.
+
+    """
+    try:
+        return await store.evalsha(_DIGESTS[script], len(keys), *keys, *args)
+    except redis.exceptions.NoScriptError:
+        await store.script_load(_SOURCES[script])
+
+    return await store.evalsha(_DIGESTS[script], len(keys), *keys, *args)
+
+
+def get_digest(script: str) -> str:
+    """Returns digest under which a registered script is cached by a server.
+
+    :param script: Name of a registered script.
+
+    :returns: SHA1 digest of script source.
+
+    """
+    return _DIGESTS[script]
+
+
+def load(store: redis.Redis):
+    """Preloads registered scripts so that subsequent executions require a single round trip.
+
+    :param store: Cache store accessor.
+
+    """
+    for source in _SOURCES.values():
+        store.script_load(source)
@@ -0,0 +1,379 @@
+import bisect
+import collections
+import contextvars
+import os
+import threading
+import time
+import typing
+
+import redis
+
+from stests.core.cache.model import StorePartition
+from stests.core.cache import stores
+from stests.core.utils import env
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Flag indicating whether cache operations are instrumented: 0 = off | 1 = on.
+    ENABLED = env.get_var("CACHE_STATS_ENABLED", 0, int)
+
+    # Interval (in seconds) at which process local statistics are published.
+    PUBLISH_INTERVAL = env.get_var("CACHE_STATS_PUBLISH_INTERVAL", 10, int)
+
+
+# Upper bounds (in milliseconds) of latency histogram buckets - a final unbounded bucket is implied.
+LATENCY_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+# Set of counters maintained per instrumented operation.
+COUNTERS = (
+    "calls",
+    "errors",
+    "local_hits",
+    "retries",
+    "keys_matched",
+    "bytes_read",
+    "bytes_written",
+    "latency_ms",
+    ) + tuple(f"le_{i}" for i in LATENCY_BUCKETS) + ("le_inf", )
+
+# Partition within which published statistics are held.
+_PARTITION = StorePartition.MONITORING
+
+# Key of hash within which published statistics are held.
+_KEY = "cache-stats"
+
+
+class _Scope():
+    """Measurements of an operation in progress.
+
+    """
+    def __init__(self, record_key: typing.Tuple[str, str, str]):
+        self.record_key = record_key
+        self.counts = collections.Counter()
+        self.elapsed = 0.0
+        self.started = time.perf_counter()
+
+    def get_latency(self) -> float:
+        """Returns time (in milliseconds) for which operation has been measured.
+
+        """
+        elapsed = self.elapsed if self.started is None else self.elapsed + time.perf_counter() - self.started
+
+        return elapsed * 1000
+
+    def resume(self):
+        """Resumes measurement of a suspended operation.
+
+        """
+        self.started = time.perf_counter()
+
+    def suspend(self):
+        """Suspends measurement of an operation, e.g. whilst a streamed operation awaits its consumer.
+
+        """
+        self.elapsed += time.perf_counter() - self.started
+        self.started = None
+
+
+class _Stats():
+    """Process local statistics.
+
+    """
+    def __init__(self):
+        self.last_published = time.monotonic()
+        self.lock = threading.Lock()
+        self.pid = os.getpid()
+        self.records = collections.defaultdict(collections.Counter)
+        self.unpublished = collections.defaultdict(collections.Counter)
+
+    def reset_on_fork(self):
+        """Discards state inherited from a parent process.
+
+        """
+        if self.pid == os.getpid():
+            return
+        with self.lock:
+            if self.pid != os.getpid():
+                self.last_published = time.monotonic()
+                self.pid = os.getpid()
+                self.records = collections.defaultdict(collections.Counter)
+                self.unpublished = collections.defaultdict(collections.Counter)
+
+
+# Process local statistics.
+_STATS = _Stats()
+
+# Stack of operations in progress - context local so that concurrently awaited operations are measured independently.
+_SCOPES = contextvars.ContextVar("cache_stats_scopes", default=())
+
+
+class _Instrumentation():
+    """Context manager within which a cache operation is measured.
+
+    """
+    def __init__(self, partition: StorePartition, operation: str, function: str):
+        self.is_deferred = False
+        self.record_key = (partition.name, operation, function)
+        self.scope = None
+        self.token = None
+
+    def __enter__(self):
+        if EnvVars.ENABLED:
+            self.scope = _Scope(self.record_key)
+            self.token = _SCOPES.set(_SCOPES.get() + (self.scope, ))
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.token is not None:
+            _SCOPES.reset(self.token)
+            if self.is_deferred and exc_type is None:
+                self.scope.suspend()
+            else:
+                _record(self.scope, exc_type is not None)
+
+    def measure_iterator(self, iterator: typing.Iterator) -> typing.Iterator:
+        """Defers recording of operation until an iterator it returns has been consumed - pulls are measured as part of the operation.
+
+        :param iterator: Iterator returned by operation.
+
+        :returns: A measured iterator.
+
+        """
+        if self.scope is None:
+            return iterator
+        self.is_deferred = True
+
+        return _measure_iterator(self.scope, iterator)
+
+    def measure_iterator_async(self, iterator: typing.AsyncIterator) -> typing.AsyncIterator:
+        """Defers recording of operation until an asynchronous iterator it returns has been consumed - asyncio flavour.
+
+        :param iterator: Asynchronous iterator returned by operation.
+
+        :returns: A measured asynchronous iterator.
+
+        """
+        if self.scope is None:
+            return iterator
+        self.is_deferred = True
+
+        return _measure_iterator_async(self.scope, iterator)
+
+
+def get_snapshot() -> typing.Dict[typing.Tuple[str, str, str], typing.Dict[str, float]]:
+    """Returns statistics recorded by current process.
+
+    :returns: Map: (partition, operation, function) -> counters.
+
+    """
+    _STATS.reset_on_fork()
+    with _STATS.lock:
+        return {k: dict(v) for k, v in _STATS.records.items()}
+
+
+def get_snapshot_published() -> typing.Dict[typing.Tuple[str, str, str], typing.Dict[str, float]]:
+    """Returns statistics published by all processes.
+
+    :returns: Map: (partition, operation, function) -> counters.
+
+    """
+    with stores.get_store(_PARTITION) as store:
+        published = store.hgetall(_get_key())
+
+    snapshot = collections.defaultdict(dict)
+    for field, value in published.items():
+        partition, operation, function, counter = field.decode("utf-8").split(":")
+        snapshot[(partition, operation, function)][counter] = float(value)
+
+    return dict(snapshot)
+
+
+def instrument(partition: StorePartition, operation: str, function: str) -> _Instrumentation:
+    """Returns a context manager within which a cache operation is measured - a no-op unless instrumentation is enabled.
+
+    :param partition: Cache partition to which operation pertains.
+    :param operation: Name of cache operation being applied.
+    :param function: Name of function issuing the operation.
+
+    :returns: An instrumentation context manager.
+
+    """
+    return _Instrumentation(partition, operation, function)
+
+
+def on_local_hit():
+    """Records that an operation was served from process local cache.
+
+    """
+    _increment("local_hits", 1)
+
+
+def on_read(size: int):
+    """Records number of bytes read by an operation.
+
+    """
+    _increment("bytes_read", size)
+
+
+def on_retry():
+    """Records that an operation was retried.
+
+    """
+    _increment("retries", 1)
+
+
+def on_match(count: int = 1):
+    """Records number of keys matched by an operation's SCAN iteration - cursor round trips are not counted.
+
+    """
+    _increment("keys_matched", count)
+
+
+def on_write(size: int):
+    """Records number of bytes written by an operation.
+
+    """
+    _increment("bytes_written", size)
+
+
+def publish():
+    """Publishes statistics recorded by current process since previous publication.
+
+    """
+    _STATS.reset_on_fork()
+    with _STATS.lock:
+        unpublished = _STATS.unpublished
+        _STATS.unpublished = collections.defaultdict(collections.Counter)
+        _STATS.last_published = time.monotonic()
+
+    if not unpublished:
+        return
+
+    with stores.get_store(_PARTITION) as store:
+        with store.pipeline(transaction=False) as pipe:
+            for record_key, counts in unpublished.items():
+                for counter, value in counts.items():
+                    field = ":".join(record_key + (counter, ))
+                    if isinstance(value, float):
+                        pipe.hincrbyfloat(_get_key(), field, value)
+                    else:
+                        pipe.hincrby(_get_key(), field, value)
+            pipe.execute()
+
+
+def reset_published():
+    """Deletes statistics published by all processes.
+
+    """
+    with stores.get_store(_PARTITION) as store:
+        store.delete(_get_key())
+
+
+def _get_key() -> str:
+    """Returns key of hash within which published statistics are held.
+
+    """
+    namespace = stores.get_key_namespace(_PARTITION)
+
+    return _KEY if namespace is None else f"{namespace}:{_KEY}"
+
+
+def _increment(counter: str, amount: int):
+    """Increments a counter of current context's innermost operation in progress.
+
+    """
+    if EnvVars.ENABLED:
+        scopes = _SCOPES.get()
+        if scopes:
+            scopes[-1].counts[counter] += amount
+
+
+def _measure_iterator(scope: _Scope, iterator: typing.Iterator) -> typing.Iterator:
+    """Yields from an operation's iterator whereby each pull is measured & the operation is recorded once exhausted or closed.
+
+    """
+    is_error = False
+    try:
+        while True:
+            token = _SCOPES.set(_SCOPES.get() + (scope, ))
+            scope.resume()
+            try:
+                member = next(iterator)
+            except StopIteration:
+                return
+            except Exception:
+                is_error = True
+                raise
+            finally:
+                scope.suspend()
+                _SCOPES.reset(token)
+            yield member
+    finally:
+        if hasattr(iterator, "close"):
+            iterator.close()
+        _record(scope, is_error)
+
+
+async def _measure_iterator_async(scope: _Scope, iterator: typing.AsyncIterator) -> typing.AsyncIterator:
+    """Yields from an operation's asynchronous iterator whereby each pull is measured - asyncio flavour.
+
+    """
+    is_error = False
+    try:
+        while True:
+            token = _SCOPES.set(_SCOPES.get() + (scope, ))
+            scope.resume()
+            try:
+                member = await iterator.__anext__()
+            except StopAsyncIteration:
+                return
+            except Exception:
+                is_error = True
+                raise
+            finally:
+                scope.suspend()
+                _SCOPES.reset(token)
+            yield member
+    finally:
+        if hasattr(iterator, "aclose"):
+            await iterator.aclose()
+        _record(scope, is_error)
+
+
+def _publish():
+    """Publishes statistics - publication is best effort, instrumentation must not fail an operation.
+
+    """
+    try:
+        publish()
+    except redis.RedisError:
+        pass
+
+
+def _record(scope: _Scope, is_error: bool):
+    """Folds measurements of a completed operation into process local statistics.
+
+    """
+    latency = scope.get_latency()
+    idx = bisect.bisect_left(LATENCY_BUCKETS, latency)
+    bucket = f"le_{LATENCY_BUCKETS[idx]}" if idx < len(LATENCY_BUCKETS) else "le_inf"
+
+    scope.counts["calls"] += 1
+    scope.counts["errors"] += int(is_error)
+    scope.counts["latency_ms"] += latency
+    scope.counts[bucket] += 1
+
+    _STATS.reset_on_fork()
+    with _STATS.lock:
+        _STATS.records[scope.record_key].update(scope.counts)
+        _STATS.unpublished[scope.record_key].update(scope.counts)
+        requires_publication = time.monotonic() - _STATS.last_published >= EnvVars.PUBLISH_INTERVAL
+        if requires_publication:
+            _STATS.last_published = time.monotonic()
+
+    # Publication is offloaded so that callers - including those within an event loop - do not await a round trip.
+    if requires_publication:
+        threading.Thread(target=_publish, daemon=True).start()
@@ -1,5 +1,9 @@
+import typing
+
 from stests.core.cache.model import StorePartition
+from stests.core.cache.stores import memory
 from stests.core.cache.stores import redis
+from stests.core.cache.stores import redis_cluster
 from stests.core.cache.stores import stub
 from stests.core.utils import env
 from stests.core.utils.exceptions import InvalidEnvironmentVariable
@@ -14,21 +18,67 @@ class EnvVars:
 
 # Map: Cache store type -> factory.
 FACTORIES = {
+    "MEMORY": memory,
     "REDIS": redis,
+    "REDIS_CLUSTER": redis_cluster,
     "STUB": stub
 }
 
 
-def get_store(partition_type: StorePartition = StorePartition.INFRA):
+def get_connections_opened() -> int:
+    """Returns number of cache store connections opened by current process.
+
+    :returns: Count of opened connections - 0 if store type does not open sockets.
+
+    """
+    return getattr(_get_factory(), "get_connections_opened", lambda: 0)()
+
+
+def get_key_namespace(partition_type: StorePartition) -> typing.Optional[str]:
+    """Returns namespace under which a partition's keys are held when partitions share a keyspace.
+
+    :param partition_type: Type of partition to be accessed.
+    :returns: A key namespace - None if store type isolates partitions.
+
+    """
+    return getattr(_get_factory(), "get_key_namespace", lambda _: None)(partition_type)
+
+
+def get_store(partition_type: StorePartition = StorePartition.INFRA, replica: bool = False):
     """Returns a cache store ready to be used as a state persistence & flow control mechanism.
 
     :param partition_type: Type of partition to be instantiated.
+    :param replica: Flag indicating whether a read replica is to be accessed - falls back to primary if store type has no replicas.
     :returns: A cache store.
 
-    """ 
+    """
+    factory = _get_factory()
+    if replica:
+        return getattr(factory, "get_store_replica", factory.get_store)(partition_type)
+
+    return factory.get_store(partition_type)
+
+
+def get_store_async(partition_type: StorePartition = StorePartition.INFRA, replica: bool = False):
+    """Returns an asyncio cache store ready to be used from within a running event loop.
+
+    :param partition_type: Type of partition to be instantiated.
+    :param replica: Flag indicating whether a read replica is to be accessed - falls back to primary if store type has no replicas.
+    :returns: An asyncio cache store.
+
+    """
+    factory = _get_factory()
+    if replica:
+        return getattr(factory, "get_store_replica_async", factory.get_store_async)(partition_type)
+
+    return factory.get_store_async(partition_type)
+
+
+def _get_factory():
+    """Returns factory of configured cache store type.
+
+    """
     try:
-        factory = FACTORIES[EnvVars.TYPE]
+        return FACTORIES[EnvVars.TYPE]
     except KeyError:
         raise InvalidEnvironmentVariable("CACHE_TYPE", EnvVars.TYPE, FACTORIES)
-
-    return factory.get_store(partition_type)
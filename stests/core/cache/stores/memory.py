@@ -0,0 +1,608 @@
+import fnmatch
+import hashlib
+import json
+import math
+import re
+import threading
+import time
+import typing
+
+import redis
+
+from stests.core.cache.model import StorePartition
+from stests.core.cache import scripts
+
+
+
+class _SortedSet(dict):
+    """A sorted set, i.e. map: member -> score.
+
+    """
+    pass
+
+
+class _PubSub():
+    """Publish/subscribe accessor - a no-op as all subscribers share the publishing process.
+
+    """
+    def subscribe(self, *args, **kwargs):
+        pass
+
+    def run_in_thread(self, *args, **kwargs) -> "_PubSub":
+        return self
+
+    def stop(self):
+        pass
+
+
+class _Pipeline():
+    """Queues commands issued against an in-memory store and applies them atomically upon execution.
+
+    """
+    def __init__(self, store: "_MemoryStore"):
+        self.command_stack = []
+        self.store = store
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.command_stack = []
+
+    def __getattr__(self, name: str) -> typing.Callable:
+        command = getattr(self.store, name)
+        def _enqueue(*args, **kwargs):
+            self.command_stack.append((command, args, kwargs))
+            return self
+        return _enqueue
+
+    def execute(self) -> typing.List[typing.Any]:
+        """Applies queued commands.
+
+        :returns: Per command results in order of issuance.
+
+        """
+        with self.store.lock:
+            try:
+                return [command(*args, **kwargs) for command, args, kwargs in self.command_stack]
+            finally:
+                self.command_stack = []
+
+
+class _MemoryStore():
+    """An in-memory store exposing the subset of redis commands issued by cache operations.
+
+    Values are held natively: strings as bytes, hashes as dicts, sets as sets & sorted sets as
+    member -> score maps.  Keys are expired lazily upon access.
+
+    """
+    def __init__(self):
+        self.data = dict()
+        self.expirations = dict()
+        self.lock = threading.RLock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Store is process wide and therefore remains open.
+        pass
+
+    def decrby(self, name: str, amount: int = 1) -> int:
+        return self.incrby(name, -amount)
+
+    def delete(self, *names: str) -> int:
+        with self.lock:
+            return sum(self._pop(i) for i in names)
+
+    def evalsha(self, sha: str, numkeys: int, *keys_and_args: typing.Any) -> typing.Any:
+        try:
+            script = _SCRIPTS[sha]
+        except KeyError:
+            raise redis.exceptions.NoScriptError("No matching script. Please use EVAL.")
+        keys = [_encode(i) for i in keys_and_args[:numkeys]]
+        with self.lock:
+            return script(self, keys, keys_and_args[numkeys:])
+
+    def exists(self, *names: str) -> int:
+        with self.lock:
+            return sum(1 for i in names if self._get(i) is not None)
+
+    def expire(self, name: str, time: int) -> bool:
+        with self.lock:
+            if self._get(name) is None:
+                return False
+            self.expirations[_encode(name)] = _now() + time
+            return True
+
+    def flushdb(self) -> bool:
+        with self.lock:
+            self.data = dict()
+            self.expirations = dict()
+            return True
+
+    def get(self, name: str) -> typing.Optional[bytes]:
+        with self.lock:
+            return self._get(name, bytes)
+
+    def hdel(self, name: str, *keys: str) -> int:
+        with self.lock:
+            value = self._get(name, dict)
+            if value is None:
+                return 0
+            deleted = sum(1 for i in keys if value.pop(_encode(i), None) is not None)
+            if not value:
+                self._pop(name)
+            return deleted
+
+    def hget(self, name: str, key: str) -> typing.Optional[bytes]:
+        with self.lock:
+            return (self._get(name, dict) or {}).get(_encode(key))
+
+    def hgetall(self, name: str) -> typing.Dict[bytes, bytes]:
+        with self.lock:
+            return dict(self._get(name, dict) or {})
+
+    def hincrby(self, name: str, key: str, amount: int = 1) -> int:
+        with self.lock:
+            value = self._get_or_create(name, dict)
+            count = int(value.get(_encode(key), 0)) + int(amount)
+            value[_encode(key)] = _encode(count)
+            return count
+
+    def hincrbyfloat(self, name: str, key: str, amount: float = 1.0) -> float:
+        with self.lock:
+            value = self._get_or_create(name, dict)
+            count = float(value.get(_encode(key), 0)) + float(amount)
+            value[_encode(key)] = _encode(count)
+            return count
+
+    def hlen(self, name: str) -> int:
+        with self.lock:
+            return len(self._get(name, dict) or {})
+
+    def hmget(self, name: str, keys: typing.List[str], *args: str) -> typing.List[typing.Optional[bytes]]:
+        with self.lock:
+            value = self._get(name, dict) or {}
+            return [value.get(_encode(i)) for i in list(keys) + list(args)]
+
+    def hscan(self, name: str, cursor: int = 0, match: str = None, count: int = None) -> typing.Tuple[int, typing.Dict[bytes, bytes]]:
+        return 0, dict(self.hscan_iter(name, match=match))
+
+    def hscan_iter(self, name: str, match: str = None, count: int = None) -> typing.Iterator[typing.Tuple[bytes, bytes]]:
+        with self.lock:
+            items = list((self._get(name, dict) or {}).items())
+        is_match = _get_matcher(match)
+        for key, value in items:
+            if is_match(key):
+                yield key, value
+
+    def hset(self, name: str, key: str = None, value: typing.Any = None, mapping: dict = None) -> int:
+        mapping = dict(mapping or {})
+        if key is not None:
+            mapping[key] = value
+        with self.lock:
+            current = self._get_or_create(name, dict)
+            added = 0
+            for k, v in mapping.items():
+                added += int(_encode(k) not in current)
+                current[_encode(k)] = _encode(v)
+            return added
+
+    def hsetnx(self, name: str, key: str, value: typing.Any) -> bool:
+        with self.lock:
+            current = self._get_or_create(name, dict)
+            if _encode(key) in current:
+                return False
+            current[_encode(key)] = _encode(value)
+            return True
+
+    def hvals(self, name: str) -> typing.List[bytes]:
+        with self.lock:
+            return list((self._get(name, dict) or {}).values())
+
+    def incrby(self, name: str, amount: int = 1) -> int:
+        with self.lock:
+            value = self._get(name, bytes)
+            try:
+                count = (0 if value is None else int(value)) + int(amount)
+            except ValueError:
+                raise redis.ResponseError("value is not an integer or out of range")
+            self.data[_encode(name)] = _encode(count)
+            return count
+
+    def info(self, section: str = None) -> typing.Dict[str, typing.Any]:
+        # Memory usage is approximated as the size of keys plus encoded values.
+        with self.lock:
+            return {"used_memory": sum(len(k) + _get_size(v) for k, v in self.data.items())}
+
+    def keys(self, pattern: str = "*") -> typing.List[bytes]:
+        return list(self.scan_iter(match=pattern))
+
+    def mget(self, keys: typing.List[str], *args: str) -> typing.List[typing.Optional[bytes]]:
+        with self.lock:
+            return [self._get(i, bytes, strict=False) for i in list(keys) + list(args)]
+
+    def pipeline(self, transaction: bool = True, shard_hint: str = None) -> _Pipeline:
+        return _Pipeline(self)
+
+    def publish(self, channel: str, message: typing.Any) -> int:
+        return 0
+
+    def pubsub(self, **kwargs) -> _PubSub:
+        return _PubSub()
+
+    def sadd(self, name: str, *values: typing.Any) -> int:
+        with self.lock:
+            current = self._get_or_create(name, set)
+            added = len(set(_encode(i) for i in values) - current)
+            current.update(_encode(i) for i in values)
+            return added
+
+    def scan_iter(self, match: str = None, count: int = None, _type: str = None) -> typing.Iterator[bytes]:
+        with self.lock:
+            keys = [i for i in list(self.data) if self._get(i) is not None]
+        is_match = _get_matcher(match)
+        for key in keys:
+            if is_match(key) and (_type is None or _get_type_name(self.data.get(key)) == _type):
+                yield key
+
+    def script_load(self, script: str) -> str:
+        return hashlib.sha1(script.encode("utf-8")).hexdigest()
+
+    def set(self, name: str, value: typing.Any, ex: int = None, nx: bool = False) -> typing.Optional[bool]:
+        with self.lock:
+            if nx and self._get(name) is not None:
+                return None
+            self._pop(name)
+            self.data[_encode(name)] = _encode(value)
+            if ex:
+                self.expirations[_encode(name)] = _now() + ex
+            return True
+
+    def smembers(self, name: str) -> typing.Set[bytes]:
+        with self.lock:
+            return set(self._get(name, set) or set())
+
+    def srem(self, name: str, *values: typing.Any) -> int:
+        with self.lock:
+            current = self._get(name, set)
+            if current is None:
+                return 0
+            removed = len(current.intersection(_encode(i) for i in values))
+            current.difference_update(_encode(i) for i in values)
+            if not current:
+                self._pop(name)
+            return removed
+
+    def sscan_iter(self, name: str, match: str = None, count: int = None) -> typing.Iterator[bytes]:
+        with self.lock:
+            members = list(self._get(name, set) or set())
+        is_match = _get_matcher(match)
+        for member in members:
+            if is_match(member):
+                yield member
+
+    def ttl(self, name: str) -> int:
+        with self.lock:
+            if self._get(name) is None:
+                return -2
+            try:
+                return max(int(round(self.expirations[_encode(name)] - _now())), 0)
+            except KeyError:
+                return -1
+
+    def unlink(self, *names: str) -> int:
+        return self.delete(*names)
+
+    def zadd(self, name: str, mapping: typing.Dict[str, float]) -> int:
+        with self.lock:
+            current = self._get_or_create(name, _SortedSet)
+            added = sum(1 for i in mapping if _encode(i) not in current)
+            current.update({_encode(k): float(v) for k, v in mapping.items()})
+            return added
+
+    def zrangebyscore(self, name: str, min: typing.Any, max: typing.Any, start: int = None, num: int = None) -> typing.List[bytes]:
+        return self._zrange(name, min, max, start, num, False)
+
+    def zrem(self, name: str, *values: typing.Any) -> int:
+        with self.lock:
+            current = self._get(name, _SortedSet)
+            if current is None:
+                return 0
+            removed = sum(1 for i in values if current.pop(_encode(i), None) is not None)
+            if not current:
+                self._pop(name)
+            return removed
+
+    def zrevrangebyscore(self, name: str, max: typing.Any, min: typing.Any, start: int = None, num: int = None) -> typing.List[bytes]:
+        return self._zrange(name, min, max, start, num, True)
+
+    def _get(self, name: str, value_type: type = None, strict: bool = True) -> typing.Any:
+        """Returns value held under a key - expired keys are evicted.
+
+        """
+        key = _encode(name)
+        expiration = self.expirations.get(key)
+        if expiration is not None and expiration <= _now():
+            self._pop(key)
+            return None
+
+        value = self.data.get(key)
+        if value is None or value_type is None or type(value) is value_type:
+            return value
+        if strict:
+            raise redis.ResponseError("WRONGTYPE Operation against a key holding the wrong kind of value")
+
+    def _get_or_create(self, name: str, value_type: type) -> typing.Any:
+        """Returns value held under a key - instantiating an empty value if not held.
+
+        """
+        value = self._get(name, value_type)
+        if value is None:
+            value = self.data[_encode(name)] = value_type()
+
+        return value
+
+    def _pop(self, name: str) -> int:
+        """Evicts a key.
+
+        """
+        key = _encode(name)
+        self.expirations.pop(key, None)
+
+        return int(self.data.pop(key, None) is not None)
+
+    def _zrange(self, name: str, min: typing.Any, max: typing.Any, start: int, num: int, reverse: bool) -> typing.List[bytes]:
+        """Returns sorted set members whose scores fall within a range.
+
+        """
+        with self.lock:
+            current = self._get(name, _SortedSet) or {}
+            is_in_range = _get_score_range(min, max)
+            members = sorted(
+                ((score, member) for member, score in current.items() if is_in_range(score)),
+                reverse=reverse,
+                )
+
+        start = start or 0
+        end = None if num is None or num < 0 else start + num
+
+        return [member for _, member in members[start:end]]
+
+
+def _acquire_tokens(store: _MemoryStore, keys: typing.List[bytes], args: typing.List[typing.Any]) -> int:
+    """Native implementation of script: scripts.ACQUIRE_TOKENS.
+
+    """
+    now = time.time() * 1000
+    rate = float(args[0]) / 1000
+    burst = float(args[1])
+    tokens, ts = store.hmget(keys[0], ["tokens", "ts"])
+    tokens = burst if tokens is None else float(tokens)
+    ts = now if ts is None else float(ts)
+    tokens = min(burst, tokens + max(now - ts, 0) * rate) - float(args[2])
+    store.hset(keys[0], mapping={"tokens": repr(tokens), "ts": f"{now:.3f}"})
+    store.sadd(keys[-1], keys[0])
+
+    return 0 if tokens >= 0 else math.ceil(-tokens / rate)
+
+
+def _increment_counts(store: _MemoryStore, keys: typing.List[bytes], args: typing.List[typing.Any]) -> typing.List[int]:
+    """Native implementation of script: scripts.INCREMENT_COUNTS.
+
+    """
+    counts = [store.incrby(i, int(args[0])) for i in keys[:-1]]
+    store.sadd(keys[-1], *keys[:-1])
+
+    return counts
+
+
+def _update_stats(store: _MemoryStore, keys: typing.List[bytes], args: typing.List[typing.Any]) -> typing.List[int]:
+    """Native implementation of script: scripts.UPDATE_STATS.
+
+    """
+    sample = float(args[0])
+    counts = []
+    for key in keys[:-1]:
+        counts.append(store.hincrby(key, "count", 1))
+        store.hincrbyfloat(key, "sum", sample)
+        store.hincrbyfloat(key, "sum_sq", float(args[1]))
+        store.hincrby(key, args[2], 1)
+        minima = store.hget(key, "min")
+        if minima is None or sample < float(minima):
+            store.hset(key, "min", args[0])
+        maxima = store.hget(key, "max")
+        if maxima is None or sample > float(maxima):
+            store.hset(key, "max", args[0])
+    store.sadd(keys[-1], *keys[:-1])
+
+    return counts
+
+
+def _update_info(store: _MemoryStore, keys: typing.List[bytes], args: typing.List[typing.Any]) -> int:
+    """Native implementation of script: scripts.UPDATE_INFO.
+
+    """
+    value = store.get(keys[0])
+    if value is None:
+        return 0
+    try:
+        info = json.loads(value)
+    except ValueError:
+        return -1
+
+    info["status"] = _decode(args[0])
+    info["ts_end"] = float(args[1])
+    info["tp_duration"] = info["ts_end"] - info["ts_start"]
+    expiration = int(args[2])
+    if expiration <= 0:
+        expiration = store.ttl(keys[0])
+    store.set(keys[0], json.dumps(info), ex=expiration if expiration > 0 else None)
+
+    return 1
+
+
+class _AsyncPipeline(_Pipeline):
+    """Asyncio flavour of an in-memory store pipeline.
+
+    """
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.command_stack = []
+
+    async def execute(self) -> typing.List[typing.Any]:
+        return super().execute()
+
+
+class _AsyncMemoryStore():
+    """Asyncio accessor of an in-memory store - commands are applied synchronously as no I/O is incurred.
+
+    """
+    def __init__(self, store: _MemoryStore):
+        self.store = store
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def __getattr__(self, name: str) -> typing.Callable:
+        command = getattr(self.store, name)
+        if name.endswith("scan_iter"):
+            async def _iterate(*args, **kwargs):
+                for item in command(*args, **kwargs):
+                    yield item
+            return _iterate
+
+        async def _execute(*args, **kwargs):
+            return command(*args, **kwargs)
+        return _execute
+
+    def pipeline(self, transaction: bool = True, shard_hint: str = None) -> _AsyncPipeline:
+        return _AsyncPipeline(self.store)
+
+
+# Map: script digest -> native implementation.
+_SCRIPTS = {
+    scripts.get_digest(scripts.ACQUIRE_TOKENS): _acquire_tokens,
+    scripts.get_digest(scripts.INCREMENT_COUNTS): _increment_counts,
+    scripts.get_digest(scripts.UPDATE_INFO): _update_info,
+    scripts.get_digest(scripts.UPDATE_STATS): _update_stats,
+}
+
+# Map: partition type -> process wide store.
+_STORES = {i: _MemoryStore() for i in StorePartition}
+
+
+def flush():
+    """Deletes all keys held by all partitions.
+
+    """
+    for store in _STORES.values():
+        store.flushdb()
+
+
+def get_store(partition_type: StorePartition) -> _MemoryStore:
+    """Returns instance of an in-memory cache store accessor.
+
+    :param partition_type: Type of partition to be accessed.
+    :returns: A process wide in-memory store - state is shared by all accessors of a partition.
+
+    """
+    return _STORES[partition_type]
+
+
+def get_store_async(partition_type: StorePartition) -> _AsyncMemoryStore:
+    """Returns instance of an asyncio in-memory cache store accessor.
+
+    :param partition_type: Type of partition to be accessed.
+    :returns: An asyncio accessor of a process wide in-memory store.
+
+    """
+    return _AsyncMemoryStore(_STORES[partition_type])
+
+
+def _decode(value: typing.Any) -> str:
+    """Returns a value decoded as a string.
+
+    """
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+
+
+def _encode(value: typing.Any) -> bytes:
+    """Returns a value encoded as redis would, i.e. as bytes.
+
+    """
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, str):
+        return value.encode("utf-8")
+    if isinstance(value, float):
+        return repr(value).encode("utf-8")
+
+    return str(value).encode("utf-8")
+
+
+def _get_matcher(pattern: typing.Optional[str]) -> typing.Callable[[bytes], bool]:
+    """Returns a predicate matching keys against a glob style pattern.
+
+    """
+    if pattern is None:
+        return lambda _: True
+
+    regex = re.compile(fnmatch.translate(_decode(pattern)).encode("utf-8"), re.DOTALL)
+
+    return lambda i: regex.match(i) is not None
+
+
+def _get_score_range(min: typing.Any, max: typing.Any) -> typing.Callable[[float], bool]:
+    """Returns a predicate matching scores against a range - bounds prefixed with ( are exclusive.
+
+    """
+    def _parse(bound):
+        bound = _decode(bound)
+        if bound.startswith("("):
+            return float(bound[1:]), True
+        return float(bound), False
+
+    (lower, lower_exclusive), (upper, upper_exclusive) = _parse(min), _parse(max)
+
+    return lambda i: (i > lower if lower_exclusive else i >= lower) and \
+                     (i < upper if upper_exclusive else i <= upper)
+
+
+def _get_size(value: typing.Any) -> int:
+    """Returns approximate number of bytes consumed by a value.
+
+    """
+    if isinstance(value, bytes):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(len(k) + len(_encode(v)) for k, v in value.items())
+
+    return sum(len(i) for i in value)
+
+
+def _get_type_name(value: typing.Any) -> typing.Optional[str]:
+    """Returns name of a value's redis type.
+
+    """
+    if isinstance(value, bytes):
+        return "string"
+    if isinstance(value, _SortedSet):
+        return "zset"
+    if isinstance(value, dict):
+        return "hash"
+    if isinstance(value, set):
+        return "set"
+
+
+def _now() -> float:
+    """Returns current monotonic time in seconds.
+
+    """
+    return time.monotonic()
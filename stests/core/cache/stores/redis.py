@@ -1,4 +1,11 @@
+import asyncio
+import os
+import threading
+import typing
+import weakref
+
 import redis
+import redis.asyncio
 
 from stests.core.cache.model import StorePartition
 from stests.core.utils import env
@@ -10,12 +17,24 @@ class EnvVars:
     # Redis host.
     DB = env.get_var('CACHE_REDIS_DB', 1, int)
 
+    # Interval (in seconds) after which an idle pooled connection is health checked prior to use.
+    HEALTH_CHECK_INTERVAL = env.get_var('CACHE_REDIS_HEALTH_CHECK_INTERVAL', 30, int)
+
     # Redis host.
     HOST = env.get_var('CACHE_REDIS_HOST', "localhost")
 
+    # Max. number of connections pooled per partition per process.
+    MAX_CONNECTIONS = env.get_var('CACHE_REDIS_MAX_CONNECTIONS', 16, int)
+
     # Redis port.
     PORT = env.get_var('CACHE_REDIS_PORT', 6379, int)
 
+    # Redis read replica host - reads issued from read-only contexts are routed to the replica, none if unspecified.
+    REPLICA_HOST = env.get_var('CACHE_REDIS_REPLICA_HOST', "")
+
+    # Redis read replica port.
+    REPLICA_PORT = env.get_var('CACHE_REDIS_REPLICA_PORT', 6379, int)
+
 
 # Map: partition type -> cache db index offset.
 PARTITION_OFFSETS = {
@@ -28,20 +47,158 @@ PARTITION_OFFSETS = {
 }
 
 
+class _PoolRegistry():
+    """Process local registry of connection pools - one per partition (plus one per partition replica).
+
+    """
+    def __init__(self):
+        self.connections_opened = 0
+        self.lock = threading.Lock()
+        self.pid = os.getpid()
+        self.pools = dict()
+        self.pools_async = weakref.WeakKeyDictionary()
+
+    def reset_on_fork(self):
+        """Discards state inherited from a parent process - sockets must not be shared across processes.
+
+        """
+        if self.pid == os.getpid():
+            return
+        with self.lock:
+            if self.pid != os.getpid():
+                self.connections_opened = 0
+                self.pid = os.getpid()
+                self.pools = dict()
+                self.pools_async = weakref.WeakKeyDictionary()
+
+
+# Process local pool registry.
+_REGISTRY = _PoolRegistry()
+
+
+class _Connection(redis.Connection):
+    """Extends redis connection so as to track number of sockets opened by current process.
+
+    """
+    def _connect(self):
+        sock = super()._connect()
+        with _REGISTRY.lock:
+            _REGISTRY.connections_opened += 1
+
+        return sock
+
+
+def get_connections_opened() -> int:
+    """Returns number of connections opened by current process.
+
+    :returns: Count of connections opened across all partitions.
+
+    """
+    _REGISTRY.reset_on_fork()
+
+    return _REGISTRY.connections_opened
+
+
+def get_pool(partition_type: StorePartition, replica: bool = False) -> redis.ConnectionPool:
+    """Returns a partition's connection pool - instantiating it upon first use within current process.
+
+    :param partition_type: Type of partition to be pooled.
+    :param replica: Flag indicating whether connections are opened against the read replica.
+    :returns: A redis connection pool.
+
+    """
+    _REGISTRY.reset_on_fork()
+    try:
+        return _REGISTRY.pools[(partition_type, replica)]
+    except KeyError:
+        pass
+
+    with _REGISTRY.lock:
+        if (partition_type, replica) not in _REGISTRY.pools:
+            host, port = _get_endpoint(replica)
+            _REGISTRY.pools[(partition_type, replica)] = redis.BlockingConnectionPool(
+                connection_class=_Connection,
+                db=EnvVars.DB + PARTITION_OFFSETS[partition_type],
+                health_check_interval=EnvVars.HEALTH_CHECK_INTERVAL,
+                host=host,
+                max_connections=EnvVars.MAX_CONNECTIONS,
+                port=port,
+                )
+
+    return _REGISTRY.pools[(partition_type, replica)]
+
+
+def get_pool_async(partition_type: StorePartition, replica: bool = False) -> redis.asyncio.ConnectionPool:
+    """Returns a partition's asyncio connection pool - instantiating it upon first use within current event loop.
+
+    :param partition_type: Type of partition to be pooled.
+    :param replica: Flag indicating whether connections are opened against the read replica.
+    :returns: A redis asyncio connection pool.
+
+    """
+    _REGISTRY.reset_on_fork()
+    loop = asyncio.get_running_loop()
+    with _REGISTRY.lock:
+        pools = _REGISTRY.pools_async.setdefault(loop, dict())
+        if (partition_type, replica) not in pools:
+            host, port = _get_endpoint(replica)
+            pools[(partition_type, replica)] = redis.asyncio.BlockingConnectionPool(
+                db=EnvVars.DB + PARTITION_OFFSETS[partition_type],
+                health_check_interval=EnvVars.HEALTH_CHECK_INTERVAL,
+                host=host,
+                max_connections=EnvVars.MAX_CONNECTIONS,
+                port=port,
+                )
+
+        return pools[(partition_type, replica)]
+
+
 def get_store(partition_type: StorePartition) -> redis.Redis:
     """Returns instance of a redis cache store accessor.
 
-    :returns: An instance of a redis cache store accessor.
+    :param partition_type: Type of partition to be accessed.
+    :returns: An instance of a redis cache store accessor bound to a process wide connection pool.
 
     """
-    # Set cache db index.
-    db = EnvVars.DB
-    db += PARTITION_OFFSETS[partition_type]
-
     # TODO: cluster connections
-    return redis.Redis(
-        db=db,
-        host=EnvVars.HOST,
-        port=EnvVars.PORT
-        )
+    return redis.Redis(connection_pool=get_pool(partition_type))
+
+
+def get_store_async(partition_type: StorePartition) -> redis.asyncio.Redis:
+    """Returns instance of an asyncio redis cache store accessor.
+
+    :param partition_type: Type of partition to be accessed.
+    :returns: An instance of an asyncio redis cache store accessor bound to an event loop wide connection pool.
+
+    """
+    return redis.asyncio.Redis(connection_pool=get_pool_async(partition_type))
+
+
+def get_store_replica(partition_type: StorePartition) -> redis.Redis:
+    """Returns instance of a redis cache store accessor bound to the read replica - the primary if no replica is configured.
+
+    :param partition_type: Type of partition to be accessed.
+    :returns: An instance of a redis cache store accessor bound to a process wide replica connection pool.
+
+    """
+    return redis.Redis(connection_pool=get_pool(partition_type, bool(EnvVars.REPLICA_HOST)))
+
+
+def get_store_replica_async(partition_type: StorePartition) -> redis.asyncio.Redis:
+    """Returns instance of an asyncio redis cache store accessor bound to the read replica - the primary if no replica is configured.
+
+    :param partition_type: Type of partition to be accessed.
+    :returns: An instance of an asyncio redis cache store accessor bound to an event loop wide replica connection pool.
+
+    """
+    return redis.asyncio.Redis(connection_pool=get_pool_async(partition_type, bool(EnvVars.REPLICA_HOST)))
+
+
+def _get_endpoint(replica: bool) -> typing.Tuple[str, int]:
+    """Returns host & port of either the primary or the read replica.
+
+    """
+    if replica:
+        return EnvVars.REPLICA_HOST, EnvVars.REPLICA_PORT
 
+    return EnvVars.HOST, EnvVars.PORT
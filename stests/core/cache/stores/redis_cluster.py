@@ -0,0 +1,202 @@
+import asyncio
+import os
+import threading
+import typing
+import weakref
+
+from redis.asyncio.cluster import RedisCluster as AsyncRedisCluster
+from redis.cluster import LoadBalancingStrategy
+from redis.cluster import RedisCluster
+
+from stests.core.cache.model import StorePartition
+from stests.core.utils import env
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Redis cluster seed node host.
+    HOST = env.get_var('CACHE_REDIS_CLUSTER_HOST', "localhost")
+
+    # Max. number of connections pooled per cluster node per process.
+    MAX_CONNECTIONS = env.get_var('CACHE_REDIS_CLUSTER_MAX_CONNECTIONS', 16, int)
+
+    # Redis cluster seed node port.
+    PORT = env.get_var('CACHE_REDIS_CLUSTER_PORT', 7000, int)
+
+    # Flag indicating whether reads issued from read-only contexts are served by replica nodes.
+    READ_FROM_REPLICAS = env.get_var('CACHE_REDIS_CLUSTER_READ_FROM_REPLICAS', 0, int)
+
+
+# Map: partition type -> key namespace - a cluster exposes a single db, hence partitions are namespaced.
+KEY_NAMESPACES = {
+    StorePartition.INFRA: "infra",
+    StorePartition.MONITORING_LOCKS: "monitoring-locks",
+    StorePartition.MONITORING: "monitoring",
+    StorePartition.ORCHESTRATION: "orchestration",
+    StorePartition.STATE: "state",
+    StorePartition.WORKFLOW: "workflow",
+}
+
+
+class _ClusterStore(RedisCluster):
+    """Extends cluster client so as to honour semantics relied upon by cache operations.
+
+    """
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Client is process wide and therefore remains open.
+        pass
+
+    def mget(self, keys, *args) -> typing.List[typing.Any]:
+        # Keys matched by a network wide search may span slots.
+        return self.mget_nonatomic(keys, *args)
+
+    def pipeline(self, transaction=None, shard_hint=None):
+        # Commands pipelined alongside network wide index entries may span slots.
+        return super().pipeline()
+
+
+class _AsyncClusterStore(AsyncRedisCluster):
+    """Extends asyncio cluster client so as to honour semantics relied upon by cache operations.
+
+    """
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        # Client is event loop wide and therefore remains open.
+        pass
+
+    async def mget(self, keys, *args) -> typing.List[typing.Any]:
+        # Keys matched by a network wide search may span slots.
+        return await self.mget_nonatomic(keys, *args)
+
+    def pipeline(self, transaction=None, shard_hint=None):
+        # Commands pipelined alongside network wide index entries may span slots.
+        return super().pipeline()
+
+
+class _ClientRegistry():
+    """Process local registry of cluster clients - replica clients route read commands to replica nodes.
+
+    """
+    def __init__(self):
+        self.client = None
+        self.client_replica = None
+        self.clients_async = weakref.WeakKeyDictionary()
+        self.clients_replica_async = weakref.WeakKeyDictionary()
+        self.lock = threading.Lock()
+        self.pid = os.getpid()
+
+    def reset_on_fork(self):
+        """Discards state inherited from a parent process - sockets must not be shared across processes.
+
+        """
+        if self.pid == os.getpid():
+            return
+        with self.lock:
+            if self.pid != os.getpid():
+                self.client = None
+                self.client_replica = None
+                self.clients_async = weakref.WeakKeyDictionary()
+                self.clients_replica_async = weakref.WeakKeyDictionary()
+                self.pid = os.getpid()
+
+
+# Process local client registry.
+_REGISTRY = _ClientRegistry()
+
+
+def get_key_namespace(partition_type: StorePartition) -> str:
+    """Returns namespace under which a partition's keys are held.
+
+    :param partition_type: Type of partition to be accessed.
+    :returns: A key namespace.
+
+    """
+    return KEY_NAMESPACES[partition_type]
+
+
+def get_store(partition_type: StorePartition) -> RedisCluster:
+    """Returns instance of a redis cluster cache store accessor.
+
+    :param partition_type: Type of partition to be accessed.
+    :returns: A process wide redis cluster accessor - partitions are distinguished by key namespace.
+
+    """
+    _REGISTRY.reset_on_fork()
+    if _REGISTRY.client is None:
+        with _REGISTRY.lock:
+            if _REGISTRY.client is None:
+                _REGISTRY.client = _ClusterStore(
+                    host=EnvVars.HOST,
+                    max_connections=EnvVars.MAX_CONNECTIONS,
+                    port=EnvVars.PORT,
+                    )
+
+    return _REGISTRY.client
+
+
+def get_store_async(partition_type: StorePartition) -> AsyncRedisCluster:
+    """Returns instance of an asyncio redis cluster cache store accessor.
+
+    :param partition_type: Type of partition to be accessed.
+    :returns: An event loop wide asyncio redis cluster accessor - partitions are distinguished by key namespace.
+
+    """
+    _REGISTRY.reset_on_fork()
+    loop = asyncio.get_running_loop()
+    with _REGISTRY.lock:
+        if loop not in _REGISTRY.clients_async:
+            _REGISTRY.clients_async[loop] = _AsyncClusterStore(
+                host=EnvVars.HOST,
+                max_connections=EnvVars.MAX_CONNECTIONS,
+                port=EnvVars.PORT,
+                )
+
+        return _REGISTRY.clients_async[loop]
+
+
+def get_store_replica(partition_type: StorePartition) -> RedisCluster:
+    """Returns instance of a redis cluster cache store accessor whose reads are served by replica nodes.
+
+    :param partition_type: Type of partition to be accessed.
+    :returns: A process wide redis cluster accessor - the primary accessor if replica reads are disabled.
+
+    """
+    if not EnvVars.READ_FROM_REPLICAS:
+        return get_store(partition_type)
+
+    _REGISTRY.reset_on_fork()
+    if _REGISTRY.client_replica is None:
+        with _REGISTRY.lock:
+            if _REGISTRY.client_replica is None:
+                _REGISTRY.client_replica = _ClusterStore(
+                    host=EnvVars.HOST,
+                    load_balancing_strategy=LoadBalancingStrategy.ROUND_ROBIN_REPLICAS,
+                    max_connections=EnvVars.MAX_CONNECTIONS,
+                    port=EnvVars.PORT,
+                    )
+
+    return _REGISTRY.client_replica
+
+
+def get_store_replica_async(partition_type: StorePartition) -> AsyncRedisCluster:
+    """Returns instance of an asyncio redis cluster cache store accessor whose reads are served by replica nodes.
+
+    :param partition_type: Type of partition to be accessed.
+    :returns: An event loop wide asyncio redis cluster accessor - the primary accessor if replica reads are disabled.
+
+    """
+    if not EnvVars.READ_FROM_REPLICAS:
+        return get_store_async(partition_type)
+
+    _REGISTRY.reset_on_fork()
+    loop = asyncio.get_running_loop()
+    with _REGISTRY.lock:
+        if loop not in _REGISTRY.clients_replica_async:
+            _REGISTRY.clients_replica_async[loop] = _AsyncClusterStore(
+                host=EnvVars.HOST,
+                load_balancing_strategy=LoadBalancingStrategy.ROUND_ROBIN_REPLICAS,
+                max_connections=EnvVars.MAX_CONNECTIONS,
+                port=EnvVars.PORT,
+                )
+
+        return _REGISTRY.clients_replica_async[loop]
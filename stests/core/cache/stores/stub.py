@@ -3,15 +3,26 @@ import fakeredis
 from stests.core.cache.model import StorePartition
 
 
-# Factory simply instantiates an instance.
-get_store = fakeredis.FakeStrictRedis
 
+# Map: partition type -> fake redis server - state is shared by all accessors of a partition.
+_SERVERS = {i: fakeredis.FakeServer() for i in StorePartition}
 
 
-def get_store(_: StorePartition) -> fakeredis.FakeStrictRedis:
+def get_store(partition_type: StorePartition) -> fakeredis.FakeStrictRedis:
     """Returns instance of a fake redis cache store accessor.
 
-    :returns: An instance of a fake redis cache store accessor.
+    :param partition_type: Type of partition to be accessed.
+    :returns: An instance of a fake redis cache store accessor bound to a process wide fake server.
 
     """
-    return fakeredis.FakeStrictRedis()
+    return fakeredis.FakeStrictRedis(server=_SERVERS[partition_type])
+
+
+def get_store_async(partition_type: StorePartition) -> fakeredis.FakeAsyncRedis:
+    """Returns instance of an asyncio fake redis cache store accessor.
+
+    :param partition_type: Type of partition to be accessed.
+    :returns: An instance of an asyncio fake redis cache store accessor bound to a process wide fake server.
+
+    """
+    return fakeredis.FakeAsyncRedis(server=_SERVERS[partition_type])
@@ -15,6 +15,8 @@ from stests.core.factory.infra import create_node_id
 from stests.core.factory.infra import create_node_monitoring_lock
 
 from stests.core.factory.orchestration import create_execution_context
+from stests.core.factory.orchestration import create_execution_context_reference
 from stests.core.factory.orchestration import create_execution_id
 from stests.core.factory.orchestration import create_execution_info
-from stests.core.factory.orchestration import create_execution_lock
\ No newline at end of file
+from stests.core.factory.orchestration import create_execution_lock
+from stests.core.factory.orchestration import create_execution_summary
\ No newline at end of file
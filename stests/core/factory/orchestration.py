@@ -8,11 +8,13 @@ from stests.core.types.infra import NetworkIdentifier
 from stests.core.types.infra import NodeIdentifier
 from stests.core.types.orchestration import ExecutionAspect
 from stests.core.types.orchestration import ExecutionContext
+from stests.core.types.orchestration import ExecutionContextReference
 from stests.core.types.orchestration import ExecutionIdentifier
 from stests.core.types.orchestration import ExecutionInfo
 from stests.core.types.orchestration import ExecutionLock
 from stests.core.types.orchestration import ExecutionMode
 from stests.core.types.orchestration import ExecutionStatus
+from stests.core.types.orchestration import ExecutionSummary
 
 
 
@@ -90,6 +92,19 @@ def create_execution_info(aspect: ExecutionAspect, ctx: ExecutionContext) -> Exe
     return info
 
 
+def create_execution_context_reference(ctx: ExecutionContext) -> ExecutionContextReference:
+    """Returns an orchestration object instance: ExecutionContextReference.
+    
+    """
+    return ExecutionContextReference(
+        network=ctx.network,
+        phase_index=ctx.phase_index,
+        run_index=ctx.run_index,
+        run_type=ctx.run_type,
+        step_index=ctx.step_index,
+    )
+
+
 def create_execution_lock(
     aspect: ExecutionAspect,
     network: str,
@@ -109,3 +124,34 @@ def create_execution_lock(
         phase_index=phase_index,
         step_index=step_index,
     )
+
+
+def create_execution_summary(
+    ctx: ExecutionContext,
+    info: typing.Optional[ExecutionInfo],
+    deploy_count: int,
+    finalisation_stats: typing.Dict[str, float],
+    ) -> ExecutionSummary:
+    """Returns an orchestration object instance: ExecutionSummary.
+    
+    """
+    summary = ExecutionSummary(
+        deploy_count=0,
+        finalization_max=None,
+        finalization_mean=None,
+        finalization_min=None,
+        finalization_stdev=None,
+        finalized_count=0,
+        network=ctx.network,
+        run_index=ctx.run_index,
+        run_index_parent=ctx.run_index_parent,
+        run_type=ctx.run_type,
+        status=ctx.status,
+        tp_duration=None if info is None else info.tp_duration,
+        ts_end=datetime.utcnow() if info is None or info.ts_end is None else info.ts_end,
+        ts_evicted=None,
+        ts_start=None if info is None else info.ts_start,
+    )
+    summary.set_counts(deploy_count, finalisation_stats)
+
+    return summary
@@ -1,4 +1,13 @@
+import typing
+
+import dramatiq
+import pika
+from dramatiq.brokers.rabbitmq import MAX_ENQUEUE_ATTEMPTS
 from dramatiq.brokers.rabbitmq import RabbitmqBroker
+from dramatiq.common import current_millis
+from dramatiq.common import dq_name
+from dramatiq.common import q_name
+from dramatiq.errors import ConnectionClosed
 
 from stests.core.utils import env
 
@@ -31,6 +40,87 @@ class EnvVars:
     VHOST = env.get_var('BROKER_RABBIT_VHOST', "CLABS")
 
 
+class _RabbitmqBroker(RabbitmqBroker):
+    """Extends dramatiq rabbit MQ broker with a batched enqueue.
+
+    """
+    def enqueue_batch(self, messages: typing.List[dramatiq.Message], *, delay: int = None) -> typing.List[dramatiq.Message]:
+        """Enqueues a batch of messages over a long-lived channel in publisher confirm mode.
+
+        :param messages: Messages to be enqueued.
+        :param delay: Minimum amount of time (in milliseconds) by which messages are delayed.
+
+        :returns: Enqueued messages.
+
+        """
+        # Set messages - mirrors RabbitmqBroker.enqueue.
+        if delay is not None:
+            eta = current_millis() + delay
+            messages = [i.copy(queue_name=dq_name(i.queue_name), options={"eta": eta}) for i in messages]
+        for message in messages:
+            self.emit_before("enqueue", message, delay)
+
+        # Publish - confirmed messages are not republished upon retry.
+        attempts = 0
+        published = 0
+        while published < len(messages):
+            try:
+                for queue_name in {q_name(i.queue_name) for i in messages[published:]}:
+                    self.declare_queue(queue_name, ensure=True)
+                channel = self.confirm_channel
+                for message in messages[published:]:
+                    channel.basic_publish(
+                        exchange="",
+                        routing_key=message.queue_name,
+                        body=message.encode(),
+                        properties=pika.BasicProperties(
+                            delivery_mode=2,
+                            priority=message.options.get("broker_priority"),
+                        ),
+                        mandatory=True,
+                    )
+                    published += 1
+            except (pika.exceptions.AMQPConnectionError, pika.exceptions.AMQPChannelError) as err:
+                del self.confirm_channel
+                del self.connection
+                if isinstance(err, pika.exceptions.UnroutableError):
+                    self.queues_pending.add(q_name(messages[published].queue_name))
+                attempts += 1
+                if attempts >= MAX_ENQUEUE_ATTEMPTS:
+                    raise ConnectionClosed(err) from None
+
+        for message in messages:
+            self.emit_after("enqueue", message, delay)
+
+        return messages
+
+    @property
+    def confirm_channel(self):
+        """Channel (of current thread) in publisher confirm mode over which batches are published.
+
+        """
+        channel = getattr(self.state, "confirm_channel", None)
+        if channel is None:
+            channel = self.state.confirm_channel = self.connection.channel()
+            channel.confirm_delivery()
+            self.channels.add(channel)
+
+        return channel
+
+    @confirm_channel.deleter
+    def confirm_channel(self):
+        channel = getattr(self.state, "confirm_channel", None)
+        if channel is None:
+            return
+
+        del self.state.confirm_channel
+        self.channels.discard(channel)
+        if channel.is_open:
+            try:
+                channel.close()
+            except Exception:
+                self.logger.exception("Encountered exception while closing Channel.")
+
 
 def get_broker() -> RabbitmqBroker:
     """Returns instance of rabbit MQ broker.
@@ -38,7 +128,7 @@ def get_broker() -> RabbitmqBroker:
     :returns: An instance of a Rabbit MQ broker.
 
     """
-    return RabbitmqBroker(url=_get_url())
+    return _RabbitmqBroker(url=_get_url())
 
 
 def _get_url() -> str:
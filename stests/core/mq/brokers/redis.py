@@ -1,4 +1,10 @@
+import typing
+from uuid import uuid4
+
+import dramatiq
 from dramatiq.brokers.redis import RedisBroker
+from dramatiq.common import current_millis
+from dramatiq.common import dq_name
 
 from stests.core.utils import env
 
@@ -16,12 +22,65 @@ class EnvVars:
     PORT = env.get_var('BROKER_REDIS_PORT', 6379, int)
 
 
+class _RedisBroker(RedisBroker):
+    """Extends dramatiq redis broker with a batched enqueue.
+
+    """
+    def enqueue_batch(self, messages: typing.List[dramatiq.Message], *, delay: int = None) -> typing.List[dramatiq.Message]:
+        """Enqueues a batch of messages over a single pipelined round trip.
+
+        :param messages: Messages to be enqueued.
+        :param delay: Minimum amount of time (in milliseconds) by which messages are delayed.
+
+        :returns: Enqueued messages.
+
+        """
+        # Set messages - mirrors RedisBroker.enqueue.
+        options = dict()
+        if delay is not None:
+            options["eta"] = current_millis() + delay
+        enqueued = []
+        for message in messages:
+            enqueued.append(message.copy(
+                queue_name=message.queue_name if delay is None else dq_name(message.queue_name),
+                options={
+                    "redis_message_id": str(uuid4()),
+                    **options
+                },
+            ))
+
+        # Dispatch - each message is enqueued by broker's dispatch script, whose arguments mirror RedisBroker.enqueue
+        # (dramatiq internals, hence verified by test_mq_brokers against a fake server).
+        dispatch = self.scripts["dispatch"]
+        keys = [self.namespace]
+        with self.client.pipeline(transaction=False) as pipe:
+            for message in enqueued:
+                self.emit_before("enqueue", message, delay)
+                dispatch(keys=keys, client=pipe, args=[
+                    "enqueue",
+                    current_millis(),
+                    message.queue_name,
+                    self.broker_id,
+                    self.heartbeat_timeout,
+                    self.dead_message_ttl,
+                    self._should_do_maintenance("enqueue"),
+                    self._max_unpack_size(),
+                    message.options["redis_message_id"],
+                    message.encode(),
+                ])
+            pipe.execute()
+
+        for message in enqueued:
+            self.emit_after("enqueue", message, delay)
+
+        return enqueued
+
 
 def get_broker() -> RedisBroker:
     """Returns instance of redis MQ broker.
     
     """
-    return RedisBroker(
+    return _RedisBroker(
         db=EnvVars.DB,
         host=EnvVars.HOST,
         port=EnvVars.PORT,
@@ -1,10 +1,22 @@
 import inspect
 import typing
 
+from stests.core.cache import codec
 from stests.core.utils import encoder as _encoder
+from stests.core.utils import env
+from stests.core.utils.exceptions import InvalidEnvironmentVariable
 
 
 
+# Environment variables required by this module.
+class EnvVars:
+    # Codec applied when dispatching messages - decoding is negotiated per message by version tag.
+    CODEC = env.get_var("MQ_CODEC", "JSON")
+
+    # Size (in bytes) above which compact messages are compressed.
+    CODEC_ZLIB_THRESHOLD = env.get_var("MQ_CODEC_ZLIB_THRESHOLD", 1024, int)
+
+
 # Represents contents of a Message object as a dict.
 MessageData = typing.Dict[str, typing.Any]
 
@@ -14,19 +26,25 @@ def encode(data: MessageData) -> bytes:
 
     :param data: Message data to be dispatched over wire.
     :returns: Bytestream for dispatch.
-    
+
     """
-    return _encoder.as_json(data)
+    if EnvVars.CODEC == "COMPACT":
+        return codec.encode_compact(data, EnvVars.CODEC_ZLIB_THRESHOLD)
+
+    if EnvVars.CODEC == "JSON":
+        return _encoder.as_json(data)
+
+    raise InvalidEnvironmentVariable("MQ_CODEC", EnvVars.CODEC, codec.CODECS)
 
 
 def decode(data: bytes) -> MessageData:
     """Decodes data dispatched over wire.
-    
+
     :param data: Bytestream to be decoded.
     :returns: Message data for further processing.
 
     """
-    return _encoder.from_json(data.decode("utf-8"))
+    return codec.decode(data)
 
 
 def initialise():
@@ -1,11 +1,27 @@
+import collections
 import random
+import typing
 from uuid import uuid4
 
+from dramatiq import Broker
+from dramatiq import Message
 from dramatiq import group
 from dramatiq import pipeline
 from dramatiq import  middleware
 from dramatiq.rate_limits import Barrier
 
+from stests.core.utils import env
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Max. number of messages enqueued per broker round trip.
+    ENQUEUE_BATCH_SIZE = env.get_var("MQ_ENQUEUE_BATCH_SIZE", 1000, int)
+
+    # Granularity (in milliseconds) at which delays within a dispatch window are bucketed so as to be enqueued in batches.
+    ENQUEUE_DELAY_BUCKET_MS = env.get_var("MQ_ENQUEUE_DELAY_BUCKET_MS", 100, int)
+
 
 
 class MessageGroup(group):
@@ -64,11 +80,44 @@ class MessageGroup(group):
         else:
             children = self.children
 
+        # Map: delay -> messages.
+        batches = collections.defaultdict(list)
         for child in children:
             if isinstance(child, (group, pipeline)):
                 child.run(delay=delay)
             else:
-                delay = random.randint(0, dispatch_window) if dispatch_window else delay
-                self.broker.enqueue(child, delay=delay)
+                batches[_get_delay(delay, dispatch_window)].append(child)
+
+        for child_delay, messages in batches.items():
+            for idx in range(0, len(messages), EnvVars.ENQUEUE_BATCH_SIZE):
+                enqueue_batch(self.broker, messages[idx: idx + EnvVars.ENQUEUE_BATCH_SIZE], child_delay)
 
         return self
+
+
+def enqueue_batch(broker: Broker, messages: typing.List[Message], delay: typing.Optional[int]):
+    """Enqueues a batch of messages - brokers that do not support batching enqueue messages one at a time.
+
+    :param broker: Message broker to which messages are dispatched.
+    :param messages: Messages to be enqueued.
+    :param delay: Minimum amount of time (in milliseconds) by which messages are delayed.
+
+    """
+    enqueue = getattr(broker, "enqueue_batch", None)
+    if enqueue is not None:
+        enqueue(messages, delay=delay)
+    else:
+        for message in messages:
+            broker.enqueue(message, delay=delay)
+
+
+def _get_delay(delay: typing.Optional[int], dispatch_window: typing.Optional[int]) -> typing.Optional[int]:
+    """Returns delay of a message dispatched within a window - bucketed so that messages can be enqueued in batches.
+
+    """
+    if not dispatch_window:
+        return delay
+
+    delay = random.randint(0, dispatch_window)
+
+    return delay - delay % EnvVars.ENQUEUE_DELAY_BUCKET_MS if EnvVars.ENQUEUE_DELAY_BUCKET_MS else delay
@@ -3,14 +3,18 @@ import typing
 import dramatiq
 
 from stests.core.mq.middleware.actor_logging import get_mware as ActorLoggingMiddleware
+from stests.core.mq.middleware.context_references import get_mware as ContextReferencesMiddleware
 from stests.core.mq.middleware.group_callbacks import get_mware as GroupCallbacksMiddleware
+from stests.core.mq.middleware.queue_priorities import get_mware as QueuePrioritiesMiddleware
 
 
 
 # Middleware to inject when processing simulation related messages.
 MWARE = (
     ActorLoggingMiddleware,
+    ContextReferencesMiddleware,
     GroupCallbacksMiddleware,    
+    QueuePrioritiesMiddleware,
 )
 
 
@@ -0,0 +1,38 @@
+import dramatiq
+from dramatiq.middleware import SkipMessage
+
+from stests.core.logging import log_event
+from stests.core.orchestration import references
+from stests.core.types.orchestration import ExecutionContextReference
+from stests.events import EventType
+
+
+
+class ContextReferencesMiddleware(dramatiq.Middleware):
+    """Middleware to rehydrate execution contexts passed by reference prior to actor invocation.
+    
+    """
+    def before_process_message(self, broker, message):
+        """Called before a message is processed.
+
+        :param broker: Message broker to which message was dispatched.
+        :param message: A message being processed.
+
+        """
+        if not any(isinstance(i, ExecutionContextReference) for i in message.args):
+            return
+
+        try:
+            args = tuple(references.rehydrate(i) if isinstance(i, ExecutionContextReference) else i for i in message.args)
+        except ValueError as err:
+            log_event(EventType.CORE_ACTOR_ERROR, f"{message.actor_name} :: err={err}")
+            raise SkipMessage()
+
+        message._message = message._message.copy(args=args)
+
+
+def get_mware():
+    """Factory method invoked during broker initialisation.
+    
+    """
+    return ContextReferencesMiddleware()
@@ -0,0 +1,31 @@
+import dramatiq
+
+from stests.core.mq import queues
+
+
+
+class QueuePrioritiesMiddleware(dramatiq.Middleware):
+    """Middleware to prioritise actors by queue family so that a dispatch backlog does not starve monitoring.
+    
+    """
+    def after_declare_actor(self, broker, actor):
+        """Called after an actor has been declared.
+
+        :param broker: Message broker upon which actor was declared.
+        :param actor: An actor being declared.
+
+        """
+        # Explicitly declared priorities take precedence.
+        if actor.priority != 0:
+            return
+
+        priority = queues.get_priority(actor.queue_name)
+        if priority is not None:
+            actor.priority = priority
+
+
+def get_mware():
+    """Factory method invoked during broker initialisation.
+    
+    """
+    return QueuePrioritiesMiddleware()
@@ -0,0 +1,75 @@
+import enum
+import typing
+
+from dramatiq.common import q_name
+
+from stests.core.utils import env
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Priority of messages pulled from monitoring queues - lower values are processed first.
+    PRIORITY_MONITORING = env.get_var("MQ_PRIORITY_MONITORING", 0, int)
+
+    # Priority of messages pulled from orchestration engine queues - lower values are processed first.
+    PRIORITY_ORCHESTRATION = env.get_var("MQ_PRIORITY_ORCHESTRATION", 10, int)
+
+    # Priority of messages pulled from deploy dispatch queues - lower values are processed first.
+    PRIORITY_DISPATCH = env.get_var("MQ_PRIORITY_DISPATCH", 20, int)
+
+
+class QueueFamily(enum.Enum):
+    """Enumeration over families of queues - each family can be consumed by a dedicated worker pool.
+
+    """
+    DISPATCH = enum.auto()
+    MONITORING = enum.auto()
+    ORCHESTRATION = enum.auto()
+
+
+# Map: queue name prefix -> queue family.
+_PREFIXES = {
+    "monitoring.": QueueFamily.MONITORING,
+    "orchestration.engine.": QueueFamily.ORCHESTRATION,
+    "orchestration.generators.": QueueFamily.DISPATCH,
+}
+
+
+def get_family(queue_name: str) -> typing.Optional[QueueFamily]:
+    """Returns family to which a queue belongs.
+
+    :param queue_name: Name of a queue - delay queues resolve to the family of their canonical queue.
+
+    :returns: Queue family - None if queue is not a member of a family.
+
+    """
+    queue_name = q_name(queue_name)
+    for prefix, family in _PREFIXES.items():
+        if queue_name.startswith(prefix):
+            return family
+
+
+def get_priority(queue_name: str) -> typing.Optional[int]:
+    """Returns priority of messages pulled from a queue.
+
+    :param queue_name: Name of a queue.
+
+    :returns: Message priority - None if queue is not a member of a family.
+
+    """
+    family = get_family(queue_name)
+    if family is not None:
+        return getattr(EnvVars, f"PRIORITY_{family.name}")
+
+
+def get_queues(queue_names: typing.Iterable[str], family: QueueFamily) -> typing.List[str]:
+    """Returns canonical names of those queues that are members of a family.
+
+    :param queue_names: Names of queues, e.g. those declared by a broker.
+    :param family: Family of queues being filtered.
+
+    :returns: Sorted canonical queue names.
+
+    """
+    return sorted({q_name(i) for i in queue_names if get_family(i) == family})
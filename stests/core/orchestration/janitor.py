@@ -0,0 +1,108 @@
+import collections
+import typing
+from datetime import datetime
+
+import dramatiq
+
+from stests.core import cache
+from stests.core import factory
+from stests.core.cache.model import StorePartition
+from stests.core.types.orchestration import ExecutionAspect
+from stests.core.types.orchestration import ExecutionContext
+from stests.core.types.orchestration import ExecutionStatus
+from stests.core.types.orchestration import ExecutionSummary
+
+
+
+# Queue to which messages will be dispatched - retention must not delay run orchestration.
+_QUEUE = "orchestration.engine.janitor"
+
+
+@dramatiq.actor(queue_name=_QUEUE)
+def do_compact(ctx: ExecutionContext):
+    """Compacts a completed run into a summary record so that it's detail can subsequently be evicted.
+
+    :param ctx: Execution context information.
+
+    """
+    cache.orchestration.set_summary(factory.create_execution_summary(
+        ctx,
+        cache.orchestration.get_info(ctx, ExecutionAspect.RUN),
+        cache.orchestration.get_deploy_count(ctx, ExecutionAspect.RUN),
+        cache.orchestration.get_finalisation_stats(ctx, ExecutionAspect.RUN),
+    ))
+
+    # Cache can now be pruned - deferred until compacted so that summary is derived from unpruned detail,
+    # failed runs are not pruned so that their detail remains available for diagnosis.
+    if bool(ctx.prune_on_completion) and ctx.status == ExecutionStatus.COMPLETE:
+        # JIT import to avoid circularity.
+        from stests.core.orchestration.run import do_prune
+        do_prune.send(ctx)
+
+    # Enforce retention policy now that another run has completed.
+    if cache.retention.is_enabled():
+        do_sweep.send(ctx.network)
+
+
+@dramatiq.actor(queue_name=_QUEUE)
+def do_sweep(network: str = None):
+    """Evicts detail of compacted runs that fall outside of the cache retention policy.
+
+    :param network: Name of network whose runs are swept - all networks if unspecified.
+
+    """
+    if not cache.retention.is_enabled():
+        return
+
+    if network is None:
+        networks = [i.name for i in cache.infra.get_networks()]
+    else:
+        networks = [network]
+
+    for network in networks:
+        summaries = cache.orchestration.get_summary_list_retained(factory.create_network_id(network))
+        for summary in _get_evictable(summaries):
+            _evict(summary)
+
+
+def _evict(summary: ExecutionSummary):
+    """Evicts a compacted run's detail - the summary record is retained.
+
+    """
+    # Prune prior to marking as evicted so that a failed prune is retried by a subsequent sweep.
+    cache.orchestration.prune_on_run_eviction(summary)
+    cache.state.prune_on_run_completion(summary)
+    summary.ts_evicted = datetime.utcnow()
+    cache.orchestration.set_summary(summary)
+
+
+def _get_evictable(summaries: typing.List[ExecutionSummary]) -> typing.Iterator[ExecutionSummary]:
+    """Yields summaries (oldest first) of runs whose detail falls outside of the cache retention policy.
+
+    """
+    policy = cache.retention.EnvVars
+    retained = collections.defaultdict(list)
+    for summary in summaries:
+        retained[summary.run_type].append(summary)
+
+    # Runs completed prior to TTL.
+    if policy.RUN_TTL:
+        ts_expired = datetime.utcnow().timestamp() - policy.RUN_TTL
+        for items in retained.values():
+            while items and items[0].ts_end.timestamp() < ts_expired:
+                yield items.pop(0)
+
+    # Runs in excess of max. per run type.
+    if policy.MAX_RUNS:
+        for items in retained.values():
+            while len(items) > policy.MAX_RUNS:
+                yield items.pop(0)
+
+    # Runs in excess of memory budget - memory is re-measured after each eviction.
+    if policy.MAX_MEMORY:
+        while any(retained.values()):
+            used_memory = cache.retention.get_used_memory(StorePartition.STATE)
+            if used_memory is None or used_memory <= policy.MAX_MEMORY:
+                break
+            oldest = min((i for i in retained.values() if i), key=lambda i: i[0].ts_end)
+            yield oldest.pop(0)
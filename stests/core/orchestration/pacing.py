@@ -0,0 +1,69 @@
+import time
+import typing
+
+from stests.core import cache
+from stests.core.types.orchestration import ExecutionContext
+from stests.core.utils import env
+from stests.core.utils.exceptions import InvalidEnvironmentVariable
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Mode by which a run's deploys per second is enforced (WINDOW | TOKEN_BUCKET).
+    MODE = env.get_var("ORCHESTRATION_DISPATCH_PACING", "WINDOW")
+
+    # Max. number of deploys dispatched in a burst when pacing by token bucket.
+    BURST = env.get_var("ORCHESTRATION_DISPATCH_BURST", 1, int)
+
+
+# Pacing mode: messages are randomly delayed across a dispatch window.
+MODE_WINDOW = "WINDOW"
+
+# Pacing mode: dispatchers acquire from a token bucket shared by all workers.
+MODE_TOKEN_BUCKET = "TOKEN_BUCKET"
+
+# Set of supported pacing modes.
+MODES = {
+    MODE_TOKEN_BUCKET,
+    MODE_WINDOW,
+}
+
+
+def acquire(ctx: ExecutionContext):
+    """Blocks until a deploy may be dispatched within the constraints of a run's deploys per second.
+
+    :param ctx: Execution context information.
+
+    """
+    if not ctx.deploys_per_second or _get_mode() != MODE_TOKEN_BUCKET:
+        return
+
+    wait_ms = cache.orchestration.acquire_dispatch_token(ctx, EnvVars.BURST)
+    if wait_ms:
+        time.sleep(wait_ms / 1000)
+
+
+def get_dispatch_window_ms(ctx: ExecutionContext, deploy_count: int) -> typing.Optional[int]:
+    """Returns time window over which a batch of messages is dispatched.
+
+    :param ctx: Execution context information.
+    :param deploy_count: Number of deploys to be dispatched.
+
+    :returns: Dispatch window in milliseconds - None if messages are to be enqueued undelayed.
+
+    """
+    if not ctx.deploys_per_second or _get_mode() != MODE_WINDOW:
+        return None
+
+    return ctx.get_dispatch_window_ms(deploy_count)
+
+
+def _get_mode() -> str:
+    """Returns validated pacing mode.
+
+    """
+    if EnvVars.MODE not in MODES:
+        raise InvalidEnvironmentVariable("ORCHESTRATION_DISPATCH_PACING", EnvVars.MODE, " | ".join(sorted(MODES)))
+
+    return EnvVars.MODE
@@ -33,8 +33,7 @@ def do_phase(ctx: ExecutionContext):
     ctx.step_index = 0
 
     # Update cache.
-    cache.orchestration.set_context(ctx)
-    cache.orchestration.set_info(factory.create_execution_info(
+    cache.orchestration.set_context_and_info(ctx, factory.create_execution_info(
         ExecutionAspect.PHASE, ctx
         ))
 
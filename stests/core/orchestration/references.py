@@ -0,0 +1,118 @@
+import collections
+import threading
+import typing
+
+from stests.core import cache
+from stests.core import factory
+from stests.core.types.orchestration import ExecutionContext
+from stests.core.types.orchestration import ExecutionContextReference
+from stests.core.utils import encoder
+from stests.core.utils import env
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Flag indicating whether high fan-out messages carry a reference to (rather than a copy of) a step's execution context.
+    ENABLED = env.get_var("ORCHESTRATION_CONTEXT_BY_REFERENCE", 0, int)
+
+    # Max. number of rehydrated execution contexts held in process local cache.
+    MAX_ITEMS = env.get_var("ORCHESTRATION_CONTEXT_MAX_ITEMS", 64, int)
+
+    # Time (in seconds) for which a referenced execution context is retained - refreshed whenever a phase or step starts.
+    TTL = env.get_var("ORCHESTRATION_CONTEXT_BY_REFERENCE_TTL", 86400, int)
+
+
+class _Contexts():
+    """A process local LRU cache of rehydrated execution contexts.
+
+    """
+    def __init__(self):
+        self.items = collections.OrderedDict()
+        self.lock = threading.Lock()
+
+
+# Process local cache.
+_CONTEXTS = _Contexts()
+
+
+def get_message_arg(ctx: ExecutionContext) -> typing.Union[ExecutionContext, ExecutionContextReference]:
+    """Returns execution context argument of a high fan-out message.
+
+    :param ctx: Execution context information.
+
+    :returns: Either a reference to the execution context or the context itself.
+
+    """
+    if EnvVars.ENABLED:
+        return factory.create_execution_context_reference(ctx)
+
+    return ctx
+
+
+def get_message_args(ctx: ExecutionContext, args: tuple) -> tuple:
+    """Returns arguments of a high fan-out message.
+
+    :param ctx: Execution context information.
+    :param args: Message arguments - those that are the execution context are passed by reference.
+
+    :returns: Message arguments.
+
+    """
+    if not EnvVars.ENABLED:
+        return args
+
+    ref = factory.create_execution_context_reference(ctx)
+
+    return tuple(ref if i is ctx else i for i in args)
+
+
+def rehydrate(ref: ExecutionContextReference) -> ExecutionContext:
+    """Returns execution context to which a reference points.
+
+    Note: rehydrated contexts are shared within a process, callers must not mutate them.
+
+    :param ref: Execution context reference information.
+
+    :returns: Execution context information.
+
+    """
+    key = (ref.network, ref.run_type, ref.run_index, ref.phase_index, ref.step_index)
+    with _CONTEXTS.lock:
+        try:
+            _CONTEXTS.items.move_to_end(key)
+        except KeyError:
+            pass
+        else:
+            return _CONTEXTS.items[key]
+
+    ctx = cache.orchestration.get_context(ref.network, ref.run_index, ref.run_type)
+    if ctx is None:
+        raise ValueError(f"Execution context not found: {ref.network} :: {ref.run_type} :: {ref.run_index}")
+
+    # Run has moved on since reference was issued.
+    if (ctx.phase_index, ctx.step_index) != (ref.phase_index, ref.step_index):
+        ctx = _get_context_at_step(ctx, ref)
+
+    with _CONTEXTS.lock:
+        _CONTEXTS.items[key] = ctx
+        while len(_CONTEXTS.items) > EnvVars.MAX_ITEMS:
+            _CONTEXTS.items.popitem(last=False)
+
+    return ctx
+
+
+def _get_context_at_step(ctx: ExecutionContext, ref: ExecutionContextReference) -> ExecutionContext:
+    """Returns a copy of an execution context set to the phase/step at which a reference was issued.
+
+    """
+    # JIT import to avoid circularity.
+    from stests.core.orchestration.model import Workflow
+
+    ctx = encoder.clone(ctx)
+    ctx.phase_index = ref.phase_index
+    ctx.step_index = ref.step_index
+    step = Workflow.get_phase_step(ctx, ref.phase_index, ref.step_index)
+    ctx.step_label = None if step is None else step.label
+
+    return ctx
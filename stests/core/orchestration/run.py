@@ -4,6 +4,7 @@ from stests.core import cache
 from stests.core import factory
 from stests.core.logging import log_event
 from stests.core.orchestration import predicates
+from stests.core.orchestration.janitor import do_compact
 from stests.core.orchestration.phase import do_phase
 from stests.core.types.orchestration import ExecutionAspect
 from stests.core.types.orchestration import ExecutionContext
@@ -17,6 +18,9 @@ from stests.events import EventType
 # Queue to which messages will be dispatched.
 _QUEUE = "orchestration.engine.run"
 
+# Queue to which cache pruning messages will be dispatched - pruning must not delay run orchestration.
+_QUEUE_PRUNE = "orchestration.engine.run.prune"
+
 # Map: execution mode - > time period (in milliseconds) before next loop is executed.
 _DEFAULT_LOOP_INTERVAL_MS = {
     ExecutionMode.SEQUENTIAL: int(2e3),
@@ -43,8 +47,7 @@ def do_run(ctx: ExecutionContext):
     ctx.status = ExecutionStatus.IN_PROGRESS
 
     # Update cache.
-    cache.orchestration.set_context(ctx)
-    cache.orchestration.set_info(factory.create_execution_info(
+    cache.orchestration.set_context_and_info(ctx, factory.create_execution_info(
         ExecutionAspect.RUN, ctx
         ))
 
@@ -55,6 +58,17 @@ def do_run(ctx: ExecutionContext):
     do_phase.send(ctx)
 
 
+@dramatiq.actor(queue_name=_QUEUE_PRUNE)
+def do_prune(ctx: ExecutionContext):
+    """Prunes data cached during the course of a workflow run.
+    
+    :param ctx: Execution context information.
+    
+    """
+    cache.orchestration.prune_on_run_completion(ctx)
+    cache.state.prune_on_run_completion(ctx)
+
+
 @dramatiq.actor(queue_name=_QUEUE)
 def on_run_end(ctx: ExecutionContext):
     """Ends a workflow.
@@ -72,10 +86,8 @@ def on_run_end(ctx: ExecutionContext):
     # Locks can now be deleted.
     cache.orchestration.delete_locks(ctx)   
 
-    # Cache can now be pruned.
-    if bool(ctx.prune_on_completion):
-        cache.orchestration.prune_on_run_completion(ctx)   
-        cache.state.prune_on_run_completion(ctx)
+    # Run can now be compacted (& subsequently pruned) - deferred to a background actor.
+    do_compact.send(ctx)
 
     # Notify.
     log_event(EventType.WFLOW_RUN_END, None, ctx)
@@ -100,6 +112,9 @@ def on_run_error(ctx: ExecutionContext, err: str):
     cache.orchestration.set_context(ctx)
     cache.orchestration.set_info_update(ctx, ExecutionAspect.RUN, ExecutionStatus.ERROR)
 
+    # Run can now be compacted - deferred to a background actor.
+    do_compact.send(ctx)
+
     # Notify.
     log_event(EventType.WFLOW_RUN_ERROR, err, ctx)
 
@@ -9,7 +9,9 @@ from stests.core.logging import log_event
 from stests.core.mq.extensions import MessageGroup
 from stests.core.orchestration.model import Workflow
 from stests.core.orchestration.model import WorkflowStep
+from stests.core.orchestration import pacing
 from stests.core.orchestration import predicates
+from stests.core.orchestration import references
 from stests.core.types.infra import NodeIdentifier
 from stests.core.types.orchestration import ExecutionAspect
 from stests.core.types.orchestration import ExecutionContext
@@ -46,8 +48,9 @@ def do_step(ctx: ExecutionContext):
     ctx.step_label = step.label
 
     # Update cache.
-    cache.orchestration.set_context(ctx)
-    cache.orchestration.set_info(factory.create_execution_info(ExecutionAspect.STEP, ctx))
+    cache.orchestration.set_context_and_info(ctx, factory.create_execution_info(
+        ExecutionAspect.STEP, ctx
+        ))
 
     # Notify.
     log_event(EventType.WFLOW_STEP_START, None, ctx)
@@ -152,10 +155,10 @@ def on_step_deploy_finalized(ctx: ExecutionContext, node_id: NodeIdentifier, blo
         log_event(EventType.WFLOW_STEP_FAILURE, f"deploy verification failed: {err} :: {deploy_hash}", ctx)
         return
 
-    # Increment verified deploy counts.
+    # Increment verified deploy counts - atomic increments issue each finalized deploy a unique step index.
     _, _, deploy_index = cache.orchestration.increment_deploy_counts(ctx)
 
-    # Verify deploy batch is complete.
+    # Verify deploy batch is complete - exactly one worker is issued the final step index and so signals step end.
     try:
         step.verify_deploy_batch_is_complete(ctx, deploy_index)
     except:
@@ -277,10 +280,10 @@ def _enqueue_message_batch(ctx, step):
     # Unpack step result.
     actor, count, args_factory = step.result
 
-    # Yield args of messages to be enqueued.
+    # Yield args of messages to be enqueued - execution context is optionally passed by reference.
     def message_factory():
         for args in args_factory():
-            yield actor.message_with_options(args=args)
+            yield actor.message_with_options(args=references.get_message_args(ctx, args))
 
     # Instantiate a dramatiq group to batch message set.
     group = MessageGroup(message_factory())
@@ -288,10 +291,10 @@ def _enqueue_message_batch(ctx, step):
     # When in sync mode we can signal end of step in a completion callback. 
     # In async mode the step end signal is determined post deploy finalisation event.
     if step.is_sync:
-        group.add_completion_callback(do_step_verification.message(ctx))
+        group.add_completion_callback(do_step_verification.message(references.get_message_arg(ctx)))
 
-    # Set window of dispatch.
-    dispatch_window = None if not ctx.deploys_per_second else ctx.get_dispatch_window_ms(count)
+    # Set window of dispatch - unset when dispatchers are paced by token bucket.
+    dispatch_window = pacing.get_dispatch_window_ms(ctx, count)
 
     # Enqueue message batch.
     group.run(dispatch_window=dispatch_window)
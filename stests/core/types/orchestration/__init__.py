@@ -6,12 +6,16 @@ from stests.core.types.orchestration.identifier import ExecutionIdentifier
 from stests.core.types.orchestration.context import ExecutionContext
 from stests.core.types.orchestration.info import ExecutionInfo
 from stests.core.types.orchestration.lock import ExecutionLock
+from stests.core.types.orchestration.reference import ExecutionContextReference
+from stests.core.types.orchestration.summary import ExecutionSummary
 
 
 
 TYPE_SET = {
     ExecutionContext,
+    ExecutionContextReference,
     ExecutionIdentifier,
     ExecutionInfo,
     ExecutionLock,
+    ExecutionSummary,
 } | ENUM_SET
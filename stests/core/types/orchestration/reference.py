@@ -0,0 +1,27 @@
+import dataclasses
+
+
+
+@dataclasses.dataclass
+class ExecutionContextReference:
+    """Execution context reference information - i.e. passed over wire in place of a step's execution context.
+    
+    """
+    # Associated network.
+    network: str
+
+    # Numerical index to distinguish between multiple phases within a run.
+    phase_index: int
+
+    # Numerical index to distinguish between multiple runs of the same workflow.
+    run_index: int
+
+    # Type of workflow, e.g. WG-100 ...etc.
+    run_type: str
+
+    # Numerical index to distinguish between multiple steps within a phase.
+    step_index: int
+
+    @property
+    def label_step(self):
+        return f"P-{str(self.phase_index).zfill(2)}.S-{str(self.step_index).zfill(2)}"
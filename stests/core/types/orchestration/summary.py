@@ -0,0 +1,80 @@
+import dataclasses
+import math
+import typing
+from datetime import datetime
+
+from stests.core.types.orchestration.enums import ExecutionStatus
+
+
+
+@dataclasses.dataclass
+class ExecutionSummary:
+    """Execution summary information - i.e. a run compacted so that it's detail can be evicted from cache.
+
+    """
+    # Number of deploys dispatched during the course of the run.
+    deploy_count: int
+
+    # Finalisation latency (in seconds): maximum.
+    finalization_max: typing.Optional[float]
+
+    # Finalisation latency (in seconds): mean.
+    finalization_mean: typing.Optional[float]
+
+    # Finalisation latency (in seconds): minimum.
+    finalization_min: typing.Optional[float]
+
+    # Finalisation latency (in seconds): standard deviation.
+    finalization_stdev: typing.Optional[float]
+
+    # Number of deploys finalised during the course of the run.
+    finalized_count: int
+
+    # Associated network.
+    network: str
+
+    # Numerical index to distinguish between multiple runs.
+    run_index: int
+
+    # Index of parent run in a loop scenario.
+    run_index_parent: typing.Optional[int]
+
+    # Type of run, e.g. WG-100 ...etc.
+    run_type: str
+
+    # Final status.
+    status: ExecutionStatus
+
+    # Timeperiod: run duration (in seconds).
+    tp_duration: typing.Optional[float]
+
+    # Timestamp: run end.
+    ts_end: datetime
+
+    # Timestamp: run detail eviction.
+    ts_evicted: typing.Optional[datetime]
+
+    # Timestamp: run start.
+    ts_start: typing.Optional[datetime]
+
+    @property
+    def is_evicted(self):
+        return self.ts_evicted is not None
+
+    @property
+    def label_run_index(self):
+        return f"R-{str(self.run_index).zfill(3)}"
+
+    def set_counts(self, deploy_count: int, finalisation_stats: typing.Dict[str, float]):
+        """Sets counts & finalisation latency statistics derived from running aggregates.
+
+        """
+        self.deploy_count = deploy_count
+        self.finalized_count = int(finalisation_stats.get("count", 0))
+        if self.finalized_count:
+            self.finalization_max = finalisation_stats["max"]
+            self.finalization_mean = finalisation_stats["sum"] / self.finalized_count
+            self.finalization_min = finalisation_stats["min"]
+        if self.finalized_count > 1:
+            sum_sq_deltas = max(finalisation_stats["sum_sq"] - finalisation_stats["sum"] * self.finalization_mean, 0.0)
+            self.finalization_stdev = math.sqrt(sum_sq_deltas / (self.finalized_count - 1))
@@ -1,5 +1,6 @@
 import argparse
 import pathlib
+from datetime import datetime
 
 from stests.core.crypto import KeyAlgorithm
 from stests.core.types.infra import NetworkType
@@ -7,6 +8,10 @@ from stests.core.types.orchestration import ExecutionMode
 
 
 
+# Batch size min/max.
+BATCH_SIZE_MIN = 1
+BATCH_SIZE_MAX = 10000
+
 # Loop count min/max
 DEPLOYS_PER_SECOND_MIN = 0
 DEPLOYS_PER_SECOND_MAX = 1000
@@ -40,6 +45,13 @@ PARALLEL_COUNT_MIN = 1
 PARALLEL_COUNT_MAX = 511
 
 
+def validate_batch_size(value):
+    """Argument verifier: batch size.
+
+    """
+    return _validate_int(value, BATCH_SIZE_MIN, BATCH_SIZE_MAX, "Batch size")
+
+
 def validate_deploys_per_second(value):
     """Argument verifier: generator run index.
 
@@ -193,6 +205,16 @@ def validate_run_type(value):
     return str(value).upper()
 
 
+def validate_timestamp(value):
+    """Argument verifier: ISO 8601 timestamp.
+
+    """
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid timestamp, expecting ISO 8601 format, e.g. 2020-12-31T23:59:59: {value}")
+
+
 def validate_host(value):
     """Argument verifier: host.
 
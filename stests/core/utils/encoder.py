@@ -29,6 +29,15 @@ DCLASS_SET = set()
 # Set: primitive data types.
 PRIMITIVES = (type(None), int, str, float, bool)
 
+# Map: dataclass type -> compiled decoder.
+_DECODERS = dict()
+
+# Map: dataclass type -> compiled encoder.
+_ENCODERS = dict()
+
+# Set: exact primitive data types - values of which are passed through compiled codecs as is.
+_PRIMITIVE_TYPES = frozenset(PRIMITIVES)
+
 
 def as_dict(data: typing.Any) -> typing.Any:
     """Encodes input data in readiness for downstream processing.
@@ -94,39 +103,51 @@ def _decode_dclass(obj):
     """Decodes a registered data class instance.
     
     """
-    # Set data class type.
     dcls = DCLASS_MAP[obj['_type_key']]
+    try:
+        decoder = _DECODERS[dcls]
+    except KeyError:
+        decoder = _DECODERS[dcls] = _compile_decoder(dcls)
 
-    # Convert fields:
-    for field in dataclasses.fields(dcls):
-        if field.name not in obj:
-            continue
+    return decoder(obj)
 
-        field_value = obj[field.name]
-        if isinstance(field_value, type(None)):
-            continue 
 
+def _compile_decoder(dcls):
+    """Returns a decoder specialised to a data class - field converters are resolved once.
+
+    """
+    namespace = {
+        "_PRIMITIVE_TYPES": _PRIMITIVE_TYPES,
+        "dcls": dcls,
+        "decode": decode,
+        "_decode_dclass": _decode_dclass,
+        "fromtimestamp": datetime.datetime.fromtimestamp,
+        }
+    source = ["def _decode(obj):"]
+    for idx, field in enumerate(dataclasses.fields(dcls)):
+        source.append(f"    value = obj.get({field.name!r})")
         field_type = _get_field_type(field)
         if field_type is datetime.datetime:
-            obj[field.name] = datetime.datetime.fromtimestamp(field_value)
-
-        elif field.type in ENUM_TYPE_SET:
-            obj[field.name] = field.type[obj[field.name]]
-    
+            source.append(f"    if value is not None: obj[{field.name!r}] = fromtimestamp(value)")
+        elif field_type in ENUM_TYPE_SET:
+            namespace[f"enum_{idx}"] = field_type
+            source.append(f"    if value is not None: obj[{field.name!r}] = enum_{idx}[value]")
         elif field_type in DCLASS_SET:
-            obj[field.name] = _decode_dclass(obj[field.name])
-
+            source.append(f"    if value is not None: obj[{field.name!r}] = _decode_dclass(value)")
         else:
-            obj[field.name] = decode(obj[field.name])
+            source.append(f"    if value.__class__ not in _PRIMITIVE_TYPES: obj[{field.name!r}] = decode(value)")
 
     # Remove type key as it has served it's purpose.
-    del obj['_type_key']
+    source.append("    del obj['_type_key']")
+    source.append("    return dcls(**obj)")
+
+    exec(compile("\n".join(source), f"<decoder: {dcls.__module__}.{dcls.__name__}>", "exec"), namespace)
 
-    return dcls(**obj)
+    return namespace["_decode"]
 
 
 def _get_field_type(field):
-    """Returns a dataclass field type.
+    """Returns a dataclass field type - invoked when compiling codecs only.
     
     """
     # For optional fields the dataclass type annotation Union needs to be deconstruacture.
@@ -158,7 +179,7 @@ def encode(data: typing.Any, requires_decoding=True) -> typing.Any:
         return list(map(lambda i: encode(i, requires_decoding), data))
 
     if type(data) in DCLASS_SET:
-        return _encode_dclass(data, dataclasses.asdict(data), requires_decoding)
+        return _encode_dclass(data, requires_decoding)
 
     if type(data) in ENUM_TYPE_SET:
         return data.name
@@ -168,25 +189,83 @@ def encode(data: typing.Any, requires_decoding=True) -> typing.Any:
     return data
 
 
-def _encode_dclass(data, obj, requires_decoding):
+def _encode_dclass(data, requires_decoding):
     """Encodes a data class that has been previously registered with the encoder.
     
     """
+    dcls = type(data)
+    try:
+        encoder = _ENCODERS[dcls]
+    except KeyError:
+        encoder = _ENCODERS[dcls] = _compile_encoder(dcls)
+
+    return encoder(data, requires_decoding)
+
+
+def _compile_encoder(dcls):
+    """Returns an encoder specialised to a data class - field converters are resolved once.
+
+    Values whose type differs from that declared are encoded generically.
+
+    """
+    namespace = {
+        "_PRIMITIVE_TYPES": _PRIMITIVE_TYPES,
+        "datetime": datetime.datetime,
+        "encode_field": _encode_field,
+        }
+    source = ["def _encode(data, requires_decoding):", "    obj = dict()"]
+    for idx, field in enumerate(dataclasses.fields(dcls)):
+        source.append(f"    value = data.{field.name}")
+        field_type = _get_field_type(field)
+        if field_type is datetime.datetime:
+            source.append(f"    obj[{field.name!r}] = value.timestamp() if value.__class__ is datetime else encode_field(value, requires_decoding)")
+        elif field_type in ENUM_TYPE_SET:
+            namespace[f"enum_{idx}"] = field_type
+            source.append(f"    obj[{field.name!r}] = value.name if value.__class__ is enum_{idx} else encode_field(value, requires_decoding)")
+        else:
+            source.append(f"    obj[{field.name!r}] = value if value.__class__ in _PRIMITIVE_TYPES else encode_field(value, requires_decoding)")
+
     # Inject typekey for subsequent roundtrip.
-    if requires_decoding:
-        obj['_type_key'] = f"{data.__module__}.{data.__class__.__name__}"
+    source.append("    if requires_decoding:")
+    source.append(f"        obj['_type_key'] = {dcls.__module__ + '.' + dcls.__name__!r}")
+    source.append("    return obj")
+
+    exec(compile("\n".join(source), f"<encoder: {dcls.__module__}.{dcls.__name__}>", "exec"), namespace)
+
+    return namespace["_encode"]
 
-    # Set fields to be encoded.
-    fields = [i for i in dir(data) if i in obj and not i.startswith('_')]
 
-    # Recurse through properties that are also registered data classes.
-    fields_dcls = [i for i in fields if type(getattr(data, i)) in DCLASS_SET]
-    for field in fields_dcls:
-        _encode_dclass(getattr(data, field), obj[field], requires_decoding)
+def _encode_field(value, requires_decoding):
+    """Encodes a data class field value - nested data classes held within collections are emitted as plain dictionaries.
+
+    """
+    if type(value) in DCLASS_SET:
+        return _encode_dclass(value, requires_decoding)
 
-    # TODO: handle lists of dclasses
+    return encode(_as_plain(value), requires_decoding)
+
+
+def _as_plain(value):
+    """Returns a value whereby data classes held within collections (or unregistered data classes) are converted to dictionaries.
+
+    """
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
 
-    return encode(obj, requires_decoding)
+    if isinstance(value, (list, tuple)) and not hasattr(value, "_fields"):
+        return type(value)(_as_plain(i) for i in value)
+
+    if isinstance(value, dict):
+        return type(value)((_as_plain(k), _as_plain(v)) for k, v in value.items())
+
+    return value
+
+
+def _is_field_type(dcls, cls):
+    """Returns flag indicating whether a type is declared by one of a data class's fields.
+
+    """
+    return any(_get_field_type(i) is cls for i in dataclasses.fields(dcls))
 
 
 def register_type(cls):
@@ -204,6 +283,11 @@ def register_type(cls):
         DCLASS_MAP[f"{cls.__module__}.{cls.__name__}"] = cls
         DCLASS_SET = DCLASS_SET | { cls, }
 
+    # Codecs whose field converters may resolve to the registered type are recompiled upon next use.
+    for codecs in (_DECODERS, _ENCODERS):
+        for dcls in [i for i in codecs if _is_field_type(i, cls)]:
+            del codecs[dcls]
+
 
 def initialise():
     """Register set of non-core types that require encoding/decoding.
@@ -239,6 +323,11 @@ def initialise():
     from stests.generators.wg_211.args import Arguments
     register_type(Arguments)
 
+    # Codecs are compiled upfront so that workers need not do so upon first use.
+    for dcls in DCLASS_SET:
+        _DECODERS[dcls] = _compile_decoder(dcls)
+        _ENCODERS[dcls] = _compile_encoder(dcls)
+
     IS_INITIALISED = True
 
 
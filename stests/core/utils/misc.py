@@ -1,4 +1,5 @@
 import time
+import typing
 
 
 class Timer(object):
@@ -14,3 +15,27 @@ class Timer(object):
 
     def __exit__(self, *args, **kwargs):
         self.elapsed = time.time() - self.start
+
+
+def get_histogram_percentile(
+    counters: typing.Dict[str, float],
+    percentile: float,
+    bounds: typing.Tuple[int, ...],
+    count_key: str,
+    ) -> typing.Optional[int]:
+    """Returns upper bound of histogram bucket within which a percentile falls.
+
+    :param counters: Histogram counters, i.e. a total count plus a le_{bound} count per bucket.
+    :param percentile: Percentile to be estimated, e.g. 0.95.
+    :param bounds: Ascending upper bounds of histogram buckets.
+    :param count_key: Key of counter holding total count.
+
+    :returns: Bucket upper bound - None if percentile falls within unbounded bucket.
+
+    """
+    threshold = counters.get(count_key, 0) * percentile
+    cumulative = 0
+    for bound in bounds:
+        cumulative += counters.get(f"le_{bound}", 0)
+        if cumulative >= threshold:
+            return bound
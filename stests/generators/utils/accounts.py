@@ -4,6 +4,7 @@ import dramatiq
 from stests import chain
 from stests.core import cache
 from stests.core import factory
+from stests.core.orchestration import pacing
 from stests.core.types.chain import Account
 from stests.core.types.chain import AccountType
 from stests.core.types.chain import DeployType
@@ -75,6 +76,7 @@ def do_transfer(
         amount = get_account_balance(network, node, cp1) - chain.DEFAULT_TX_FEE
 
     # Dispatch tx -> chain.
+    pacing.acquire(ctx)
     dispatch_info = chain.DeployDispatchInfo(cp1, network, node)
     dispatch_fn = TFR_TYPE_TO_TFR_FN[DeployType[transfer_type]]
     deploy_hash, dispatch_duration, dispatch_attempts = dispatch_fn(dispatch_info, cp2, amount)
@@ -116,6 +118,7 @@ def do_transfer_fire_forget(
     cp1 = get_account(ctx, network, get_account_idx_for_network_faucet())
     dispatch_info = chain.DeployDispatchInfo(cp1, network, node)
     dispatch_fn = TFR_TYPE_TO_TFR_FN[transfer_type]
+    pacing.acquire(ctx)
     dispatch_fn(dispatch_info, cp2, amount)
 
     cache.orchestration.increment_deploy_counts(ctx, 1)
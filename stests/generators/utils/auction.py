@@ -4,6 +4,7 @@ from stests import chain
 from stests.chain.utils import DeployDispatchInfo
 from stests.core import cache
 from stests.core import factory
+from stests.core.orchestration import pacing
 from stests.core.types.chain import Account
 from stests.core.types.chain import AccountType
 from stests.core.types.chain import DeployType
@@ -60,6 +61,7 @@ def _do_delegate_action(ctx: ExecutionContext, account_index: int, amount: int,
     user = _get_account(ctx, network, account_index)
 
     # Dispatch auction deploy.
+    pacing.acquire(ctx)
     dispatch_fn = DEPLOY_TYPE_TO_FN[deploy_type]
     dispatch_info = DeployDispatchInfo(user, network, node)
     deploy_hash, dispatch_duration, dispatch_attempts = dispatch_fn(dispatch_info, validator, amount)
@@ -7,6 +7,7 @@ from stests import chain
 from stests.core import cache
 from stests.core import factory
 from stests.core.logging import log_event
+from stests.core.orchestration import references
 from stests.core.types.chain import BlockStatus
 from stests.core.types.chain import Deploy
 from stests.core.types.chain import DeployStatus
@@ -195,6 +196,9 @@ def _process_deploy_correlated(ctx: _Context):
     ctx.deploy.status = DeployStatus.ADDED
     cache.state.set_deploy(ctx.deploy)
 
+    # Update cache: run finalisation statistics.
+    cache.orchestration.update_finalisation_stats(ctx.deploy)
+
     # Update cache: account balance.
     if ctx.deploy.deploy_cost > 0:
         cache.state.decrement_account_balance_on_deploy_finalisation(ctx.deploy, ctx.deploy.deploy_cost)
@@ -211,7 +215,7 @@ def _enqueue_correlated(ctx: _Context):
         queue_name="orchestration.engine.step",
         actor_name="on_step_deploy_finalized",
         args=([
-            encoder.encode(ctx.deploy_execution_ctx),
+            encoder.encode(references.get_message_arg(ctx.deploy_execution_ctx)),
             encoder.encode(ctx.node_id),
             ctx.block_hash,
             ctx.deploy_hash
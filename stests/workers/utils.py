@@ -33,11 +33,19 @@ def _setup(output_mode: OutputMode):
     encoder.initialise()    
 
 
-def start_orchestration():
-    """Starts workload generators.
+def import_monitoring_actors():
+    """Imports chain monitoring actors, i.e. declares them upon the broker.
     
     """
-    # JIT import actors: generators.
+    import stests.monitoring.control
+    import stests.monitoring.listener
+
+
+def import_orchestration_actors():
+    """Imports workload generator & orchestration actors, i.e. declares them upon the broker.
+    
+    """
+    # Generators.
     import stests.generators.wg_100.meta
     import stests.generators.wg_110.meta
     import stests.generators.wg_200.meta
@@ -45,20 +53,35 @@ def start_orchestration():
     import stests.generators.wg_210.meta
     import stests.generators.wg_211.meta
 
-    # JIT import actors: orchestration.
+    # Orchestration.
     import stests.core.orchestration.run
     import stests.core.orchestration.phase
     import stests.core.orchestration.step
+    import stests.core.orchestration.janitor
+
+
+def start_orchestration():
+    """Starts workload generators.
+    
+    """
+    # JIT import actors.
+    import_orchestration_actors()
+
+    # Enforce cache retention policy against runs completed whilst workers were down - once per pool startup.
+    from stests.core import cache
+    from stests.core.orchestration.janitor import do_sweep
+    if cache.retention.is_enabled():
+        _, acquired = cache.orchestration.set_sweep_lock()
+        if acquired:
+            do_sweep.send()
 
 
 def start_monitoring():
     """Starts chain monitoring.
     
     """
-    # JIT import actors: monitoring.
-    import stests.monitoring.control
-    import stests.monitoring.listener
-
+    # JIT import actors.
+    import_monitoring_actors()
 
     # Start monitoring.
     from stests.monitoring.control import do_start_monitoring
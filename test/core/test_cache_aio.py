@@ -0,0 +1,87 @@
+import asyncio
+import threading
+
+import pytest
+
+from stests.core import cache
+from stests.core.cache.ops import orchestration
+from stests.core.types.orchestration import ExecutionAspect
+from test.core import utils_cache
+from test.core import utils_factory as factory
+
+
+
+# Set of in-process store types against which awaitable cache functions are exercised.
+_STORE_TYPES = ("MEMORY", "STUB")
+
+
+@pytest.mark.parametrize("store_type", _STORE_TYPES)
+def test_01(store_type):
+    """Test awaitable flavours of cache operations share the synchronous flavour's keys."""
+    async def _execute(deploy):
+        await cache.state.set_deploy.aio(deploy)
+        return await cache.state.get_deploy.aio(factory.create_execution_context(), deploy.deploy_hash)
+
+    with utils_cache.use_store(store_type):
+        deploy = factory.create_deploy()
+        assert asyncio.run(_execute(deploy)).deploy_hash == deploy.deploy_hash
+        assert cache.state.get_deploy_on_finalisation(deploy.network, deploy.deploy_hash).deploy_hash == deploy.deploy_hash
+
+
+@pytest.mark.parametrize("store_type", _STORE_TYPES)
+def test_02(store_type):
+    """Test concurrent awaitable lookups are gathered in order."""
+    async def _execute(network):
+        return await asyncio.gather(*[
+            cache.aio.orchestration.get_context(network, run_index, "WG-100")
+            for run_index in (3, 1, 4, 2)
+        ])
+
+    with utils_cache.use_store(store_type):
+        network = _set_contexts(3)
+        assert [i.run_index if i else None for i in asyncio.run(_execute(network))] == [3, 1, None, 2]
+
+
+@pytest.mark.parametrize("store_type", _STORE_TYPES)
+def test_03(store_type, monkeypatch):
+    """Test awaitable streams are asynchronously iterated."""
+    async def _execute(network_id):
+        stream = await cache.aio.orchestration.stream_context_list(network_id, "WG-100")
+        return sorted([i.run_index async for i in stream])
+
+    monkeypatch.setattr(cache.ops.utils.EnvVars, "STREAM_CHUNK_SIZE", 2)
+    with utils_cache.use_store(store_type):
+        _set_contexts(5)
+        assert asyncio.run(_execute(factory.create_network_id())) == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.parametrize("store_type", _STORE_TYPES)
+def test_04(store_type, monkeypatch):
+    """Test awaitable composite functions are run within a worker thread."""
+    threads = []
+    set_context = orchestration.set_context
+    def _set_context(ctx):
+        threads.append(threading.current_thread())
+        return set_context(ctx)
+
+    async def _execute(ctx, info):
+        await cache.aio.orchestration.set_context_and_info(ctx, info)
+
+    assert not hasattr(orchestration.set_context_and_info, "aio")
+    monkeypatch.setattr(orchestration, "set_context", _set_context)
+    with utils_cache.use_store(store_type):
+        ctx, info = factory.create_execution_context(), factory.create_execution_info()
+        asyncio.run(_execute(ctx, info))
+        assert threads and threads[0] is not threading.main_thread()
+        assert cache.orchestration.get_context(ctx.network, ctx.run_index, ctx.run_type) is not None
+        assert cache.orchestration.get_info(ctx, ExecutionAspect.RUN) is not None
+
+
+def _set_contexts(count: int) -> str:
+    """Caches contexts of a set of runs."""
+    ctx = factory.create_execution_context()
+    for run_index in range(1, count + 1):
+        ctx.run_index = run_index
+        cache.orchestration.set_context(ctx)
+
+    return ctx.network
@@ -0,0 +1,96 @@
+import pytest
+
+from stests.core import cache
+from stests.core.cache import local
+from stests.core.cache.model import StorePartition
+from stests.core.cache.ops import utils
+from stests.core.types.orchestration import ExecutionAspect
+from test.core import utils_cache
+from test.core import utils_factory as factory
+
+
+
+def test_01():
+    """Test operations return once batch is flushed - results are ordered as per enqueueing."""
+    with utils_cache.use_store():
+        ctx = factory.create_execution_context()
+        with cache.batch(StorePartition.ORCHESTRATION) as batch:
+            assert cache.orchestration.increment_deploy_count(ctx, ExecutionAspect.RUN, 2) is None
+            assert cache.orchestration.get_context(ctx.network, ctx.run_index, ctx.run_type) is None
+            assert cache.orchestration.set_context(ctx) is None
+            assert cache.orchestration.increment_deploy_count(ctx, ExecutionAspect.RUN, 3) is None
+            assert cache.orchestration.get_context(ctx.network, ctx.run_index, ctx.run_type) is None
+        count_1, context_1, key, count_2, context_2 = batch.results
+        assert (count_1, context_1, count_2) == (2, None, 5)
+        assert key.endswith("context")
+        assert context_2.run_index == ctx.run_index
+
+
+def test_02():
+    """Test operations against other partitions are not deferred."""
+    with utils_cache.use_store():
+        deploy = factory.create_deploy()
+        with cache.batch(StorePartition.ORCHESTRATION) as batch:
+            assert cache.state.set_deploy(deploy) is not None
+        assert batch.results == []
+
+
+def test_03():
+    """Test batches cannot be nested."""
+    with utils_cache.use_store():
+        with cache.batch(StorePartition.ORCHESTRATION):
+            with pytest.raises(RuntimeError):
+                with cache.batch(StorePartition.STATE):
+                    pass
+
+
+def test_04():
+    """Test queued operations are discarded when a batch exits in error."""
+    with utils_cache.use_store():
+        ctx = factory.create_execution_context()
+        with pytest.raises(ValueError):
+            with cache.batch(StorePartition.ORCHESTRATION) as batch:
+                cache.orchestration.set_context(ctx)
+                raise ValueError()
+        assert batch.results is None
+        assert cache.orchestration.get_context(ctx.network, ctx.run_index, ctx.run_type) is None
+
+
+def test_05():
+    """Test operations that cannot be pipelined are rejected."""
+    with utils_cache.use_store():
+        with cache.batch(StorePartition.ORCHESTRATION):
+            with pytest.raises(ValueError):
+                cache.orchestration.get_context_list(factory.create_network_id(), "WG-100")
+
+
+def test_06():
+    """Test process local infra reads are invalidated once a batch is flushed."""
+    with utils_cache.use_store():
+        node = factory.create_node()
+        cache.infra.set_node(node)
+        node_id = factory.create_node_id()
+        assert cache.infra.get_node(node_id).port_rest == node.port_rest
+        node.port_rest += 1
+        with cache.batch(StorePartition.INFRA):
+            cache.infra.set_node(node)
+            assert cache.infra.get_node(node_id) is None
+        assert local.get_stats()["invalidations"] >= 1
+        assert cache.infra.get_node(node_id).port_rest == node.port_rest
+
+
+def test_07():
+    """Test execution context & info are encached within a single batch."""
+    with utils_cache.use_store():
+        ctx = factory.create_execution_context()
+        info = factory.create_execution_info()
+        flush = utils.CacheBatch.flush
+        flushes = []
+        utils.CacheBatch.flush = lambda self: flushes.append(len(self.operations)) or flush(self)
+        try:
+            cache.orchestration.set_context_and_info(ctx, info)
+        finally:
+            utils.CacheBatch.flush = flush
+        assert flushes == [2]
+        assert cache.orchestration.get_context(ctx.network, ctx.run_index, ctx.run_type).run_index == ctx.run_index
+        assert cache.orchestration.get_info(ctx, ExecutionAspect.RUN) is not None
@@ -0,0 +1,48 @@
+import inspect
+
+from stests.core import factory
+from stests.core.cache import codec
+
+
+
+def test_01():
+    """Test module import."""
+    assert inspect.ismodule(codec)
+
+
+def test_02():
+    """Test round-trip over each codec."""
+    for codec_type in codec.CODECS:
+        for i in _get_test_instances():
+            assert codec.decode(codec.encode(i, codec_type)) == i
+
+
+def test_03():
+    """Test compact values are version tagged & smaller than json values."""
+    for i in _get_test_instances():
+        encoded = codec.encode_compact(i, zlib_threshold=0)
+        assert encoded[:1] == b"\x01"
+        assert len(encoded) < len(codec.encode_json(i))
+
+
+def test_04():
+    """Test compact values above threshold are compressed."""
+    for i in _get_test_instances():
+        encoded = codec.encode_compact(i, zlib_threshold=1)
+        assert encoded[:1] == b"\x02"
+        assert codec.decode(encoded) == i
+
+
+def test_05():
+    """Test untagged json values decode."""
+    for i in _get_test_instances():
+        assert codec.decode(codec.encode_json(i).decode("utf-8")) == i
+
+
+def _get_test_instances():
+    network_id = factory.create_network_id("lrt1")
+    return [
+        network_id,
+        factory.create_node_id(network_id, 1),
+        [network_id, network_id],
+    ]
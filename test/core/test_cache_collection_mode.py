@@ -0,0 +1,195 @@
+import pytest
+
+from stests.core import cache
+from stests.core import factory as core_factory
+from stests.core.cache import stores
+from stests.core.cache.model import Item
+from stests.core.cache.model import SearchKey
+from stests.core.cache.model import StoreOperation
+from stests.core.cache.model import StorePartition
+from stests.core.cache.ops import state
+from stests.core.cache.ops import utils
+from stests.core.cache.ops.utils import cache_op
+from stests.core.types.chain import AccountType
+from test.core import utils_cache
+from test.core import utils_factory as factory
+
+
+
+# Set of in-process store types against which collection hash mode is exercised.
+_STORE_TYPES = ("MEMORY", "STUB")
+
+
+@pytest.mark.parametrize("store_type", _STORE_TYPES)
+def test_01(store_type):
+    """Test state collections are stored as hashes."""
+    with utils_cache.use_store(store_type, "HASH"):
+        deploy = _set_deploy(1, 1)
+        key = state._get_deploy_key(deploy)
+        assert utils.is_hashed(StorePartition.STATE, key)
+        assert not utils.is_hashed(StorePartition.ORCHESTRATION, key)
+        with stores.get_store(StorePartition.STATE) as store:
+            assert [i for i in store.scan_iter(match="*", _type="hash") if i.endswith(b":deploy")]
+            assert not [i for i in store.scan_iter(match="*", _type="string") if b":deploy:" in i]
+
+
+@pytest.mark.parametrize("store_type", _STORE_TYPES)
+def test_02(store_type):
+    """Test state items are set, got, counted & deleted."""
+    with utils_cache.use_store(store_type, "HASH"):
+        ctx = factory.create_execution_context()
+        accounts = [_set_account(i) for i in range(1, 4)]
+        assert cache.state.get_account_by_index(ctx, 2).account_key == accounts[1].account_key
+        assert cache.state.get_account_by_index(ctx, 4) is None
+        for i in range(1, 4):
+            _set_deploy(1, i)
+        _set_deploy(2, 4)
+        assert len(cache.state.get_deploys(_NETWORK_ID, "WG-100", 1)) == 3
+        assert len(list(cache.state.stream_deploys(_NETWORK_ID, "WG-100", 1))) == 3
+        assert _get_deploy_count(1) == 3
+
+        _delete_deploys(1)
+        assert cache.state.get_deploys(_NETWORK_ID, "WG-100", 1) == []
+        assert _get_deploy_count(1) == 0
+        assert _get_deploy_count(2) == 1
+
+
+@pytest.mark.parametrize("store_type", _STORE_TYPES)
+def test_03(store_type):
+    """Test state counters are incremented & decremented."""
+    with utils_cache.use_store(store_type, "HASH"):
+        account = _set_account(1)
+        cache.state.increment_account_balance(account, 100)
+        cache.state.decrement_account_balance(account, 30)
+        assert cache.state.get_account_balance(account) == 70
+
+
+@pytest.mark.parametrize("store_type", _STORE_TYPES)
+def test_04(store_type):
+    """Test infra items are set, got & matched."""
+    with utils_cache.use_store(store_type, "HASH"):
+        network = factory.create_network()
+        cache.infra.set_network(network)
+        for index in (1, 2):
+            node = factory.create_node()
+            node.index, node.network = index, network.name
+            cache.infra.set_node(node)
+        network_id = core_factory.create_network_id(network.name)
+        assert cache.infra.get_network(network_id).name == network.name
+        assert cache.infra.get_node(core_factory.create_node_id(network_id, 2)).index == 2
+        assert sorted(i.index for i in cache.infra.get_nodes(network_id)) == [1, 2]
+
+
+@pytest.mark.parametrize("store_type", _STORE_TYPES)
+def test_05(store_type):
+    """Test batched operations are applied to collection hashes."""
+    with utils_cache.use_store(store_type, "HASH"):
+        account = _set_account(1)
+        deploy = _create_deploy(1, 1)
+        with cache.batch(StorePartition.STATE) as batch:
+            cache.state.set_deploy(deploy)
+            cache.state.increment_account_balance(account, 5)
+            cache.state.get_account_balance(account)
+        assert batch.results[0].endswith(state._get_deploy_key(deploy).key)
+        assert batch.results[1:] == [5, 5]
+        assert cache.state.get_deploy_on_finalisation(deploy.network, deploy.deploy_hash).deploy_hash == deploy.deploy_hash
+
+
+@pytest.mark.parametrize("store_type", _STORE_TYPES)
+def test_06(store_type):
+    """Test run pruning deletes a run's collection hashes & index entries only."""
+    with utils_cache.use_store(store_type, "HASH"):
+        deploy_1 = _set_deploy(1, 1)
+        deploy_2 = _set_deploy(2, 2)
+        ctx = factory.create_execution_context()
+        cache.state.prune_on_run_completion(ctx)
+        assert cache.state.get_deploys(_NETWORK_ID, "WG-100", 1) == []
+        assert cache.state.get_deploy_on_finalisation(deploy_1.network, deploy_1.deploy_hash) is None
+        assert len(cache.state.get_deploys(_NETWORK_ID, "WG-100", 2)) == 1
+        assert cache.state.get_deploy_on_finalisation(deploy_2.network, deploy_2.deploy_hash) is not None
+
+
+@pytest.mark.parametrize("store_type", _STORE_TYPES)
+@pytest.mark.parametrize("write_mode, read_mode", [("KEYS", "HASH"), ("HASH", "KEYS")])
+def test_07(store_type, write_mode, read_mode):
+    """Test index entries written in one collection mode are resolved in the other."""
+    with utils_cache.use_store(store_type, write_mode):
+        deploy = _set_deploy(1, 1)
+        utils.EnvVars.COLLECTION_MODE = read_mode
+        ctx = factory.create_execution_context()
+        assert cache.state.get_deploy(ctx, deploy.deploy_hash).deploy_hash == deploy.deploy_hash
+        assert cache.state.get_deploy_on_finalisation(deploy.network, deploy.deploy_hash).deploy_hash == deploy.deploy_hash
+
+
+@pytest.mark.parametrize("store_type", _STORE_TYPES)
+@pytest.mark.parametrize("operation", [StoreOperation.SET_ONE, StoreOperation.SET_ONE_SINGLETON])
+def test_08(store_type, operation):
+    """Test expiring items are refused rather than expiring their collection hash."""
+    with utils_cache.use_store(store_type, "HASH"):
+        deploy = _set_deploy(1, 1)
+        set_expiring = cache_op(StorePartition.STATE, operation)(_get_expiring_deploy)
+        with pytest.raises(ValueError):
+            set_expiring(_create_deploy(1, 2))
+        if operation == StoreOperation.SET_ONE:
+            with pytest.raises(ValueError):
+                with cache.batch(StorePartition.STATE):
+                    set_expiring(_create_deploy(1, 3))
+        assert [i.deploy_hash for i in cache.state.get_deploys(_NETWORK_ID, "WG-100", 1)] == [deploy.deploy_hash]
+        with stores.get_store(StorePartition.STATE) as store:
+            assert [store.ttl(i) for i in store.scan_iter(match="*", _type="hash") if i.endswith(b":deploy")] == [-1]
+
+
+# Identifier of network to which deploys are dispatched.
+_NETWORK_ID = factory.create_network_id()
+
+
+@cache_op(StorePartition.STATE, StoreOperation.DELETE_MANY)
+def _delete_deploys(run_index: int) -> SearchKey:
+    """Deletes a run's deploys."""
+    return state._get_deploys_search_key(_NETWORK_ID, "WG-100", run_index)
+
+
+@cache_op(StorePartition.STATE, StoreOperation.GET_COUNT)
+def _get_deploy_count(run_index: int) -> SearchKey:
+    """Returns count of a run's deploys."""
+    return state._get_deploys_search_key(_NETWORK_ID, "WG-100", run_index)
+
+
+def _create_deploy(run_index: int, index: int):
+    """Returns a deploy dispatched by a run."""
+    deploy = factory.create_deploy()
+    deploy.run_type, deploy.run_index = "WG-100", run_index
+    deploy.deploy_hash = f"{index:064x}"
+
+    return deploy
+
+
+def _get_expiring_deploy(deploy) -> Item:
+    """Returns a deploy cache item that expires."""
+    return Item(
+        data=deploy,
+        item_key=state._get_deploy_key(deploy),
+        expiration=60,
+    )
+
+
+def _set_account(index: int):
+    """Caches an account of a run."""
+    account = core_factory.create_account(
+        network=_NETWORK_ID.name,
+        typeof=AccountType.GENERATOR_RUN,
+        index=index,
+        run_index=1,
+        run_type="WG-100",
+    )
+    cache.state.set_account(account)
+
+    return account
+
+
+def _set_deploy(run_index: int, index: int):
+    """Caches a deploy dispatched by a run."""
+    deploy = _create_deploy(run_index, index)
+    cache.state.set_deploy(deploy)
+
+    return deploy
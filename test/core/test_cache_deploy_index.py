@@ -0,0 +1,75 @@
+from stests.core import cache
+from stests.core.cache import stores
+from stests.core.cache.model import StorePartition
+from stests.core.cache.ops import state
+from test.core import utils_cache
+from test.core import utils_factory as factory
+
+
+
+def test_01():
+    """Test deploys are resolved by hash from both run & network indexes."""
+    with utils_cache.use_store():
+        deploy = _set_deploy(1, 1)
+        ctx = factory.create_execution_context()
+        assert cache.state.get_deploy(ctx, deploy.deploy_hash).deploy_hash == deploy.deploy_hash
+        assert cache.state.get_deploy_on_finalisation(deploy.network, deploy.deploy_hash).deploy_hash == deploy.deploy_hash
+
+
+def test_02():
+    """Test unknown deploy hashes resolve to nothing."""
+    with utils_cache.use_store():
+        deploy = _set_deploy(1, 1)
+        ctx = factory.create_execution_context()
+        assert cache.state.get_deploy(ctx, f"{2:064x}") is None
+        assert cache.state.get_deploy_on_finalisation(deploy.network, f"{2:064x}") is None
+
+
+def test_03():
+    """Test run pruning deletes only that run's entries from the network index."""
+    with utils_cache.use_store():
+        deploys = [_set_deploy(1, 1), _set_deploy(1, 2), _set_deploy(2, 3)]
+        assert _get_network_index_fields(deploys[0]) == {i.deploy_hash for i in deploys}
+
+        cache.state.prune_on_run_completion(factory.create_execution_context())
+        assert _get_network_index_fields(deploys[0]) == {deploys[2].deploy_hash}
+        for deploy in deploys[0:2]:
+            assert cache.state.get_deploy_on_finalisation(deploy.network, deploy.deploy_hash) is None
+        assert cache.state.get_deploy_on_finalisation(deploys[2].network, deploys[2].deploy_hash) is not None
+
+
+def test_04():
+    """Test index entries of streamed deploys are backfilled in batches interleaved with the stream."""
+    with utils_cache.use_store():
+        deploys = [_set_deploy(1, 1), _set_deploy(2, 2)]
+        key = ":".join(state._KEY_DEPLOY_INDEX.format(network=deploys[0].network))
+        with stores.get_store(StorePartition.STATE) as store:
+            store.delete(*store.scan_iter(match=f"*:{key}"))
+        assert cache.state.get_deploy_on_finalisation(deploys[0].network, deploys[0].deploy_hash) is None
+
+        streamed = cache.state.stream_deploys_for_network(factory.create_network_id())
+        for deploy in streamed:
+            with cache.batch(StorePartition.STATE) as batch:
+                cache.state.set_deploy_index(deploy)
+            assert len(batch.results) == 1
+        assert _get_network_index_fields(deploys[0]) == {i.deploy_hash for i in deploys}
+
+
+def _get_network_index_fields(deploy) -> set:
+    """Returns deploy hashes held within a network's deploy index."""
+    key = ":".join(state._KEY_DEPLOY_INDEX.format(network=deploy.network))
+    with stores.get_store(StorePartition.STATE) as store:
+        names = [i for i in store.scan_iter(match=f"*:{key}")]
+        assert len(names) == 1
+
+        return {i.decode("utf-8") for i in store.hgetall(names[0])}
+
+
+def _set_deploy(run_index: int, index: int):
+    """Caches a deploy dispatched by a run."""
+    deploy = factory.create_deploy()
+    deploy.run_type, deploy.run_index = "WG-100", run_index
+    deploy.deploy_hash = f"{index:064x}"
+    cache.state.set_deploy(deploy)
+
+    return deploy
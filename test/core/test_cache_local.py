@@ -0,0 +1,114 @@
+import time
+import types
+
+import pytest
+
+from stests.core import cache
+from stests.core.cache import local
+from stests.core.cache import stores
+from stests.core.cache.model import StoreOperation
+from stests.core.cache.model import StorePartition
+from test.core import utils_cache
+from test.core import utils_factory as factory
+
+
+
+def test_01():
+    """Test reads are counted as hits & misses."""
+    with utils_cache.use_store():
+        assert local.get_item(StorePartition.INFRA, StoreOperation.GET_ONE, _get_key(1)) == (False, None)
+        local.set_item(StorePartition.INFRA, StoreOperation.GET_ONE, _get_key(1), "A")
+        assert local.get_item(StorePartition.INFRA, StoreOperation.GET_ONE, _get_key(1)) == (True, "A")
+        assert local.get_item(StorePartition.INFRA, StoreOperation.GET_MANY, _get_key(1)) == (False, None)
+        stats = local.get_stats()
+        assert (stats["hits"], stats["misses"], stats["items"]) == (1, 2, 1)
+
+
+def test_02(monkeypatch):
+    """Test stale reads expire."""
+    with utils_cache.use_store():
+        local.set_item(StorePartition.INFRA, StoreOperation.GET_ONE, _get_key(1), "A")
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now + local.EnvVars.TTL + 1)
+        assert local.get_item(StorePartition.INFRA, StoreOperation.GET_ONE, _get_key(1)) == (False, None)
+        stats = local.get_stats()
+        assert (stats["expirations"], stats["misses"], stats["items"]) == (1, 1, 0)
+
+
+def test_03(monkeypatch):
+    """Test least recently used reads are evicted once max. items is exceeded."""
+    monkeypatch.setattr(local.EnvVars, "MAX_ITEMS", 3)
+    with utils_cache.use_store():
+        for index in range(1, 4):
+            local.set_item(StorePartition.INFRA, StoreOperation.GET_ONE, _get_key(index), index)
+        local.get_item(StorePartition.INFRA, StoreOperation.GET_ONE, _get_key(1))
+        local.set_item(StorePartition.INFRA, StoreOperation.GET_ONE, _get_key(4), 4)
+        assert local.get_item(StorePartition.INFRA, StoreOperation.GET_ONE, _get_key(2)) == (False, None)
+        for index in (1, 3, 4):
+            assert local.get_item(StorePartition.INFRA, StoreOperation.GET_ONE, _get_key(index)) == (True, index)
+        stats = local.get_stats()
+        assert (stats["evictions"], stats["items"]) == (1, 3)
+
+
+@pytest.mark.parametrize("store_type", ("MEMORY", "STUB"))
+def test_04(store_type):
+    """Test infra reads are served locally until invalidated by a write."""
+    with utils_cache.use_store(store_type):
+        network, node = _set_network_and_node()
+        network_id, node_id = factory.create_network_id(), factory.create_node_id()
+        invalidations = local.get_stats()["invalidations"]
+        assert cache.infra.get_node(node_id).port_rest == node.port_rest
+        assert cache.infra.get_node(node_id).port_rest == node.port_rest
+        assert local.get_stats()["hits"] == 1
+
+        node.port_rest += 1
+        cache.infra.set_node(node)
+        assert cache.infra.get_node(node_id).port_rest == node.port_rest
+
+        cache.infra.get_network(network_id)
+        network.chain_name = "casper-test"
+        cache.infra.set_network(network)
+        assert cache.infra.get_network(network_id).chain_name == "casper-test"
+        assert local.get_stats()["invalidations"] == invalidations + 2
+
+
+def test_05():
+    """Test infra reads are invalidated upon notification from another process."""
+    with utils_cache.use_store("STUB"):
+        _, node = _set_network_and_node()
+        node_id = factory.create_node_id()
+        cache.infra.get_node(node_id)
+        assert local.get_stats()["items"] == 1
+        invalidations = local.get_stats()["invalidations"]
+
+        # Own notifications are ignored.
+        with stores.get_store(StorePartition.INFRA) as store:
+            store.publish(local._get_channel(StorePartition.INFRA), local._CACHE.origin)
+            store.publish(local._get_channel(StorePartition.INFRA), "another-process")
+        assert _await_invalidation(invalidations) == invalidations + 1
+        assert local.get_stats()["items"] == 0
+
+
+def _await_invalidation(invalidations: int, timeout: float = 5.0) -> int:
+    """Returns count of invalidations once another has been received or timeout expires."""
+    expiry = time.monotonic() + timeout
+    while local.get_stats()["invalidations"] == invalidations and time.monotonic() < expiry:
+        time.sleep(0.05)
+    time.sleep(0.2)
+
+    return local.get_stats()["invalidations"]
+
+
+def _get_key(index: int):
+    """Returns a cache key."""
+    return types.SimpleNamespace(key=f"key-{index}")
+
+
+def _set_network_and_node():
+    """Caches a network & one of its nodes."""
+    network = factory.create_network()
+    cache.infra.set_network(network)
+    node = factory.create_node()
+    cache.infra.set_node(node)
+
+    return network, node
@@ -0,0 +1,89 @@
+import inspect
+
+from stests.core.cache import model
+
+
+
+def test_01():
+    """Test module import."""
+    assert inspect.ismodule(model)
+
+
+def test_02():
+    """Test run scoped keys are hash tagged by run."""
+    item_key = model.ItemKey(["nw", "WG-100", "R-001", "deploy"], ["1.0", "abc"])
+    item_key.apply_key_hash_tag("state")
+    assert item_key.key == "state:{nw:WG-100:R-001}:deploy:1.0.abc"
+    assert item_key.path == "state:{nw:WG-100:R-001}:deploy"
+
+
+def test_03():
+    """Test run scoped search patterns are hash tagged by run."""
+    search_key = model.SearchKey(["nw", "WG-*", "R-*", "deploy"])
+    search_key.apply_key_hash_tag("state")
+    assert search_key.key == "state:{nw:WG-*:R-*}:deploy*"
+
+
+def test_04():
+    """Test network scoped keys are namespaced only."""
+    item_key = model.ItemKey(["nw", "node"], ["N-0001"])
+    item_key.apply_key_hash_tag("infra")
+    assert item_key.key == "infra:nw:node:N-0001"
+
+
+def test_05():
+    """Test run scoped keys are registered within a hash tagged run key set."""
+    item_key = model.ItemKey(["nw", "WG-100", "R-001", "deploy"], ["1.0", "abc"])
+    item_key.apply_key_hash_tag("state")
+    assert item_key.run_keys_key == "state:{nw:WG-100:R-001}:run-keys"
+    assert model.ItemKey(["nw", "node"], ["N-0001"]).run_keys_key is None
+
+
+def test_06():
+    """Test run prune keys match registered keys within the same slot."""
+    prune_key = model.RunPruneKey(["nw", "WG-100", "R-001"], ["nw", "WG-100", "R-001", "info", "P-"])
+    prune_key.apply_key_hash_tag("orchestration")
+    assert prune_key.key == "orchestration:{nw:WG-100:R-001}:run-keys"
+    assert prune_key.match == prune_key.scan_match == "orchestration:{nw:WG-100:R-001}:info:P-*"
+    prune_key = model.RunPruneKey(["nw", "WG-100", "R-001"])
+    prune_key.apply_key_hash_tag("orchestration")
+    assert prune_key.scan_match == "orchestration:{nw:WG-100:R-001}:*"
+
+
+def test_07():
+    """Test time range keys are unbounded by default & hash tagged by run."""
+    range_key = model.TimeRangeKey(["nw", "WG-100", "R-001", "index-deploy-time"], ts_to=100.0)
+    range_key.apply_key_hash_tag("state")
+    assert range_key.key == "state:{nw:WG-100:R-001}:index-deploy-time"
+    assert (range_key.score_min, range_key.score_max) == ("-inf", 100.0)
+
+
+def test_08():
+    """Test compiled key templates yield same keys as key paths."""
+    template = model.KeyTemplate("{network}:{run_type}:R-{run_index:03}:{collection}", collection="deploy")
+    item_key = model.ItemKey(template.format(network="nw", run_type="WG-100", run_index=1), ["abc"])
+    assert template.fields == ["network", "run_type", "run_index"]
+    assert item_key.key == model.ItemKey(["nw", "WG-100", "R-001", "deploy"], ["abc"]).key
+    assert item_key.run_keys_key == "nw:WG-100:R-001:run-keys"
+
+
+def test_09():
+    """Test compiled key templates resolve run key sets of run scoped keys only."""
+    template = model.KeyTemplate("{network}:{run_type}:{run}:{collection}", collection="info")
+    assert template.format(network="nw", run_type="WG-100", run="*").run_keys_key is None
+    assert model.KeyTemplate("{network}:index-deploy").format(network="nw").run_keys_key is None
+
+
+def test_10():
+    """Test counter shards share their counter's hash tag & each worker writes to a single shard."""
+    count_key = model.CountIncrementKey(["nw", "WG-100", "R-001", "deploy-count"], ["-"], 1, shards=4)
+    count_key.apply_key_hash_tag("orchestration")
+    assert count_key.shard_keys == [
+        "orchestration:{nw:WG-100:R-001}:deploy-count:-",
+        "orchestration:{nw:WG-100:R-001}:deploy-count:-~1",
+        "orchestration:{nw:WG-100:R-001}:deploy-count:-~2",
+        "orchestration:{nw:WG-100:R-001}:deploy-count:-~3",
+    ]
+    assert count_key.shard_key == count_key.shard_key
+    assert count_key.shard_key in count_key.shard_keys
+    assert model.ScriptKey("script", [count_key]).keys == [count_key.shard_key]
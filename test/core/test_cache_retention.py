@@ -0,0 +1,204 @@
+import inspect
+import os
+from datetime import datetime
+from datetime import timedelta
+
+from stests.core import cache
+from stests.core import factory as core_factory
+from stests.core.cache import retention
+from stests.core.cache import stores
+from stests.core.cache.model import StorePartition
+from stests.core.cache.stores import memory
+from stests.core.orchestration import janitor
+from stests.core.orchestration import run
+from stests.core.types.orchestration import ExecutionStatus
+from test.core import utils_cache
+from test.core import utils_factory as factory
+
+
+
+def test_01():
+    """Test module import."""
+    assert inspect.ismodule(retention)
+
+
+def test_02():
+    """Test collection expirations are overridden per partition & collection."""
+    assert retention.get_expiration(StorePartition.ORCHESTRATION, "test-col", 60) == 60
+    os.environ["STESTS_CACHE_RETENTION_TTL_ORCHESTRATION_TEST_COL"] = "0"
+    try:
+        assert retention.get_expiration(StorePartition.ORCHESTRATION, "test-col", 60) is None
+    finally:
+        del os.environ["STESTS_CACHE_RETENTION_TTL_ORCHESTRATION_TEST_COL"]
+
+
+def test_03():
+    """Test in-memory store reports approximate memory usage."""
+    memory.flush()
+    store = memory.get_store(StorePartition.STATE)
+    assert store.info("memory")["used_memory"] == 0
+    store.set("a", "1234")
+    store.hset("b", "c", "de")
+    assert store.info("memory")["used_memory"] == 9
+
+
+def test_04():
+    """Test run summaries derive finalisation statistics from running aggregates."""
+    summary = factory.create_execution_summary()
+    assert summary.deploy_count == 3
+    assert summary.finalized_count == 2
+    assert summary.finalization_mean == 1.5
+    assert round(summary.finalization_stdev, 6) == round(0.5 ** 0.5, 6)
+    assert not summary.is_evicted
+
+
+def test_05():
+    """Test runs completed prior to TTL are evicted oldest first per run type."""
+    with utils_cache.use_store(), _use_policy(RUN_TTL=60):
+        _set_run("WG-100", 1, age=300)
+        _set_run("WG-100", 2, age=120)
+        _set_run("WG-100", 3, age=10)
+        _set_run("WG-200", 1, age=90)
+        assert _get_evictable() == [("WG-100", 1), ("WG-100", 2), ("WG-200", 1)]
+
+
+def test_06():
+    """Test runs in excess of max. runs are evicted per run type."""
+    with utils_cache.use_store(), _use_policy(MAX_RUNS=1):
+        _set_run("WG-100", 1, age=30)
+        _set_run("WG-100", 2, age=20)
+        _set_run("WG-100", 3, age=10)
+        _set_run("WG-200", 1, age=40)
+        assert _get_evictable() == [("WG-100", 1), ("WG-100", 2)]
+
+
+def test_07():
+    """Test runs are evicted until memory falls within budget - memory is re-measured after each eviction."""
+    with utils_cache.use_store(), _use_policy(MAX_MEMORY=1):
+        _set_run("WG-100", 1, age=30)
+        run_memory = retention.get_used_memory(StorePartition.STATE)
+        _set_run("WG-100", 2, age=20)
+        _set_run("WG-100", 3, age=10)
+        budget = retention.get_used_memory(StorePartition.STATE) - run_memory // 2
+        retention.EnvVars.MAX_MEMORY = budget
+        janitor.do_sweep(_NETWORK_ID.name)
+        assert 0 < retention.get_used_memory(StorePartition.STATE) <= budget
+        assert _get_evicted() == [("WG-100", 1)]
+
+
+def test_08():
+    """Test sweep prunes evicted run detail & retains summaries."""
+    with utils_cache.use_store(), _use_policy(MAX_RUNS=1):
+        _set_run("WG-100", 1, age=20)
+        _set_run("WG-100", 2, age=10)
+        janitor.do_sweep(_NETWORK_ID.name)
+        assert _get_evicted() == [("WG-100", 1)]
+        assert cache.state.get_deploys(_NETWORK_ID, "WG-100", 1) == []
+        assert len(cache.state.get_deploys(_NETWORK_ID, "WG-100", 2)) == 1
+        assert cache.orchestration.get_summary(_NETWORK_ID, "WG-100", 1).is_evicted
+        assert [(i.run_type, i.run_index) for i in cache.orchestration.get_summary_list_retained(_NETWORK_ID)] == [("WG-100", 2)]
+
+        # Subsequent sweeps are idempotent.
+        janitor.do_sweep(_NETWORK_ID.name)
+        assert len(cache.state.get_deploys(_NETWORK_ID, "WG-100", 2)) == 1
+
+
+def test_09():
+    """Test runs whose detail fails to be pruned are retained for a subsequent sweep."""
+    def _raise(_):
+        raise ValueError()
+
+    with utils_cache.use_store(), _use_policy(MAX_RUNS=1):
+        _set_run("WG-100", 1, age=20)
+        _set_run("WG-100", 2, age=10)
+        prune_on_run_completion = cache.state.prune_on_run_completion
+        cache.state.prune_on_run_completion = _raise
+        try:
+            janitor.do_sweep(_NETWORK_ID.name)
+        except ValueError:
+            pass
+        finally:
+            cache.state.prune_on_run_completion = prune_on_run_completion
+        assert _get_evicted() == []
+        janitor.do_sweep(_NETWORK_ID.name)
+        assert _get_evicted() == [("WG-100", 1)]
+
+
+def test_10(monkeypatch):
+    """Test compacted runs are pruned upon completion only - failed runs are retained for diagnosis."""
+    pruned = []
+    monkeypatch.setattr(run.do_prune, "send", pruned.append)
+    with utils_cache.use_store():
+        for status in (ExecutionStatus.ERROR, ExecutionStatus.COMPLETE):
+            ctx = factory.create_execution_context()
+            ctx.prune_on_completion, ctx.status = True, status
+            janitor.do_compact(ctx)
+            assert cache.orchestration.get_summary(_NETWORK_ID, ctx.run_type, ctx.run_index) is not None
+    assert [i.status for i in pruned] == [ExecutionStatus.COMPLETE]
+
+
+def test_11():
+    """Test a single retention sweep is requested by concurrently starting workers."""
+    with utils_cache.use_store():
+        assert [cache.orchestration.set_sweep_lock()[1] for _ in range(3)] == [True, False, False]
+
+
+def test_12():
+    """Test runs cached prior to key set registration are pruned by scanning."""
+    with utils_cache.use_store(), _use_policy(MAX_RUNS=1):
+        _set_run("WG-100", 1, age=20)
+        _set_run("WG-100", 2, age=10)
+        with stores.get_store(StorePartition.STATE) as store:
+            run_keys = [i for i in store.scan_iter(match="*:R-001:run-keys")]
+            assert len(run_keys) == 1
+            store.delete(*run_keys)
+        janitor.do_sweep(_NETWORK_ID.name)
+        assert _get_evicted() == [("WG-100", 1)]
+        assert cache.state.get_deploys(_NETWORK_ID, "WG-100", 1) == []
+        assert len(cache.state.get_deploys(_NETWORK_ID, "WG-100", 2)) == 1
+
+
+# Identifier of network against which runs are compacted.
+_NETWORK_ID = factory.create_network_id()
+
+
+def _get_evictable():
+    """Returns (run type, run index) of runs that fall outside of retention policy."""
+    summaries = cache.orchestration.get_summary_list_retained(_NETWORK_ID)
+
+    return [(i.run_type, i.run_index) for i in janitor._get_evictable(summaries)]
+
+
+def _get_evicted():
+    """Returns (run type, run index) of runs whose detail has been evicted."""
+    summaries = cache.orchestration.get_summary_list(_NETWORK_ID)
+
+    return sorted((i.run_type, i.run_index) for i in summaries if i.is_evicted)
+
+
+def _set_run(run_type, run_index, age):
+    """Caches a deploy dispatched by a run plus summary of the run once compacted."""
+    ctx = factory.create_execution_context()
+    ctx.run_type, ctx.run_index = run_type, run_index
+    deploy = factory.create_deploy()
+    deploy.run_type, deploy.run_index = run_type, run_index
+    deploy.deploy_hash = f"{run_type}{run_index}".encode("utf-8").hex().ljust(64, "0")
+    cache.state.set_deploy(deploy)
+    summary = core_factory.create_execution_summary(ctx, None, 1, dict())
+    summary.ts_end = datetime.utcnow() - timedelta(seconds=age)
+    cache.orchestration.set_summary(summary)
+
+
+class _use_policy():
+    """Applies a retention policy for the duration of a test."""
+    def __init__(self, **policy):
+        self.policy = {"MAX_MEMORY": 0, "MAX_RUNS": 0, "RUN_TTL": 0, **policy}
+
+    def __enter__(self):
+        self.previous = {i: getattr(retention.EnvVars, i) for i in self.policy}
+        for key, value in self.policy.items():
+            setattr(retention.EnvVars, key, value)
+
+    def __exit__(self, *_):
+        for key, value in self.previous.items():
+            setattr(retention.EnvVars, key, value)
@@ -0,0 +1,67 @@
+import inspect
+import json
+
+import pytest
+
+from stests.core.cache import scripts
+from stests.core.cache import stores
+from stests.core.cache.model import StorePartition
+from test.core import utils_cache
+
+
+
+def test_01():
+    """Test module import."""
+    assert inspect.ismodule(scripts)
+
+
+@pytest.mark.parametrize("store_type", ("MEMORY", "STUB"))
+def test_02(store_type):
+    """Test counters are incremented & registered within a run's key set."""
+    with utils_cache.use_store(store_type), _get_store() as store:
+        assert scripts.execute(store, scripts.INCREMENT_COUNTS, ["a", "b", "keys"], [3]) == [3, 3]
+        assert scripts.execute(store, scripts.INCREMENT_COUNTS, ["a", "b", "keys"], [2]) == [5, 5]
+        assert store.smembers("keys") == {b"a", b"b"}
+
+
+@pytest.mark.parametrize("store_type", ("MEMORY", "STUB"))
+def test_03(store_type):
+    """Test JSON encoded execution info is updated in place & retains expiration."""
+    with utils_cache.use_store(store_type), _get_store() as store:
+        store.set("a", json.dumps({"status": "IN_PROGRESS", "ts_start": 10.0, "ts_end": None}), ex=100)
+        assert scripts.execute(store, scripts.UPDATE_INFO, ["a"], ["COMPLETE", 15.5, 0]) == 1
+        info = json.loads(store.get("a"))
+        assert (info["status"], info["ts_end"], info["tp_duration"]) == ("COMPLETE", 15.5, 5.5)
+        assert 0 < store.ttl("a") <= 100
+
+
+@pytest.mark.parametrize("store_type", ("MEMORY", "STUB"))
+def test_04(store_type):
+    """Test execution info that is either not cached or not JSON encoded is left untouched."""
+    with utils_cache.use_store(store_type), _get_store() as store:
+        store.set("a", b"\x01not-json")
+        assert scripts.execute(store, scripts.UPDATE_INFO, ["a"], ["COMPLETE", 15.5, 0]) == -1
+        assert store.get("a") == b"\x01not-json"
+        assert scripts.execute(store, scripts.UPDATE_INFO, ["b"], ["COMPLETE", 15.5, 0]) == 0
+        assert store.get("b") is None
+
+
+def test_05():
+    """Test scripts are reloaded once flushed from server script cache."""
+    with utils_cache.use_store("STUB"), _get_store() as store:
+        assert scripts.execute(store, scripts.INCREMENT_COUNTS, ["a", "keys"], [1]) == [1]
+        store.script_flush()
+        assert scripts.execute(store, scripts.INCREMENT_COUNTS, ["a", "keys"], [1]) == [2]
+
+
+def test_06():
+    """Test token bucket is drained by lua script."""
+    with utils_cache.use_store("STUB"), _get_store() as store:
+        waits = [scripts.execute(store, scripts.ACQUIRE_TOKENS, ["a", "keys"], [10, 2, 1]) for _ in range(4)]
+        assert waits[:2] == [0, 0]
+        assert 0 < waits[2] <= 100 < waits[3] <= 200
+
+
+def _get_store():
+    """Returns accessor to orchestration partition of configured store."""
+    return stores.get_store(StorePartition.ORCHESTRATION)
@@ -0,0 +1,77 @@
+import asyncio
+import inspect
+import threading
+
+from stests.core import cache
+from stests.core.cache import stats
+from stests.core.utils.misc import get_histogram_percentile
+from test.core import utils_cache
+from test.core import utils_factory as factory
+
+
+
+def test_01():
+    """Test module import."""
+    assert inspect.ismodule(stats)
+
+
+def test_02(monkeypatch):
+    """Test keys matched by a scanning operation are counted."""
+    monkeypatch.setattr(stats.EnvVars, "ENABLED", 1)
+    monkeypatch.setattr(stats, "_STATS", stats._Stats())
+    with utils_cache.use_store():
+        ctx = factory.create_execution_context()
+        for run_index in (1, 2, 3):
+            ctx.run_index = run_index
+            cache.orchestration.set_context(ctx)
+        assert len(cache.orchestration.get_context_list(factory.create_network_id(), "WG-100")) == 3
+    counters = stats.get_snapshot()[("ORCHESTRATION", "GET_MANY", "get_context_list")]
+    assert (counters["calls"], counters["keys_matched"]) == (1, 3)
+
+
+def test_03(monkeypatch):
+    """Test streamed operations are recorded once consumed - keys matched & bytes read are attributed to the stream."""
+    monkeypatch.setattr(stats.EnvVars, "ENABLED", 1)
+    monkeypatch.setattr(stats, "_STATS", stats._Stats())
+    with utils_cache.use_store():
+        for index in (1, 2, 3):
+            deploy = factory.create_deploy()
+            deploy.deploy_hash = f"{index:064x}"
+            cache.state.set_deploy(deploy)
+        stream = cache.state.stream_deploys(factory.create_network_id(), "WG-100", 1)
+        next(stream)
+        assert ("STATE", "GET_MANY_STREAM", "stream_deploys") not in stats.get_snapshot()
+        assert len(list(stream)) == 2
+    counters = stats.get_snapshot()[("STATE", "GET_MANY_STREAM", "stream_deploys")]
+    assert (counters["calls"], counters["keys_matched"]) == (1, 3)
+    assert counters["bytes_read"] > 0
+
+
+def test_04(monkeypatch):
+    """Test statistics are published from a background thread."""
+    async def _execute(ctx):
+        await cache.orchestration.get_context.aio(ctx.network, ctx.run_index, ctx.run_type)
+
+    threads = []
+    published = threading.Event()
+    def _publish():
+        threads.append(threading.current_thread())
+        published.set()
+
+    monkeypatch.setattr(stats.EnvVars, "ENABLED", 1)
+    monkeypatch.setattr(stats.EnvVars, "PUBLISH_INTERVAL", 0)
+    monkeypatch.setattr(stats, "_STATS", stats._Stats())
+    monkeypatch.setattr(stats, "publish", _publish)
+    with utils_cache.use_store():
+        asyncio.run(_execute(factory.create_execution_context()))
+        assert published.wait(5)
+    assert threads[0] is not threading.current_thread()
+
+
+def test_05():
+    """Test histogram percentiles resolve to the upper bound of the bucket within which they fall."""
+    counters = {"calls": 10, "le_1": 5, "le_5": 4, "le_inf": 1}
+    assert get_histogram_percentile(counters, 0.5, stats.LATENCY_BUCKETS, "calls") == 1
+    assert get_histogram_percentile(counters, 0.9, stats.LATENCY_BUCKETS, "calls") == 5
+    assert get_histogram_percentile(counters, 0.95, stats.LATENCY_BUCKETS, "calls") is None
+    assert get_histogram_percentile({"count": 2, "le_2": 2}, 0.99, (1, 2), "count") == 2
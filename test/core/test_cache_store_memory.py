@@ -0,0 +1,97 @@
+import asyncio
+import inspect
+
+from stests.core.cache import scripts
+from stests.core.cache.model import StorePartition
+from stests.core.cache.stores import memory
+
+
+
+def test_01():
+    """Test module import."""
+    assert inspect.ismodule(memory)
+
+
+def test_02():
+    """Test state is shared by all accessors of a partition."""
+    memory.flush()
+    with memory.get_store(StorePartition.STATE) as store:
+        store.set("a", "1")
+    assert memory.get_store(StorePartition.STATE).get("a") == b"1"
+    assert memory.get_store(StorePartition.INFRA).get("a") is None
+
+
+def test_03():
+    """Test keys expire."""
+    memory.flush()
+    store = memory.get_store(StorePartition.STATE)
+    store.set("a", "1", ex=10)
+    store.expirations[b"a"] -= 10
+    assert store.get("a") is None
+    assert store.ttl("a") == -2
+
+
+def test_04():
+    """Test pipelined commands are applied in order."""
+    memory.flush()
+    store = memory.get_store(StorePartition.STATE)
+    with store.pipeline(transaction=True) as pipe:
+        pipe.incrby("a", 2)
+        pipe.hset("b", "c", "d")
+        pipe.sadd("e", "a", "b")
+        assert pipe.execute() == [2, 1, 2]
+    assert list(store.scan_iter(match="*", _type="hash")) == [b"b"]
+
+
+def test_05():
+    """Test sorted set members are ranged by score."""
+    memory.flush()
+    store = memory.get_store(StorePartition.STATE)
+    store.zadd("a", {"x": 3.0, "y": 1.0, "z": 2.0})
+    assert store.zrangebyscore("a", "-inf", "+inf") == [b"y", b"z", b"x"]
+    assert store.zrevrangebyscore("a", 2.0, "-inf", start=0, num=1) == [b"z"]
+
+
+def test_06():
+    """Test server side scripts are natively implemented."""
+    memory.flush()
+    store = memory.get_store(StorePartition.ORCHESTRATION)
+    assert scripts.execute(store, scripts.INCREMENT_COUNTS, ["a", "b", "keys"], [3]) == [3, 3]
+    assert store.smembers("keys") == {b"a", b"b"}
+
+
+def test_07():
+    """Test asyncio accessor awaits commands & pipelines against shared state."""
+    async def _execute():
+        async with memory.get_store_async(StorePartition.STATE) as store:
+            await store.set("a", "1")
+            async with store.pipeline(transaction=True) as pipe:
+                pipe.get("a")
+                pipe.sadd("b", "c")
+                assert await pipe.execute() == [b"1", 1]
+            return [i async for i in store.scan_iter(match="*")]
+
+    memory.flush()
+    assert sorted(asyncio.run(_execute())) == [b"a", b"b"]
+    assert memory.get_store(StorePartition.STATE).get("a") == b"1"
+
+
+def test_08():
+    """Test running statistics are folded by natively implemented script."""
+    memory.flush()
+    store = memory.get_store(StorePartition.ORCHESTRATION)
+    for sample in (3.0, 1.0, 2.0):
+        counts = scripts.execute(store, scripts.UPDATE_STATS, ["a", "b", "keys"], [sample, sample * sample, "le_5"])
+    assert counts == [3, 3]
+    assert store.hgetall("a") == {b"count": b"3", b"sum": b"6.0", b"sum_sq": b"14.0", b"le_5": b"3", b"min": b"1.0", b"max": b"3.0"}
+    assert store.smembers("keys") == {b"a", b"b"}
+
+
+def test_09():
+    """Test token bucket is drained by natively implemented script."""
+    memory.flush()
+    store = memory.get_store(StorePartition.ORCHESTRATION)
+    waits = [scripts.execute(store, scripts.ACQUIRE_TOKENS, ["a", "keys"], [10, 2, 1]) for _ in range(4)]
+    assert waits[:2] == [0, 0]
+    assert 0 < waits[2] <= 100 < waits[3] <= 200
+    assert store.smembers("keys") == {b"a"}
@@ -0,0 +1,110 @@
+import inspect
+import os
+import threading
+
+import pytest
+from fakeredis import TcpFakeServer
+
+from stests.core.cache import stores
+from stests.core.cache.model import StoreOperation
+from stests.core.cache.model import StorePartition
+from stests.core.cache.ops import utils
+from stests.core.cache.stores import redis
+
+
+
+def test_01():
+    """Test module import."""
+    assert inspect.ismodule(redis)
+
+
+def test_02():
+    """Test replica accessors fall back to the primary when no replica is configured."""
+    primary = redis.get_store(StorePartition.STATE).connection_pool
+    assert redis.get_store_replica(StorePartition.STATE).connection_pool is primary
+
+
+def test_03():
+    """Test replica accessors are bound to the replica endpoint."""
+    redis.EnvVars.REPLICA_HOST = "replica"
+    try:
+        pool = redis.get_store_replica(StorePartition.STATE).connection_pool
+    finally:
+        redis.EnvVars.REPLICA_HOST = ""
+    assert pool.connection_kwargs["host"] == "replica"
+    assert pool is not redis.get_store(StorePartition.STATE).connection_pool
+
+
+def test_04():
+    """Test only reads issued from within a read-only context are replica eligible."""
+    assert not utils._is_replica_eligible(StoreOperation.GET_ONE)
+    with utils.cache_read_only():
+        assert utils._is_replica_eligible(StoreOperation.GET_ONE, StoreOperation.GET_COUNTER_ONE)
+        assert not utils._is_replica_eligible(StoreOperation.GET_ONE, StoreOperation.SET_ONE)
+        assert not utils._is_replica_eligible(StoreOperation.SET_ONE_SINGLETON)
+    assert not utils._is_replica_eligible(StoreOperation.GET_ONE)
+
+
+def test_05():
+    """Test store types without replicas serve replica reads from the primary."""
+    stores.EnvVars.TYPE, store_type = "MEMORY", stores.EnvVars.TYPE
+    try:
+        assert stores.get_store(StorePartition.STATE, replica=True) is stores.get_store(StorePartition.STATE)
+    finally:
+        stores.EnvVars.TYPE = store_type
+
+
+def test_06(registry):
+    """Test repeated store accessors of a partition share one connection pool."""
+    pool = redis.get_store(StorePartition.STATE).connection_pool
+    assert redis.get_store(StorePartition.STATE).connection_pool is pool
+    assert redis.get_store(StorePartition.INFRA).connection_pool is not pool
+    assert len(registry.pools) == 2
+
+
+def test_07(registry, monkeypatch):
+    """Test connection pools inherited from a parent process are discarded."""
+    pool = redis.get_store(StorePartition.STATE).connection_pool
+    registry.connections_opened = 1
+    pid = os.getpid()
+    monkeypatch.setattr(os, "getpid", lambda: pid + 1)
+    assert redis.get_connections_opened() == 0
+    assert redis.get_store(StorePartition.STATE).connection_pool is not pool
+    assert registry.pid == pid + 1
+
+
+def test_08(registry, server):
+    """Test sockets opened by pooled connections are counted."""
+    store = redis.get_store(StorePartition.STATE)
+    assert redis.get_connections_opened() == 0
+    store.set("key", 1)
+    store.get("key")
+    assert redis.get_connections_opened() == 1
+    connection = store.connection_pool.get_connection()
+    try:
+        store.get("key")
+    finally:
+        store.connection_pool.release(connection)
+    assert redis.get_connections_opened() == 2
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Isolates pool registry."""
+    registry = redis._PoolRegistry()
+    monkeypatch.setattr(redis, "_REGISTRY", registry)
+
+    return registry
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """Serves an in-process redis server over TCP."""
+    server = TcpFakeServer(("127.0.0.1", 0), server_type="redis")
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+    monkeypatch.setattr(redis.EnvVars, "HOST", host)
+    monkeypatch.setattr(redis.EnvVars, "PORT", port)
+    yield server
+    server.shutdown()
+    server.server_close()
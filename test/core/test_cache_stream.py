@@ -0,0 +1,113 @@
+import redis
+
+from stests.core import cache
+from stests.core.cache.ops import utils
+from stests.core.cache.stores import memory
+from test.core import utils_cache
+from test.core import utils_factory as factory
+
+
+
+# Number of items pulled per stream chunk.
+_CHUNK_SIZE = 3
+
+# Number of deploys streamed - spans several chunks, the last of which is partial.
+_DEPLOY_COUNT = 8
+
+
+def test_01(monkeypatch):
+    """Test streamed items are pulled lazily in chunks."""
+    mget_calls = []
+    monkeypatch.setattr(utils.EnvVars, "STREAM_CHUNK_SIZE", _CHUNK_SIZE)
+    monkeypatch.setattr(memory._MemoryStore, "mget", _get_mget(mget_calls))
+    with utils_cache.use_store():
+        _set_deploys()
+        stream = cache.state.stream_deploys(factory.create_network_id(), "WG-100", 1)
+        assert mget_calls == []
+        next(stream)
+        assert mget_calls == [_CHUNK_SIZE]
+        for _ in range(_CHUNK_SIZE):
+            next(stream)
+        assert mget_calls == [_CHUNK_SIZE, _CHUNK_SIZE]
+        assert len(list(stream)) == _DEPLOY_COUNT - _CHUNK_SIZE - 1
+        assert mget_calls == [_CHUNK_SIZE, _CHUNK_SIZE, _DEPLOY_COUNT % _CHUNK_SIZE]
+
+
+def test_02(monkeypatch):
+    """Test items expiring between key scan & pull are skipped."""
+    mget_calls = []
+    monkeypatch.setattr(utils.EnvVars, "STREAM_CHUNK_SIZE", _CHUNK_SIZE)
+    monkeypatch.setattr(memory._MemoryStore, "mget", _get_mget(mget_calls, expire_on_call=2))
+    with utils_cache.use_store():
+        deploys = _set_deploys()
+        streamed = list(cache.state.stream_deploys(factory.create_network_id(), "WG-100", 1))
+        assert len(streamed) == _DEPLOY_COUNT - 1
+        assert {i.deploy_hash for i in streamed} < {i.deploy_hash for i in deploys}
+
+
+def test_03(monkeypatch):
+    """Test broken pipes whilst streaming are retried - items are neither dropped nor repeated."""
+    mget_calls, scan_calls = [], []
+    monkeypatch.setattr(utils.EnvVars, "STREAM_CHUNK_SIZE", _CHUNK_SIZE)
+    monkeypatch.setattr(memory._MemoryStore, "mget", _get_mget(mget_calls, fail_on_call=2))
+    monkeypatch.setattr(memory._MemoryStore, "scan_iter", _get_scan_iter(scan_calls, fail_after=5))
+    with utils_cache.use_store():
+        deploys = _set_deploys()
+        streamed = list(cache.state.stream_deploys(factory.create_network_id(), "WG-100", 1))
+        assert sorted(i.deploy_hash for i in streamed) == sorted(i.deploy_hash for i in deploys)
+        assert len(scan_calls) == 2
+        assert len(mget_calls) == 4
+
+
+def test_04(monkeypatch):
+    """Test store accessor is held until stream is exhausted."""
+    exits = []
+    monkeypatch.setattr(memory._MemoryStore, "__exit__", lambda *args: exits.append(1))
+    with utils_cache.use_store():
+        _set_deploys()
+        exits.clear()
+        stream = cache.state.stream_deploys(factory.create_network_id(), "WG-100", 1)
+        next(stream)
+        assert exits == []
+        list(stream)
+        assert exits == [1]
+
+
+def _get_mget(calls: list, expire_on_call: int = None, fail_on_call: int = None):
+    """Returns an instrumented mget that optionally expires the first key of a chunk prior to pulling it, or fails."""
+    mget = memory._MemoryStore.mget
+    def _mget(self, keys, *args):
+        calls.append(len(keys))
+        if len(calls) == expire_on_call:
+            self.delete(keys[0])
+        if len(calls) == fail_on_call:
+            raise redis.ConnectionError()
+        return mget(self, keys, *args)
+
+    return _mget
+
+
+def _get_scan_iter(calls: list, fail_after: int):
+    """Returns an instrumented scan that fails once after yielding a number of keys."""
+    scan_iter = memory._MemoryStore.scan_iter
+    def _scan_iter(self, *args, **kwargs):
+        calls.append(1)
+        for index, key in enumerate(scan_iter(self, *args, **kwargs)):
+            if len(calls) == 1 and index == fail_after:
+                raise redis.ConnectionError()
+            yield key
+
+    return _scan_iter
+
+
+def _set_deploys():
+    """Caches a run's deploys."""
+    deploys = []
+    for index in range(1, _DEPLOY_COUNT + 1):
+        deploy = factory.create_deploy()
+        deploy.run_type, deploy.run_index = "WG-100", 1
+        deploy.deploy_hash = f"{index:064x}"
+        cache.state.set_deploy(deploy)
+        deploys.append(deploy)
+
+    return deploys
@@ -0,0 +1,58 @@
+import inspect
+
+import pytest
+
+from stests.core import factory
+from stests.core.mq import encoder
+from stests.core.utils import encoder as utils_encoder
+from stests.core.utils.exceptions import InvalidEnvironmentVariable
+
+
+
+def test_01():
+    """Test module import."""
+    assert inspect.ismodule(encoder)
+
+
+@pytest.mark.parametrize("codec_type", ("JSON", "COMPACT"))
+def test_02(codec_type, monkeypatch):
+    """Test message data round-trips via each codec."""
+    monkeypatch.setattr(encoder.EnvVars, "CODEC", codec_type)
+    message = _get_message()
+    assert encoder.decode(encoder.encode(message)) == message
+
+
+def test_03(monkeypatch):
+    """Test compact messages are compressed above threshold only."""
+    monkeypatch.setattr(encoder.EnvVars, "CODEC", "COMPACT")
+    message = _get_message()
+    monkeypatch.setattr(encoder.EnvVars, "CODEC_ZLIB_THRESHOLD", 1024 * 1024)
+    assert encoder.encode(message)[:1] == b"\x01"
+    monkeypatch.setattr(encoder.EnvVars, "CODEC_ZLIB_THRESHOLD", 1)
+    encoded = encoder.encode(message)
+    assert encoded[:1] == b"\x02"
+    assert encoder.decode(encoded) == message
+
+
+def test_04(monkeypatch):
+    """Test untagged json messages - i.e. those dispatched prior to codec negotiation - decode."""
+    monkeypatch.setattr(encoder.EnvVars, "CODEC", "COMPACT")
+    message = _get_message()
+    assert encoder.decode(utils_encoder.as_json(message)) == message
+
+
+def test_05(monkeypatch):
+    """Test unknown codecs are rejected."""
+    monkeypatch.setattr(encoder.EnvVars, "CODEC", "XML")
+    with pytest.raises(InvalidEnvironmentVariable):
+        encoder.encode(_get_message())
+
+
+def _get_message():
+    """Returns broker message data."""
+    network_id = factory.create_network_id("lrt1")
+    return {
+        "actor_name": "do_transfer",
+        "args": [network_id, 0, 1, None],
+        "options": {"group_completion_callbacks": [{"args": [network_id]}]},
+    }
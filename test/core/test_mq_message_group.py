@@ -0,0 +1,55 @@
+import inspect
+
+import dramatiq
+from dramatiq.brokers.stub import StubBroker
+
+from stests.core.mq.extensions import message_group
+
+
+
+class _BatchingBroker(StubBroker):
+    """Stub broker that records batched enqueues."""
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def enqueue_batch(self, messages, *, delay=None):
+        self.batches.append((len(messages), delay))
+        return [self.enqueue(i, delay=delay) for i in messages]
+
+
+def test_01():
+    """Test module import."""
+    assert inspect.ismodule(message_group)
+
+
+def test_02():
+    """Test delays within a dispatch window are bucketed."""
+    assert message_group._get_delay(None, None) is None
+    assert message_group._get_delay(5, 0) == 5
+    for _ in range(100):
+        delay = message_group._get_delay(None, 1000)
+        assert 0 <= delay <= 1000
+        assert delay % message_group.EnvVars.ENQUEUE_DELAY_BUCKET_MS == 0
+
+
+def test_03():
+    """Test group children are enqueued in batches by delay."""
+    broker = _BatchingBroker()
+    broker.declare_queue("q")
+    messages = [_get_message(i) for i in range(message_group.EnvVars.ENQUEUE_BATCH_SIZE * 2 + 1)]
+    message_group.MessageGroup(messages, broker=broker).run()
+    assert broker.batches == [(message_group.EnvVars.ENQUEUE_BATCH_SIZE, None), (message_group.EnvVars.ENQUEUE_BATCH_SIZE, None), (1, None)]
+    assert broker.queues["q"].qsize() == len(messages)
+
+
+def test_04():
+    """Test brokers that do not support batching enqueue messages one at a time."""
+    broker = StubBroker()
+    broker.declare_queue("q")
+    message_group.enqueue_batch(broker, [_get_message(i) for i in range(3)], 10)
+    assert broker.queues["q.DQ"].qsize() == 3
+
+
+def _get_message(index):
+    return dramatiq.Message(queue_name="q", actor_name="a", args=(index, ), kwargs={}, options={})
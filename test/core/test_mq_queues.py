@@ -0,0 +1,61 @@
+import inspect
+
+import dramatiq
+from dramatiq.brokers.stub import StubBroker
+
+from stests.core.mq import queues
+from stests.core.mq.middleware.queue_priorities import get_mware
+from stests.core.mq.queues import QueueFamily
+
+
+
+def test_01():
+    """Test module import."""
+    assert inspect.ismodule(queues)
+
+
+def test_02():
+    """Test queues (including delay queues) resolve to a family."""
+    assert queues.get_family("monitoring.events.consensus.fault") == QueueFamily.MONITORING
+    assert queues.get_family("orchestration.engine.step.DQ") == QueueFamily.ORCHESTRATION
+    assert queues.get_family("orchestration.generators.accounts") == QueueFamily.DISPATCH
+    assert queues.get_family("default") is None
+
+
+def test_03():
+    """Test monitoring queues are prioritised over dispatch queues."""
+    assert queues.get_priority("monitoring.control") < queues.get_priority("orchestration.engine.run") < queues.get_priority("orchestration.generators.auction")
+    assert queues.get_priority("default") is None
+    assert queues.get_queues(["orchestration.generators.accounts", "orchestration.generators.accounts.DQ", "orchestration.engine.step"], QueueFamily.DISPATCH) == ["orchestration.generators.accounts"]
+
+
+def test_04():
+    """Test actors are prioritised by queue family when declared."""
+    broker = StubBroker()
+    broker.add_middleware(get_mware())
+
+    @dramatiq.actor(broker=broker, queue_name="orchestration.generators.accounts")
+    def do_dispatch():
+        pass
+
+    @dramatiq.actor(broker=broker, queue_name="default", priority=5)
+    def do_other():
+        pass
+
+    @dramatiq.actor(broker=broker, queue_name="monitoring.control", priority=5)
+    def do_monitor():
+        pass
+
+    assert do_dispatch.priority == queues.EnvVars.PRIORITY_DISPATCH
+    assert do_other.priority == 5
+    assert do_monitor.priority == 5
+
+
+def test_05():
+    """Test queues of a family are resolved from declared actors."""
+    broker = StubBroker()
+    for queue_name in ("orchestration.engine.run", "orchestration.generators.accounts", "monitoring.control"):
+        dramatiq.actor(broker=broker, queue_name=queue_name, actor_name=queue_name)(lambda: None)
+
+    assert queues.get_queues(broker.get_declared_queues(), QueueFamily.ORCHESTRATION) == ["orchestration.engine.run"]
+    assert queues.get_queues(broker.get_declared_queues(), QueueFamily.DISPATCH) == ["orchestration.generators.accounts"]
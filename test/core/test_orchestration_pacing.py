@@ -0,0 +1,37 @@
+import inspect
+
+import pytest
+
+from stests.core.orchestration import pacing
+from stests.core.utils.exceptions import InvalidEnvironmentVariable
+from test.core import utils_factory as factory
+
+
+
+def test_01():
+    """Test module import."""
+    assert inspect.ismodule(pacing)
+
+
+def test_02():
+    """Test messages are delayed across a dispatch window only when pacing by window."""
+    ctx = factory.create_execution_context()
+    ctx.deploys_per_second = 10
+    assert pacing.get_dispatch_window_ms(ctx, 100) == ctx.get_dispatch_window_ms(100)
+    pacing.EnvVars.MODE = pacing.MODE_TOKEN_BUCKET
+    try:
+        assert pacing.get_dispatch_window_ms(ctx, 100) is None
+    finally:
+        pacing.EnvVars.MODE = pacing.MODE_WINDOW
+
+
+def test_03():
+    """Test unsupported pacing mode is rejected."""
+    ctx = factory.create_execution_context()
+    ctx.deploys_per_second = 10
+    pacing.EnvVars.MODE = "RANDOM"
+    try:
+        with pytest.raises(InvalidEnvironmentVariable):
+            pacing.acquire(ctx)
+    finally:
+        pacing.EnvVars.MODE = pacing.MODE_WINDOW
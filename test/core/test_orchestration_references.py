@@ -0,0 +1,55 @@
+import inspect
+
+from stests.core import cache
+from stests.core.cache import stores
+from stests.core.cache.model import StorePartition
+from stests.core.orchestration import references
+from stests.core.types.orchestration import ExecutionContextReference
+from test.core import utils_cache
+from test.core import utils_factory as factory
+
+
+
+def test_01():
+    """Test module import."""
+    assert inspect.ismodule(references)
+
+
+def test_02():
+    """Test execution context is passed by reference only when enabled."""
+    ctx = factory.create_execution_context()
+    args = (ctx, 1, 2, "TRANSFER_NATIVE")
+    assert references.get_message_args(ctx, args) is args
+    references.EnvVars.ENABLED = 1
+    try:
+        ref, *others = references.get_message_args(ctx, args)
+    finally:
+        references.EnvVars.ENABLED = 0
+    assert isinstance(ref, ExecutionContextReference)
+    assert (ref.network, ref.run_type, ref.run_index) == (ctx.network, ctx.run_type, ctx.run_index)
+    assert others == [1, 2, "TRANSFER_NATIVE"]
+
+
+def test_03():
+    """Test rehydrated execution contexts are served from process local cache."""
+    ctx = factory.create_execution_context()
+    ref = factory.create_execution_context_reference()
+    references._CONTEXTS.items[(ref.network, ref.run_type, ref.run_index, ref.phase_index, ref.step_index)] = ctx
+    try:
+        assert references.rehydrate(ref) is ctx
+    finally:
+        references._CONTEXTS.items.clear()
+
+
+def test_04():
+    """Test referenced execution contexts are retained for longer than copied contexts."""
+    ctx = factory.create_execution_context()
+    with utils_cache.use_store():
+        for enabled, ttl in ((0, cache.orchestration.EXPIRATION_COL_CONTEXT), (1, references.EnvVars.TTL)):
+            references.EnvVars.ENABLED = enabled
+            try:
+                key = cache.orchestration.set_context(ctx)
+            finally:
+                references.EnvVars.ENABLED = 0
+            with stores.get_store(StorePartition.ORCHESTRATION) as store:
+                assert ttl - 5 < store.ttl(key) <= ttl
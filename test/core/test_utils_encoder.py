@@ -1,4 +1,7 @@
+import dataclasses
+import enum
 import inspect
+import typing
 
 from stests.core.types import TYPE_SET
 from stests.core.utils import encoder
@@ -115,5 +118,39 @@ def test_12():
     assert Example in encoder.DCLASS_MAP.values()
 
 
+def test_13(monkeypatch):
+    """Test compiled codecs decode optional enum fields & are recompiled upon registration of referenced types."""
+    encoder.initialise()
+    for name in ("DCLASS_MAP", "ENUM_VALUE_MAP", "_DECODERS", "_ENCODERS"):
+        monkeypatch.setattr(encoder, name, dict(getattr(encoder, name)))
+    for name in ("DCLASS_SET", "ENUM_TYPE_SET"):
+        monkeypatch.setattr(encoder, name, getattr(encoder, name))
+    from stests.core import factory as core_factory
+    from stests.core.types.infra import Node
+    from stests.core.types.infra import NodeGroup
+    from stests.core.types.infra import NodeType
+    assert Node in encoder._ENCODERS and Node in encoder._DECODERS
+    node = core_factory.create_node(
+        group=NodeGroup.UNKNOWN,
+        host="localhost",
+        index=1,
+        network_id=core_factory.create_network_id("lrt1"),
+        port_rest=1,
+        port_rpc=2,
+        port_event=3,
+        typeof=NodeType.VALIDATOR,
+        )
+    assert encoder.decode(encoder.encode(node)).group == NodeGroup.UNKNOWN
+    Example = enum.Enum("Example", "A B")
+    ExampleHolder = dataclasses.make_dataclass("ExampleHolder", [("example", typing.Optional[Example])])
+    encoder.register_type(ExampleHolder)
+    encoder.encode(ExampleHolder(None))
+    assert ExampleHolder in encoder._ENCODERS
+    encoder.register_type(Example)
+    assert ExampleHolder not in encoder._ENCODERS
+    assert Node in encoder._ENCODERS and Node in encoder._DECODERS
+    assert encoder.decode(encoder.encode(ExampleHolder(Example.B))).example == Example.B
+
+
 def _get_test_dclass_instances():
     return [factory.get_instance(i) for i in encoder.DCLASS_SET]
\ No newline at end of file
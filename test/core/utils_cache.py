@@ -0,0 +1,42 @@
+import contextlib
+
+from stests.core.cache import local
+from stests.core.cache import stores
+from stests.core.cache.model import StorePartition
+from stests.core.cache.ops import utils
+from stests.core.cache.stores import memory
+from stests.core.cache.stores import stub
+
+
+
+@contextlib.contextmanager
+def use_store(store_type: str = "MEMORY", collection_mode: str = "KEYS"):
+    """Binds cache operations to a flushed in-process store for the duration of a test.
+
+    :param store_type: Type of in-process store - MEMORY | STUB.
+    :param collection_mode: Collection storage mode - KEYS | HASH.
+
+    """
+    previous = stores.EnvVars.TYPE, utils.EnvVars.COLLECTION_MODE
+    stores.EnvVars.TYPE, utils.EnvVars.COLLECTION_MODE = store_type, collection_mode
+    _flush()
+    try:
+        yield
+    finally:
+        stores.EnvVars.TYPE, utils.EnvVars.COLLECTION_MODE = previous
+        _flush()
+
+
+def _flush():
+    """Flushes in-process stores & process local cache, including its invalidation subscriptions.
+
+    """
+    memory.flush()
+    for partition in StorePartition:
+        stub.get_store(partition).flushall()
+    with local._CACHE.lock:
+        local._CACHE.items.clear()
+        local._CACHE.stats = local._CACHE.get_stats_zeroed()
+        for subscription in local._CACHE.subscriptions.values():
+            subscription.stop()
+        local._CACHE.subscriptions.clear()
@@ -85,8 +85,8 @@ def create_named_key() -> types.chain.NamedKey:
 
 def create_network() -> types.infra.Network:
     return factory.create_network(
-        f"{types.infra.NetworkType.LOC.name}-{str(1).zfill(2)}",
-        types.infra.NetworkType.LOC.name
+        f"{types.infra.NetworkType.LRT.name}-{str(1).zfill(2)}",
+        types.infra.NetworkType.LRT.name
     )
 
 
@@ -96,6 +96,7 @@ def create_network_id() -> types.infra.NetworkIdentifier:
 
 def create_node() -> types.infra.Node:
     return factory.create_node(
+        group=types.infra.NodeGroup.UNKNOWN,
         host="localhost",
         index=1,
         network_id=create_network_id(),
@@ -144,6 +145,12 @@ def create_execution_context() -> types.orchestration.ExecutionContext:
     )
 
 
+def create_execution_context_reference() -> types.orchestration.ExecutionContextReference:
+    return factory.create_execution_context_reference(
+        ctx=create_execution_context(),
+    )
+
+
 def create_execution_identifier() -> types.orchestration.ExecutionIdentifier:
     return factory.create_execution_id(
         network_id=create_network_id(),
@@ -170,6 +177,15 @@ def create_execution_lock() -> types.orchestration.ExecutionLock:
     )
 
 
+def create_execution_summary() -> types.orchestration.ExecutionSummary:
+    return factory.create_execution_summary(
+        ctx=create_execution_context(),
+        info=create_execution_info(),
+        deploy_count=3,
+        finalisation_stats={"count": 2, "sum": 3.0, "sum_sq": 5.0, "min": 1.0, "max": 2.0},
+    )
+
+
 def create_log_application_info() -> types.logging.ApplicationInfo:
     return types.logging.ApplicationInfo(
         system="stests",
@@ -226,9 +242,11 @@ FACTORIES: typing.Dict[typing.Type, typing.Callable] = {
 
     # Orchestration types.
     types.orchestration.ExecutionContext: create_execution_context,
+    types.orchestration.ExecutionContextReference: create_execution_context_reference,
     types.orchestration.ExecutionIdentifier: create_execution_identifier,
     types.orchestration.ExecutionInfo: create_execution_info,
     types.orchestration.ExecutionLock: create_execution_lock,
+    types.orchestration.ExecutionSummary: create_execution_summary,
 
     # Logging types.
     types.logging.LogMessage: create_log_message,